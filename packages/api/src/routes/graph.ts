@@ -1,4 +1,6 @@
-import type { FastifyPluginAsync } from "fastify";
+import type { FastifyPluginAsync, RequestPayload } from "fastify";
+import type { Transform } from "node:stream";
+import { createGunzip, createInflate } from "node:zlib";
 import { z } from "zod";
 import type { GraphService } from "../services/graph-service.js";
 
@@ -30,6 +32,11 @@ const edgeUpsertSchema = z.object({
   items: z.array(edgePayloadSchema).min(1).max(1000),
 });
 
+const requestDecoders: Record<string, () => Transform> = {
+  gzip: createGunzip,
+  deflate: createInflate,
+};
+
 const buildValidationError = (code: string, details: string[]) => ({
   error: "Bad Request",
   code,
@@ -43,6 +50,32 @@ export interface GraphRouteOptions {
 export const graphRoutes: FastifyPluginAsync<GraphRouteOptions> = async (fastify, opts) => {
   const { graphService } = opts;
 
+  // Bulk writers may compress request bodies (`Content-Encoding: gzip|deflate`). The decoded
+  // stream still counts towards Fastify's bodyLimit, which guards against decompression bombs.
+  fastify.addHook("preParsing", async (request, _reply, payload) => {
+    const encoding = request.headers["content-encoding"]?.trim().toLowerCase();
+    if (!encoding || encoding === "identity") {
+      return payload;
+    }
+
+    const createDecoder = requestDecoders[encoding];
+    if (!createDecoder) {
+      throw Object.assign(new Error(`Unsupported content-encoding: ${encoding}`), {
+        statusCode: 415,
+        code: "UNSUPPORTED_CONTENT_ENCODING",
+      });
+    }
+
+    const decoded: RequestPayload = payload.pipe(createDecoder());
+    // Fastify compares content-length against the bytes received on the wire, not decoded bytes.
+    let receivedEncodedLength = 0;
+    payload.on("data", (chunk: Buffer) => {
+      receivedEncodedLength += chunk.length;
+      decoded.receivedEncodedLength = receivedEncodedLength;
+    });
+    return decoded;
+  });
+
   fastify.post<{ Params: { orgId: string } }>("/orgs/:orgId/nodes", async (request, reply) => {
     const validation = nodeUpsertSchema.safeParse(request.body ?? {});
 
@@ -3,6 +3,7 @@ import type { FastifyInstance } from "fastify";
 import { mkdtempSync } from "node:fs";
 import { tmpdir } from "node:os";
 import { join } from "node:path";
+import { deflateSync, gzipSync } from "node:zlib";
 import { buildServer } from "../src/server";
 
 const createNodes = async (app: FastifyInstance) => {
@@ -129,4 +130,48 @@ describe("graph contract", () => {
     expect(response.statusCode).toBe(400);
     expect(response.json().code).toBe("INVALID_EDGE_UPSERT");
   });
+
+  it("accepts gzip and deflate encoded node upserts", async () => {
+    const body = JSON.stringify({
+      items: [
+        {
+          id: "node-gzip",
+          type: "workspace",
+          properties: { note: "compressed" },
+        },
+      ],
+    });
+
+    for (const [encoding, payload] of [
+      ["gzip", gzipSync(body)],
+      ["deflate", deflateSync(body)],
+    ] as const) {
+      const response = await app.inject({
+        method: "POST",
+        url: "/orgs/demo-org/nodes",
+        payload,
+        headers: {
+          "content-type": "application/json",
+          "content-encoding": encoding,
+        },
+      });
+
+      expect(response.statusCode).toBe(202);
+      expect(response.json().accepted).toBe(1);
+    }
+  });
+
+  it("rejects unsupported request encodings", async () => {
+    const response = await app.inject({
+      method: "POST",
+      url: "/orgs/demo-org/edges",
+      payload: Buffer.from("{}"),
+      headers: {
+        "content-type": "application/json",
+        "content-encoding": "br",
+      },
+    });
+
+    expect(response.statusCode).toBe(415);
+  });
 });
@@ -0,0 +1,4 @@
+"""Reproducible micro/macro benchmarks for the ingestion CLI.
+
+Run one with ``python -m metadata_cli.benchmarks.<name>``.
+"""
@@ -0,0 +1,82 @@
+"""Compare the legacy model_copy/model_dump/json.dumps path with ``BatchEncoder``.
+
+Usage: ``python -m metadata_cli.benchmarks.encoding --nodes 1000000 --batch-size 500``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Callable, Sequence
+
+from metadata_cli.models import NodeModel
+from metadata_cli.services.encoding import BatchEncoder
+
+ACTOR = "benchmark"
+JOB_ID = "bench-job"
+
+
+def build_nodes(count: int) -> list[NodeModel]:
+    return [
+        NodeModel(
+            id=f"node-{index}",
+            type="workspace",
+            properties={"name": f"node {index}", "rank": index % 97, "tags": ["a", "b"]},
+        )
+        for index in range(count)
+    ]
+
+
+def legacy_encode(batch: Sequence[NodeModel], job_id: str) -> bytes:
+    """The pre-BatchEncoder hot path: copy, default actors, dump, then json.dumps via httpx."""
+    items = []
+    for model in batch:
+        payload = model.model_copy()
+        if not payload.createdBy:
+            payload.createdBy = ACTOR
+        if not payload.updatedBy:
+            payload.updatedBy = payload.createdBy
+        items.append(payload.model_dump(by_alias=True))
+    return json.dumps({"items": items, "jobId": job_id}).encode("utf-8")
+
+
+def measure(
+    encode: Callable[[Sequence[NodeModel], str], bytes],
+    nodes: Sequence[NodeModel],
+    batch_size: int,
+) -> dict[str, float]:
+    encoded_bytes = 0
+    start = time.perf_counter()
+    for offset in range(0, len(nodes), batch_size):
+        encoded_bytes += len(encode(nodes[offset : offset + batch_size], JOB_ID))
+    duration = time.perf_counter() - start
+    return {
+        "seconds": round(duration, 3),
+        "itemsPerSecond": round(len(nodes) / duration, 1) if duration else 0.0,
+        "bytes": encoded_bytes,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    nodes = build_nodes(args.nodes)
+    before = measure(legacy_encode, nodes, args.batch_size)
+    after = measure(BatchEncoder(ACTOR).encode_batch, nodes, args.batch_size)
+    report = {
+        "nodes": args.nodes,
+        "batchSize": args.batch_size,
+        "legacy": before,
+        "batchEncoder": after,
+        "speedup": round(before["seconds"] / after["seconds"], 2) if after["seconds"] else None,
+    }
+    print(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == "__main__":
+    main()
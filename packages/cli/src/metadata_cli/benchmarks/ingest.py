@@ -0,0 +1,221 @@
+"""End-to-end ingest benchmark: synthetic dataset -> ``IngestionRunner`` -> local stub API.
+
+Usage: ``python -m metadata_cli.benchmarks.ingest --nodes 100000 --edges 300000 --format ndjson
+--stream --latency-ms 20 --output bench.json [--baseline previous.json]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import platform
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Sequence
+
+from metadata_cli.benchmarks.stub_api import StubApi, StubBehavior
+from metadata_cli.benchmarks.synthetic import (
+    FORMATS,
+    GraphSpec,
+    add_spec_arguments,
+    spec_from_args,
+    write_dataset,
+)
+from metadata_cli.config import CliSettings
+from metadata_cli.db.migrations import MigrationJobStore
+from metadata_cli.services.ingest import IngestionRunner
+from metadata_cli.utils.logging import ProgressLogger, get_peak_rss_mb
+
+ORG_ID = "bench-org"
+
+
+class RecordingLogger(ProgressLogger):
+    """Keeps per-batch latency and RSS samples instead of printing them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.latencies_ms: list[float] = []
+        self.max_rss_mb = 0.0
+
+    def info(self, message: str, **fields: Any) -> None:
+        return
+
+    def warn(self, message: str, **fields: Any) -> None:
+        return
+
+    def log_batch(self, *, duration_seconds: float, rss_mb: float, **fields: Any) -> None:
+        self.latencies_ms.append(duration_seconds * 1000)
+        self.max_rss_mb = max(self.max_rss_mb, rss_mb)
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile, computed like ``percentile`` in the API's metrics plugin."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_benchmark(
+    spec: GraphSpec,
+    behavior: StubBehavior,
+    *,
+    data_format: str = "ndjson",
+    workdir: Path,
+    cli_options: dict[str, Any] | None = None,
+    api_url: str | None = None,
+) -> dict[str, Any]:
+    """Generate the dataset, ingest it, and return the JSON report.
+
+    The target is a stub API (on the ``uds`` socket when that CLI option is set) unless
+    ``api_url`` points at a running one.
+    """
+    dataset_path = write_dataset(workdir / f"dataset.{data_format}", spec, data_format)
+    options = {"batch_size": 500, **(cli_options or {})}
+    logger = RecordingLogger()
+    with contextlib.ExitStack() as stack:
+        stub = None
+        if api_url is None:
+            transport = options.get("transport")
+            uds = transport.uds_path if transport is not None else None
+            stub = stack.enter_context(StubApi(behavior, uds=uds))
+            api_url = stub.url
+        settings = CliSettings.from_options(
+            org=ORG_ID,
+            api_url=api_url,
+            api_token=None,
+            source="benchmark",
+            job_store=workdir / "jobs.sqlite",
+            dataset_format=data_format,
+            **options,
+        )
+        job_store = MigrationJobStore(settings.job_store_path)
+        runner = IngestionRunner(settings=settings, job_store=job_store, logger=logger)
+        start = time.perf_counter()
+        try:
+            job = runner.run(dataset_path)
+        finally:
+            duration = time.perf_counter() - start
+            runner.http_client.close()
+            job_store.close()
+
+    items = job.metrics["nodesAccepted"] + job.metrics["edgesAccepted"]
+    latencies = logger.latencies_ms
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "dataset": {**spec.to_dict(), "format": data_format, "bytes": dataset_path.stat().st_size},
+        "stub": behavior.to_dict(),
+        "settings": options,
+        "results": {
+            "items": items,
+            "seconds": round(duration, 3),
+            "itemsPerSecond": round(items / duration, 1) if duration else 0.0,
+            "batches": job.metrics["batches"],
+            "retries": job.metrics.get("retries", 0),
+            "latencyMs": {
+                "p50": round(percentile(latencies, 0.5), 2),
+                "p95": round(percentile(latencies, 0.95), 2),
+                "p99": round(percentile(latencies, 0.99), 2),
+                "max": round(max(latencies, default=0.0), 2),
+            },
+            "peakRssMb": round(get_peak_rss_mb(), 2),
+            "maxSampledRssMb": round(logger.max_rss_mb, 2),
+            "stubRequests": stub.stats.requests if stub else None,
+            "stubErrors": stub.stats.errors if stub else None,
+        },
+    }
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any]) -> dict[str, float | None]:
+    """Ratios of this run to ``baseline`` (>1 means higher: good for throughput, bad otherwise)."""
+    current, previous = report["results"], baseline["results"]
+
+    def ratio(now: float, before: float) -> float | None:
+        return round(now / before, 3) if before else None
+
+    return {
+        "baselineCommit": baseline.get("commit"),
+        "itemsPerSecond": ratio(current["itemsPerSecond"], previous["itemsPerSecond"]),
+        "p95LatencyMs": ratio(current["latencyMs"]["p95"], previous["latencyMs"]["p95"]),
+        "peakRssMb": ratio(current["peakRssMb"], previous["peakRssMb"]),
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_spec_arguments(parser)
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--stream", action="store_true")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--pipeline", action="store_true")
+    parser.add_argument("--compress", choices=("gzip", "deflate"), default=None)
+    parser.add_argument("--parse-workers", type=int, default=1)
+    parser.add_argument("--adaptive-batching", action="store_true")
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--workdir", type=Path, default=None)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--baseline", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    behavior = StubBehavior(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+    )
+    cli_options = {
+        "batch_size": args.batch_size,
+        "stream": args.stream,
+        "concurrency": args.concurrency,
+        "pipeline": args.pipeline,
+        "compression": args.compress,
+        "parse_workers": args.parse_workers,
+        "adaptive_batching": args.adaptive_batching,
+        "max_retries": args.max_retries,
+        "retry_base_delay": 0.05,
+    }
+    with tempfile.TemporaryDirectory(prefix="metadata-cli-bench-") as scratch:
+        workdir = args.workdir or Path(scratch)
+        workdir.mkdir(parents=True, exist_ok=True)
+        report = run_benchmark(
+            spec_from_args(args),
+            behavior,
+            data_format=args.format,
+            workdir=workdir,
+            cli_options=cli_options,
+        )
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        report["comparison"] = compare(report, baseline)
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compare the memory held by a loaded dataset as pydantic models and as compact columns.
+
+Usage: ``python -m metadata_cli.benchmarks.memory --edges 1000000 --property-bytes 0``
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from metadata_cli.benchmarks.synthetic import (
+    FORMATS,
+    add_spec_arguments,
+    spec_from_args,
+    write_dataset,
+)
+from metadata_cli.services.ingest import DatasetLoader
+
+
+def retained(load: Callable[[Path], Any], path: Path) -> dict[str, float]:
+    """Bytes still allocated once ``load(path)`` returns, and the peak while it ran."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        dataset = load(path)
+        duration = time.perf_counter() - start
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del dataset
+    return {"seconds": round(duration, 3), "retainedBytes": current, "peakBytes": peak}
+
+
+def compare(path: Path, data_format: str) -> dict[str, Any]:
+    loader = DatasetLoader(data_format)
+    models = retained(loader.load, path)
+    compact = retained(loader.load_compact, path)
+    return {
+        "models": models,
+        "compact": compact,
+        "reduction": round(models["retainedBytes"] / max(compact["retainedBytes"], 1), 1),
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--format", dest="data_format", choices=FORMATS, default="ndjson")
+    add_spec_arguments(parser)
+    args = parser.parse_args(argv)
+
+    spec = spec_from_args(args)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_dataset(Path(tmp) / f"graph.{args.data_format}", spec)
+        report = {"spec": spec.to_dict(), "format": args.data_format}
+        report.update(compare(path, args.data_format))
+    print(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Measure CLI startup import time with ``python -X importtime``.
+
+Usage: ``python -m metadata_cli.benchmarks.startup --budget-ms 80 -- jobs list --help``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median
+from typing import Any, Sequence
+
+HEAVY_MODULES = ("httpx", "pydantic", "sqlalchemy", "rich")
+DEFAULT_BUDGET_MS = 80.0
+MARKER = "--metadata-cli-startup--"
+SRC_DIR = Path(__file__).resolve().parents[2]
+
+# Runs the CLI in-process, bracketed by markers so interpreter startup (site, encodings) is
+# left out of the measurement.
+_PROBE = """
+import sys
+sys.stderr.write({marker!r} + "\\n")
+from metadata_cli.main import app
+try:
+    app({argv!r}, prog_name="metadata-cli")
+except SystemExit:
+    pass
+sys.stderr.write({marker!r} + "\\n")
+import json
+sys.stderr.write(json.dumps(sorted(name for name in {heavy!r} if name in sys.modules)) + "\\n")
+"""
+
+
+def _parse(stderr: str) -> tuple[float, list[tuple[str, float]], list[str]]:
+    """Return total import ms, ``(module, self ms)`` for every import, and heavy modules."""
+    _, measured, tail = stderr.split(MARKER + "\n", 2)
+    total_ms = 0.0
+    modules: list[tuple[str, float]] = []
+    for line in measured.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # the header line
+        modules.append((name.strip(), int(own) / 1000))
+        # Nested imports are indented; only top-level entries add up without double counting.
+        if not name[1:].startswith(" "):
+            total_ms += int(cumulative) / 1000
+    heavy = json.loads(tail.splitlines()[0])
+    return total_ms, modules, heavy
+
+
+def measure_startup(argv: Sequence[str] = ("--help",), *, runs: int = 3) -> dict[str, Any]:
+    """Run ``metadata-cli ARGV`` ``runs`` times and report the import time of each run.
+
+    ``bestMs`` (the fastest run) is the least noisy figure to hold to a budget; it also leaves
+    out the first run, which may have had to write bytecode caches.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    # An installed package has cached bytecode; without it every run would measure compilation.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    probe = _PROBE.format(marker=MARKER, argv=list(argv), heavy=HEAVY_MODULES)
+    samples: list[float] = []
+    slowest: list[tuple[str, float]] = []
+    heavy: list[str] = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", probe],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        total, modules, heavy = _parse(completed.stderr)
+        samples.append(total)
+        slowest = sorted(modules, key=lambda entry: entry[1], reverse=True)[:10]
+    return {
+        "argv": list(argv),
+        "runs": runs,
+        "bestMs": round(min(samples), 2),
+        "medianMs": round(median(samples), 2),
+        "heavyModules": heavy,
+        "slowestImports": [{"module": name, "ms": round(ms, 2)} for name, ms in slowest],
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("cli_args", nargs="*", default=["--help"])
+    args = parser.parse_args(argv)
+    report = measure_startup(args.cli_args, runs=args.runs)
+    report["budgetMs"] = args.budget_ms
+    print(json.dumps(report, indent=2))
+    if report["bestMs"] > args.budget_ms:
+        raise SystemExit(1)
+    return report
+
+
+if __name__ == "__main__":
+    main()
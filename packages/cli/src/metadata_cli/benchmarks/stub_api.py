@@ -0,0 +1,200 @@
+"""Local stand-in for the metadata API's batch endpoints, for benchmarks.
+
+Usage: ``python -m metadata_cli.benchmarks.stub_api --port 8080 --latency-ms 20 --error-rate 0.01``
+(or ``--uds /tmp/api.sock`` to listen on a Unix domain socket)
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import random
+import re
+import socketserver
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Sequence
+
+BATCH_PATH = re.compile(r"^/orgs/[^/]+/(nodes|edges)$")
+
+
+@dataclass(slots=True)
+class StubBehavior:
+    """Latency and failure injection applied to every batch request."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    retry_after: str | None = None
+    seed: int = 7
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "latencyMs": self.latency_ms,
+            "jitterMs": self.jitter_ms,
+            "errorRate": self.error_rate,
+            "errorStatus": self.error_status,
+        }
+
+
+@dataclass(slots=True)
+class StubStats:
+    requests: int = 0
+    errors: int = 0
+    items: dict[str, int] = field(default_factory=lambda: {"nodes": 0, "edges": 0})
+    body_bytes: int = 0
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class StubApi:
+    """Threaded HTTP server answering ``POST /orgs/:org/nodes|edges`` like the real API.
+
+    Bodies are decoded (gzip/deflate) and counted, and the reply is ``202 {"accepted": n}``
+    after the configured latency, or ``behavior.error_status`` with probability ``error_rate``.
+    With ``uds`` it listens on that Unix domain socket instead of ``host:port``.
+    """
+
+    def __init__(
+        self,
+        behavior: StubBehavior | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        uds: str | Path | None = None,
+    ):
+        self.behavior = behavior or StubBehavior()
+        self.stats = StubStats()
+        self.uds = str(uds) if uds is not None else None
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.behavior.seed)
+        if self.uds is not None:
+            self._server = _UnixHTTPServer(self.uds, self._handler_class(tcp=False))
+        else:
+            self._server = ThreadingHTTPServer((host, port), self._handler_class(tcp=True))
+            self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        if self.uds is not None:
+            return "http://localhost"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubApi":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        if self.uds is not None and os.path.exists(self.uds):
+            os.unlink(self.uds)
+
+    def _decide(self) -> tuple[float, bool]:
+        behavior = self.behavior
+        with self._lock:
+            delay = behavior.latency_ms + self._rng.uniform(0, behavior.jitter_ms)
+            fail = self._rng.random() < behavior.error_rate
+        return delay / 1000, fail
+
+    def _record(self, resource: str, items: int, body_bytes: int, failed: bool) -> None:
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.body_bytes += body_bytes
+            if failed:
+                self.stats.errors += 1
+            else:
+                self.stats.items[resource] += items
+
+    def _handler_class(self, *, tcp: bool) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; without TCP_NODELAY every reply
+            # waits on the client's delayed ACK (~40 ms). Unix sockets have no such option.
+            disable_nagle_algorithm = tcp
+
+            def do_POST(self) -> None:  # noqa: N802 - http.server naming
+                match = BATCH_PATH.match(self.path)
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if match is None:
+                    self._reply(404, {"error": "not found"})
+                    return
+                encoding = (self.headers.get("Content-Encoding") or "identity").lower()
+                if encoding == "gzip":
+                    body = gzip.decompress(body)
+                elif encoding == "deflate":
+                    body = zlib.decompress(body)
+                items = len(json.loads(body)["items"])
+                delay, fail = stub._decide()
+                if delay:
+                    time.sleep(delay)
+                stub._record(match.group(1), items, len(body), fail)
+                if fail:
+                    headers = {}
+                    if stub.behavior.retry_after is not None:
+                        headers["Retry-After"] = stub.behavior.retry_after
+                    self._reply(stub.behavior.error_status, {"error": "injected"}, headers)
+                else:
+                    self._reply(202, {"accepted": items})
+
+            def _reply(
+                self, status: int, payload: dict[str, Any], headers: dict[str, str] | None = None
+            ) -> None:
+                encoded = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def log_message(self, format: str, *args) -> None:
+                return
+
+        return Handler
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--uds", default=None, help="Listen on this Unix socket instead.")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    args = parser.parse_args(argv)
+    behavior = StubBehavior(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+    )
+    with StubApi(behavior, host=args.host, port=args.port, uds=args.uds) as stub:
+        print(f"stub API listening on {stub.uds or stub.url}", flush=True)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
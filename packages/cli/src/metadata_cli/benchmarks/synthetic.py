@@ -0,0 +1,196 @@
+"""Write synthetic graph datasets for benchmarks.
+
+Usage: ``python -m metadata_cli.benchmarks.synthetic out.ndjson --nodes 100000 --edges 300000``
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import random
+import string
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+DEGREE_DISTRIBUTIONS = ("uniform", "powerlaw", "local")
+# ``local`` edges connect nodes within this fraction of the node count of each other.
+LOCAL_WINDOW = 0.01
+FORMATS = ("json", "ndjson", "csv")
+SAMPLE_CHUNK = 10_000
+
+
+@dataclass(slots=True)
+class GraphSpec:
+    """Shape of a synthetic graph; the same spec and seed always produce the same file."""
+
+    nodes: int = 10_000
+    edges: int = 30_000
+    degree: str = "powerlaw"
+    alpha: float = 1.2
+    property_bytes: int = 64
+    seed: int = 42
+
+    def __post_init__(self) -> None:
+        if self.nodes <= 0 or self.edges < 0:
+            raise ValueError("A synthetic graph needs nodes > 0 and edges >= 0")
+        if self.degree not in DEGREE_DISTRIBUTIONS:
+            choices = ", ".join(DEGREE_DISTRIBUTIONS)
+            raise ValueError(f"Degree distribution must be one of {choices}")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "nodes": self.nodes,
+            "edges": self.edges,
+            "degree": self.degree,
+            "alpha": self.alpha,
+            "propertyBytes": self.property_bytes,
+            "seed": self.seed,
+        }
+
+
+class GraphGenerator:
+    """Yields node and edge payloads for a ``GraphSpec``.
+
+    ``powerlaw`` picks edge endpoints with probability proportional to ``rank ** -alpha``, so a
+    few hub nodes collect most edges; ``uniform`` picks every node with equal probability.
+    ``local`` walks the node list alongside the edge list and links nodes close to each other,
+    like a dataset exported in ID order.
+    Property padding is sliced from one random pool instead of generating a string per record.
+    """
+
+    def __init__(self, spec: GraphSpec):
+        self.spec = spec
+        self._rng = random.Random(spec.seed)
+        pool_size = max(4096, spec.property_bytes * 4)
+        self._pool = "".join(self._rng.choices(string.ascii_letters + string.digits, k=pool_size))
+
+    def _padding(self) -> str:
+        size = self.spec.property_bytes
+        start = self._rng.randrange(len(self._pool) - size + 1)
+        return self._pool[start : start + size]
+
+    def nodes(self) -> Iterator[dict[str, Any]]:
+        for index in range(self.spec.nodes):
+            yield {
+                "id": f"node-{index}",
+                "type": "workspace" if index % 10 else "project",
+                "properties": {
+                    "name": f"node {index}",
+                    "rank": index % 97,
+                    "blob": self._padding(),
+                },
+            }
+
+    def edges(self) -> Iterator[dict[str, Any]]:
+        spec = self.spec
+        population = range(spec.nodes)
+        cum_weights: Sequence[float] | None = None
+        if spec.degree == "powerlaw":
+            cum_weights = list(accumulate((rank + 1) ** -spec.alpha for rank in population))
+        emitted = 0
+        while emitted < spec.edges:
+            count = min(SAMPLE_CHUNK, spec.edges - emitted)
+            if spec.degree == "local":
+                window = max(1, int(spec.nodes * LOCAL_WINDOW))
+                sources = [
+                    (emitted + offset) * spec.nodes // spec.edges for offset in range(count)
+                ]
+                targets = [
+                    min(spec.nodes - 1, max(0, source + self._rng.randint(-window, window)))
+                    for source in sources
+                ]
+            elif cum_weights is None:
+                sources = [self._rng.randrange(spec.nodes) for _ in range(count)]
+                targets = [self._rng.randrange(spec.nodes) for _ in range(count)]
+            else:
+                sources = self._rng.choices(population, cum_weights=cum_weights, k=count)
+                targets = self._rng.choices(population, cum_weights=cum_weights, k=count)
+            for source, target in zip(sources, targets):
+                yield {
+                    "id": f"edge-{emitted}",
+                    "sourceId": f"node-{source}",
+                    "targetId": f"node-{target}",
+                    "type": "link",
+                    "properties": {"weight": emitted % 13, "blob": self._padding()},
+                }
+                emitted += 1
+
+
+def write_dataset(path: Path, spec: GraphSpec, data_format: str | None = None) -> Path:
+    """Stream a synthetic dataset to ``path``; the format defaults to the file suffix."""
+    data_format = data_format or path.suffix.lstrip(".")
+    if data_format not in FORMATS:
+        raise ValueError(f"Dataset format must be one of {', '.join(FORMATS)}")
+    generator = GraphGenerator(spec)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        if data_format == "json":
+            # Written piecewise so generating large datasets never holds them in memory.
+            for section, records in (("nodes", generator.nodes()), ("edges", generator.edges())):
+                handle.write('{"nodes":[' if section == "nodes" else '],"edges":[')
+                for index, record in enumerate(records):
+                    handle.write(("," if index else "") + encode(record))
+            handle.write("]}")
+        elif data_format == "ndjson":
+            for record in generator.nodes():
+                handle.write(encode({"nodes": [record]}) + "\n")
+            for record in generator.edges():
+                handle.write(encode({"edges": [record]}) + "\n")
+        else:
+            writer = csv.writer(handle)
+            writer.writerow(["id", "type", "properties", "sourceId", "targetId"])
+            for record in generator.nodes():
+                properties = encode(record["properties"])
+                writer.writerow([record["id"], record["type"], properties, "", ""])
+            for record in generator.edges():
+                writer.writerow(
+                    [
+                        record["id"],
+                        record["type"],
+                        encode(record["properties"]),
+                        record["sourceId"],
+                        record["targetId"],
+                    ]
+                )
+    return path
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = GraphSpec()
+    parser.add_argument("--nodes", type=int, default=defaults.nodes)
+    parser.add_argument("--edges", type=int, default=defaults.edges)
+    parser.add_argument("--degree", choices=DEGREE_DISTRIBUTIONS, default=defaults.degree)
+    parser.add_argument("--alpha", type=float, default=defaults.alpha)
+    parser.add_argument("--property-bytes", type=int, default=defaults.property_bytes)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def spec_from_args(args: argparse.Namespace) -> GraphSpec:
+    return GraphSpec(
+        nodes=args.nodes,
+        edges=args.edges,
+        degree=args.degree,
+        alpha=args.alpha,
+        property_bytes=args.property_bytes,
+        seed=args.seed,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> Path:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--format", choices=FORMATS, default=None)
+    add_spec_arguments(parser)
+    args = parser.parse_args(argv)
+    spec = spec_from_args(args)
+    path = write_dataset(args.output, spec, args.format)
+    print(json.dumps({"path": str(path), "bytes": path.stat().st_size, **spec.to_dict()}))
+    return path
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Compare the ``--transport`` profiles by ingesting the same graph against a local API.
+
+Usage: ``python -m metadata_cli.benchmarks.transport --nodes 20000 --edges 60000 --concurrency 8
+--latency-ms 1 --repeat 5 [--h2-url http://localhost:8080] --output transport.json``
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Sequence
+
+from metadata_cli.benchmarks.ingest import run_benchmark
+from metadata_cli.benchmarks.stub_api import StubBehavior
+from metadata_cli.benchmarks.synthetic import FORMATS, add_spec_arguments, spec_from_args
+from metadata_cli.config import TransportSettings
+
+PROFILES = ("http1", "http2", "uds")
+
+
+def skip_reason(profile: str, h2_url: str | None) -> str | None:
+    """Why ``profile`` cannot run here; the stub API only speaks HTTP/1.1."""
+    if profile != "http2":
+        return None
+    if find_spec("h2") is None:
+        return "h2 is not installed (pip install 'httpx[http2]')"
+    if h2_url is None:
+        return "needs --h2-url, an API that accepts HTTP/2 without TLS (h2c)"
+    return None
+
+
+def run_profiles(
+    profiles: Sequence[str],
+    behavior: StubBehavior,
+    args: argparse.Namespace,
+    workdir: Path,
+) -> dict[str, Any]:
+    """Ingest once per profile and round, interleaved so drift hits every profile alike.
+
+    Each profile reports its median round by items/s.
+    """
+    spec = spec_from_args(args)
+    runs: dict[str, list[dict[str, Any]]] = {}
+    results: dict[str, Any] = {}
+    for round_index in range(args.repeat):
+        for profile in profiles:
+            reason = skip_reason(profile, args.h2_url)
+            if reason is not None:
+                results[profile] = {"skipped": reason}
+                continue
+            profile_dir = workdir / f"{profile}-{round_index}"
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            options: dict[str, Any] = {
+                "batch_size": args.batch_size,
+                "stream": True,
+                "concurrency": args.concurrency,
+                "transport": TransportSettings.from_options(
+                    transport=profile,
+                    uds=profile_dir / "api.sock" if profile == "uds" else None,
+                ),
+            }
+            report = run_benchmark(
+                spec,
+                behavior,
+                data_format=args.format,
+                workdir=profile_dir,
+                cli_options=options,
+                api_url=args.h2_url if profile == "http2" else None,
+            )
+            runs.setdefault(profile, []).append(report["results"])
+
+    for profile, rounds in runs.items():
+        rounds.sort(key=lambda result: result["itemsPerSecond"])
+        results[profile] = {
+            **rounds[len(rounds) // 2],
+            "roundsItemsPerSecond": [result["itemsPerSecond"] for result in rounds],
+        }
+    baseline = results.get("http1", {}).get("itemsPerSecond")
+    for result in results.values():
+        if baseline and "itemsPerSecond" in result:
+            result["vsHttp1"] = round(result["itemsPerSecond"] / baseline, 3)
+    return {
+        "dataset": {**spec.to_dict(), "format": args.format},
+        "repeat": args.repeat,
+        "profiles": results,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_spec_arguments(parser)
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--profiles", default=",".join(PROFILES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--h2-url", default=None)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args(argv)
+    profiles = [profile.strip() for profile in args.profiles.split(",") if profile.strip()]
+    unknown = sorted(set(profiles) - set(PROFILES))
+    if unknown:
+        parser.error(f"unknown profiles: {', '.join(unknown)}")
+    if args.repeat <= 0:
+        parser.error("--repeat must be greater than zero")
+
+    behavior = StubBehavior(latency_ms=args.latency_ms)
+    with tempfile.TemporaryDirectory(prefix="metadata-cli-transport-") as scratch:
+        report = run_profiles(profiles, behavior, args, Path(scratch))
+    report["stub"] = behavior.to_dict()
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+    return report
+
+
+if __name__ == "__main__":
+    main()
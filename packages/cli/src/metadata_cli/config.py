@@ -1,31 +1,142 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 
 def _normalize_url(url: str) -> str:
     return url[:-1] if url.endswith("/") else url
 
 
+def parse_record_range(value: str) -> tuple[int, Optional[int]]:
+    """Parse ``START:END`` (0-based, END exclusive, either side optional) into a tuple."""
+    start_raw, sep, stop_raw = value.partition(":")
+    if not sep:
+        raise ValueError("Record range must look like START:END")
+    try:
+        start = int(start_raw) if start_raw.strip() else 0
+        stop = int(stop_raw) if stop_raw.strip() else None
+    except ValueError as exc:
+        raise ValueError("Record range bounds must be integers") from exc
+    if start < 0 or (stop is not None and stop <= start):
+        raise ValueError("Record range must satisfy 0 <= START < END")
+    return start, stop
+
+
+@dataclass(frozen=True, slots=True)
+class TransportSettings:
+    """How batches reach the API: protocol, Unix socket, timeouts, and connection pool."""
+
+    protocol: str = "http1"
+    uds_path: Optional[Path] = None
+    connect_timeout: float = 10.0
+    read_timeout: float = 60.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 5.0
+    # ``None`` keeps the runner's defaults: 100 connections, or --concurrency for async sends.
+    max_connections: Optional[int] = None
+    max_keepalive: Optional[int] = None
+    keepalive_expiry: float = 5.0
+
+    @classmethod
+    def from_options(
+        cls,
+        *,
+        transport: str = "http1",
+        uds: Optional[Path] = None,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 60.0,
+        write_timeout: float = 30.0,
+        pool_timeout: float = 5.0,
+        max_connections: Optional[int] = None,
+        max_keepalive: Optional[int] = None,
+        keepalive_expiry: float = 5.0,
+    ) -> "TransportSettings":
+        protocol = transport.lower()
+        if protocol not in {"http1", "http2", "uds"}:
+            raise ValueError("Transport must be http1, http2, or uds")
+        if protocol == "http2" and find_spec("h2") is None:
+            raise ValueError("--transport http2 needs the h2 package (pip install 'httpx[http2]')")
+        if (protocol == "uds") != (uds is not None):
+            raise ValueError("--transport uds and --uds PATH go together")
+        if min(connect_timeout, read_timeout, write_timeout, pool_timeout) <= 0:
+            raise ValueError("Timeouts must be greater than zero")
+        if max_connections is not None and max_connections <= 0:
+            raise ValueError("--max-connections must be greater than zero")
+        if max_keepalive is not None and max_keepalive < 0:
+            raise ValueError("--max-keepalive must not be negative")
+        if keepalive_expiry < 0:
+            raise ValueError("--keepalive-expiry must not be negative")
+        return cls(
+            protocol=protocol,
+            uds_path=uds,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            pool_timeout=pool_timeout,
+            max_connections=max_connections,
+            max_keepalive=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+
+
 @dataclass(slots=True)
 class CliSettings:
     """User-provided settings for running an ingestion job."""
 
     org_id: str
     api_url: str
+    # Every --api-url when several were given; ``api_url`` is the first of them.
+    api_urls: tuple[str, ...] = ()
     api_token: Optional[str] = None
     batch_size: int = 500
     source: str = "cli"
     dataset_format: str = "json"
     job_store_path: Optional[Path] = None
     dry_run: bool = False
+    stream: bool = False
+    concurrency: int = 1
+    pipeline: bool = False
+    adaptive_batching: bool = False
+    min_batch_size: int = 1
+    max_batch_size: int = 1000
+    compression: Optional[str] = None
+    parse_workers: int = 1
+    record_range: Optional[tuple[int, Optional[int]]] = None
+    sample: Optional[int] = None
+    preflight: str = "off"
+    delta: bool = False
+    delta_deletions: Optional[Path] = None
+    max_retries: int = 3
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 30.0
+    dead_letter_path: Optional[Path] = None
+    metrics_port: Optional[int] = None
+    metrics_textfile: Optional[Path] = None
+    profile: bool = False
+    profile_tracemalloc: int = 0
+    file_workers: int = 4
+    sqlite_db: Optional[Path] = None
+    transaction_size: int = 100_000
+    log_format: str = "rich"
+    log_sample_rate: float = 1.0
+    max_errors: int = 1000
+    skip_invalid: bool = False
+    error_report_path: Optional[Path] = None
+    eject_after: int = 3
+    eject_seconds: float = 30.0
+    transport: TransportSettings = field(default_factory=TransportSettings)
 
     @property
     def base_url(self) -> str:
         return _normalize_url(self.api_url)
 
+    @property
+    def base_urls(self) -> tuple[str, ...]:
+        return tuple(_normalize_url(url) for url in self.api_urls or (self.api_url,))
+
     @property
     def default_headers(self) -> dict[str, str]:
         headers = {"content-type": "application/json"}
@@ -38,28 +149,147 @@ class CliSettings:
         cls,
         *,
         org: str,
-        api_url: str,
+        api_url: str | Sequence[str],
         api_token: Optional[str],
         batch_size: int,
         source: Optional[str],
         job_store: Optional[Path],
         dataset_format: str,
+        stream: bool = False,
+        concurrency: int = 1,
+        pipeline: bool = False,
+        adaptive_batching: bool = False,
+        min_batch_size: int = 1,
+        max_batch_size: int = 1000,
+        compression: Optional[str] = None,
+        parse_workers: int = 1,
+        record_range: Optional[str] = None,
+        sample: Optional[int] = None,
+        preflight: str = "off",
+        delta: bool = False,
+        delta_deletions: Optional[Path] = None,
+        max_retries: int = 3,
+        retry_base_delay: float = 0.5,
+        retry_max_delay: float = 30.0,
+        dead_letter: Optional[Path] = None,
+        metrics_port: Optional[int] = None,
+        metrics_textfile: Optional[Path] = None,
+        profile: bool = False,
+        profile_tracemalloc: int = 0,
+        file_workers: int = 4,
+        sqlite_db: Optional[Path] = None,
+        transaction_size: int = 100_000,
+        log_format: str = "rich",
+        log_sample_rate: float = 1.0,
+        max_errors: int = 1000,
+        skip_invalid: bool = False,
+        error_report: Optional[Path] = None,
+        eject_after: int = 3,
+        eject_seconds: float = 30.0,
+        transport: Optional[TransportSettings] = None,
     ) -> "CliSettings":
         if not org:
             raise ValueError("Organization id is required")
-        if not api_url:
+        api_urls = [api_url] if isinstance(api_url, str) else list(api_url)
+        api_urls = [url for url in api_urls if url]
+        if not api_urls and sqlite_db is None:
             raise ValueError("API URL is required")
+        if len(set(map(_normalize_url, api_urls))) < len(api_urls):
+            raise ValueError("API URLs must not repeat")
+        if eject_after <= 0:
+            raise ValueError("--eject-after must be greater than zero")
+        if eject_seconds < 0:
+            raise ValueError("--eject-seconds must not be negative")
+        transport = transport or TransportSettings()
+        if transport.uds_path is not None and len(api_urls) > 1:
+            raise ValueError("--uds reaches a single API; pass one --api-url")
         if batch_size <= 0:
             raise ValueError("Batch size must be greater than zero")
+        if concurrency <= 0:
+            raise ValueError("Concurrency must be greater than zero")
+        if file_workers <= 0:
+            raise ValueError("File workers must be greater than zero")
+        if transaction_size <= 0:
+            raise ValueError("Transaction size must be greater than zero")
+        if parse_workers <= 0:
+            raise ValueError("Parse workers must be greater than zero")
+        if min_batch_size <= 0 or min_batch_size > max_batch_size:
+            raise ValueError("Batch size bounds must satisfy 0 < min <= max")
+        normalized_compression = compression.lower() if compression else None
+        if normalized_compression in {"none", "identity"}:
+            normalized_compression = None
+        if normalized_compression not in {None, "gzip", "deflate"}:
+            raise ValueError("Supported compression: gzip, deflate")
         normalized_format = dataset_format.lower()
         if normalized_format not in {"json", "ndjson", "csv"}:
             raise ValueError("Supported dataset formats: json, ndjson, csv")
+        if (record_range or sample is not None) and normalized_format != "ndjson":
+            raise ValueError("--range and --sample require the ndjson dataset format")
+        if record_range and sample is not None:
+            raise ValueError("--range and --sample are mutually exclusive")
+        if log_format not in {"rich", "json"}:
+            raise ValueError("Log format must be rich or json")
+        if not 0 < log_sample_rate <= 1:
+            raise ValueError("Log sample rate must be in (0, 1]")
+        if max_errors <= 0:
+            raise ValueError("Max errors must be greater than zero")
+        if preflight not in {"off", "warn", "strict"}:
+            raise ValueError("Pre-flight mode must be off, warn, or strict")
+        if sample is not None and sample <= 0:
+            raise ValueError("Sample size must be greater than zero")
+        if max_retries < 0:
+            raise ValueError("Max retries must not be negative")
+        if retry_base_delay < 0 or retry_max_delay < retry_base_delay:
+            raise ValueError("Retry delays must satisfy 0 <= base <= max")
+        if metrics_port is not None and not 0 <= metrics_port <= 65535:
+            raise ValueError("Metrics port must be between 0 and 65535")
+        if profile_tracemalloc < 0:
+            raise ValueError("--profile-tracemalloc must not be negative")
+        if profile_tracemalloc and not profile:
+            raise ValueError("--profile-tracemalloc requires --profile")
+        if delta_deletions and not delta:
+            raise ValueError("--delta-deletions requires --delta")
+        if delta_deletions and (record_range or sample is not None):
+            raise ValueError("--delta-deletions needs the full dataset, not --range or --sample")
         return cls(
             org_id=org,
-            api_url=api_url,
+            api_url=api_urls[0] if api_urls else "",
+            api_urls=tuple(api_urls),
             api_token=api_token,
             batch_size=batch_size,
             source=source or "cli",
             job_store_path=job_store,
             dataset_format=normalized_format,
+            stream=stream,
+            concurrency=concurrency,
+            pipeline=pipeline,
+            adaptive_batching=adaptive_batching,
+            min_batch_size=min_batch_size,
+            max_batch_size=max_batch_size,
+            compression=normalized_compression,
+            parse_workers=parse_workers,
+            record_range=parse_record_range(record_range) if record_range else None,
+            sample=sample,
+            preflight=preflight,
+            delta=delta,
+            delta_deletions=delta_deletions,
+            max_retries=max_retries,
+            retry_base_delay=retry_base_delay,
+            retry_max_delay=retry_max_delay,
+            dead_letter_path=dead_letter,
+            metrics_port=metrics_port,
+            metrics_textfile=metrics_textfile,
+            profile=profile,
+            profile_tracemalloc=profile_tracemalloc,
+            file_workers=file_workers,
+            sqlite_db=sqlite_db,
+            transaction_size=transaction_size,
+            log_format=log_format,
+            log_sample_rate=log_sample_rate,
+            max_errors=max_errors,
+            skip_invalid=skip_invalid,
+            error_report_path=error_report,
+            eject_after=eject_after,
+            eject_seconds=eject_seconds,
+            transport=transport,
         )
@@ -0,0 +1,101 @@
+"""SQLAlchemy mirror of the API schema in ``packages/api/migrations/001_init.sql``.
+
+Only the tables ``load-sqlite`` writes are mirrored. Secondary indexes are kept apart from the
+tables (``GRAPH_INDEXES``) so a bulk load can create them after the rows are in.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import (
+    DATETIME,
+    Column,
+    ForeignKeyConstraint,
+    Index,
+    MetaData,
+    PrimaryKeyConstraint,
+    Table,
+    Text,
+    text,
+)
+from sqlalchemy.schema import CreateIndex, CreateTable, DDLElement
+
+metadata = MetaData()
+
+_NOW = text("CURRENT_TIMESTAMP")
+_EMPTY_OBJECT = text("'{}'")
+
+graph_nodes = Table(
+    "graph_nodes",
+    metadata,
+    Column("id", Text, nullable=False),
+    Column("org_id", Text, nullable=False),
+    Column("type", Text, nullable=False),
+    Column("properties", Text, nullable=False, server_default=_EMPTY_OBJECT),
+    Column("created_at", DATETIME, nullable=False, server_default=_NOW),
+    Column("updated_at", DATETIME, nullable=False, server_default=_NOW),
+    Column("created_by", Text, nullable=False),
+    Column("updated_by", Text, nullable=False),
+    Column("user_agent", Text),
+    Column("client_ip", Text),
+    Column("job_id", Text),
+    PrimaryKeyConstraint("org_id", "id"),
+)
+
+graph_edges = Table(
+    "graph_edges",
+    metadata,
+    Column("id", Text, nullable=False),
+    Column("org_id", Text, nullable=False),
+    Column("source_id", Text, nullable=False),
+    Column("target_id", Text, nullable=False),
+    Column("type", Text, nullable=False),
+    Column("properties", Text, nullable=False, server_default=_EMPTY_OBJECT),
+    Column("created_at", DATETIME, nullable=False, server_default=_NOW),
+    Column("updated_at", DATETIME, nullable=False, server_default=_NOW),
+    Column("created_by", Text, nullable=False),
+    Column("updated_by", Text, nullable=False),
+    Column("job_id", Text),
+    PrimaryKeyConstraint("org_id", "id"),
+    ForeignKeyConstraint(
+        ["org_id", "source_id"], ["graph_nodes.org_id", "graph_nodes.id"], ondelete="CASCADE"
+    ),
+    ForeignKeyConstraint(
+        ["org_id", "target_id"], ["graph_nodes.org_id", "graph_nodes.id"], ondelete="CASCADE"
+    ),
+)
+
+migration_jobs = Table(
+    "migration_jobs",
+    metadata,
+    # 001_init.sql declares a bare "TEXT PRIMARY KEY", which SQLite leaves nullable.
+    Column("job_id", Text, primary_key=True, nullable=True),
+    Column("org_id", Text, nullable=False),
+    Column("source", Text, nullable=False),
+    Column("status", Text, nullable=False),
+    Column("started_at", DATETIME, server_default=_NOW),
+    Column("completed_at", DATETIME),
+    Column("metrics", Text, server_default=_EMPTY_OBJECT),
+    Column("image_digest", Text),
+    Column("logs_url", Text),
+)
+
+GRAPH_TABLES = (graph_nodes, graph_edges, migration_jobs)
+
+# ``CreateTable`` does not emit indexes; these are only created by ``create_indexes_ddl``.
+GRAPH_INDEXES = (
+    Index("idx_graph_nodes_org_type", graph_nodes.c.org_id, graph_nodes.c.type),
+    Index("idx_graph_edges_org_source", graph_edges.c.org_id, graph_edges.c.source_id),
+    Index("idx_graph_edges_org_target", graph_edges.c.org_id, graph_edges.c.target_id),
+)
+
+
+def create_tables_ddl() -> list[DDLElement]:
+    return [CreateTable(table, if_not_exists=True) for table in GRAPH_TABLES]
+
+
+def create_indexes_ddl() -> list[DDLElement]:
+    return [CreateIndex(index, if_not_exists=True) for index in GRAPH_INDEXES]
+
+
+def drop_indexes_sql() -> list[str]:
+    return [f"DROP INDEX IF EXISTS {index.name}" for index in GRAPH_INDEXES]
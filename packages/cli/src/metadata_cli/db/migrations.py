@@ -6,38 +6,152 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-from metadata_cli.models import MigrationJobRecord
+from metadata_cli.records import MigrationJobRecord
 
 DEFAULT_DB_PATH = Path.home() / ".metadata-cli" / "jobs.sqlite"
 JOB_STATUSES = {"queued", "running", "succeeded", "failed"}
+DEFAULT_BUSY_TIMEOUT_SECONDS = 30.0
+
+# Schema migrations, applied in order; ``PRAGMA user_version`` records how many have run.
+# Migration 1 is the schema stores created before versioning, so it adopts those files as-is;
+# each later feature adds its tables in a migration of its own.
+SCHEMA_MIGRATIONS: tuple[tuple[str, ...], ...] = (
+    (
+        """
+        CREATE TABLE IF NOT EXISTS migration_jobs (
+            job_id TEXT PRIMARY KEY,
+            source TEXT NOT NULL,
+            status TEXT NOT NULL,
+            started_at TEXT NOT NULL,
+            completed_at TEXT,
+            metrics TEXT,
+            image_digest TEXT,
+            logs_url TEXT
+        )
+        """,
+    ),
+    # Resumable ingest: the dataset each job read and its acknowledged batches.
+    (
+        """
+        CREATE TABLE IF NOT EXISTS ingest_datasets (
+            job_id TEXT PRIMARY KEY,
+            dataset_path TEXT NOT NULL,
+            dataset_format TEXT NOT NULL,
+            fingerprint TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS ingest_checkpoints (
+            job_id TEXT NOT NULL,
+            resource TEXT NOT NULL,
+            batch_index INTEGER NOT NULL,
+            start_offset INTEGER NOT NULL,
+            item_count INTEGER NOT NULL,
+            acknowledged_at TEXT NOT NULL,
+            PRIMARY KEY (job_id, resource, batch_index)
+        )
+        """,
+    ),
+    # --profile stage reports.
+    (
+        """
+        CREATE TABLE IF NOT EXISTS job_profiles (
+            job_id TEXT PRIMARY KEY,
+            recorded_at TEXT NOT NULL,
+            report TEXT NOT NULL
+        )
+        """,
+    ),
+    # Multi-file ingest: the per-file jobs of an aggregate job.
+    (
+        """
+        CREATE TABLE IF NOT EXISTS ingest_subjobs (
+            parent_job_id TEXT NOT NULL,
+            job_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            PRIMARY KEY (parent_job_id, job_id)
+        )
+        """,
+    ),
+    # Indexes for filtered and paginated job listings and throughput stats.
+    (
+        "CREATE INDEX IF NOT EXISTS idx_migration_jobs_started ON migration_jobs(started_at)",
+        "CREATE INDEX IF NOT EXISTS idx_migration_jobs_status_started"
+        " ON migration_jobs(status, started_at)",
+        "CREATE INDEX IF NOT EXISTS idx_migration_jobs_source_started"
+        " ON migration_jobs(source, started_at)",
+    ),
+)
+SCHEMA_VERSION = len(SCHEMA_MIGRATIONS)
+
+# strftime formats that bucket ``started_at`` for ``throughput_stats``.
+STATS_WINDOWS = {
+    "hour": "%Y-%m-%dT%H:00",
+    "day": "%Y-%m-%d",
+    "week": "%Y-W%W",
+    "month": "%Y-%m",
+}
+STATS_PERCENTILES = (50, 95, 99)
+
+
+def connect(
+    path: Path | str, *, busy_timeout: float = DEFAULT_BUSY_TIMEOUT_SECONDS
+) -> sqlite3.Connection:
+    """Open a CLI state database that several processes can share.
+
+    WAL lets readers run alongside the single writer, and the busy timeout makes a writer wait
+    for the lock instead of failing with ``database is locked``. ``synchronous=NORMAL`` is
+    durable across application crashes in WAL mode and makes per-statement commits cheap.
+    """
+    conn = sqlite3.connect(str(path), timeout=busy_timeout)
+    if str(path) != ":memory:":
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
 
 
 class MigrationJobStore:
-    """Lightweight SQLite-backed store tracking ingestion job metadata."""
+    """Lightweight SQLite-backed store tracking ingestion job metadata.
+
+    Safe to share between concurrent CLI processes (see ``connect``). The schema is versioned
+    with ``PRAGMA user_version`` and upgraded through ``SCHEMA_MIGRATIONS`` on open.
+    """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        *,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT_SECONDS,
+    ):
         path = db_path or DEFAULT_DB_PATH
+        self.path = path
         if str(path) != ":memory:":
             path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(path))
+        self._conn = connect(path, busy_timeout=busy_timeout)
         self._conn.row_factory = sqlite3.Row
-        self._ensure_schema()
+        self._migrate()
 
-    def _ensure_schema(self) -> None:
-        self._conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS migration_jobs (
-                job_id TEXT PRIMARY KEY,
-                source TEXT NOT NULL,
-                status TEXT NOT NULL,
-                started_at TEXT NOT NULL,
-                completed_at TEXT,
-                metrics TEXT,
-                image_digest TEXT,
-                logs_url TEXT
-            )
-            """
-        )
+    @property
+    def schema_version(self) -> int:
+        return self._conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def _migrate(self) -> None:
+        # A store written by a newer CLI is left alone; its extra migrations are additive.
+        if self.schema_version >= SCHEMA_VERSION:
+            return
+        # BEGIN IMMEDIATE takes the write lock up front, so processes opening the store at the
+        # same time run each migration once; the version is re-read under the lock.
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = self.schema_version
+            for statements in SCHEMA_MIGRATIONS[version:]:
+                for statement in statements:
+                    self._conn.execute(statement)
+            if version < SCHEMA_VERSION:
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except BaseException:
+            self._conn.rollback()
+            raise
         self._conn.commit()
 
     def queue_job(
@@ -151,12 +265,294 @@ class MigrationJobStore:
         row = self._fetch_row(job_id)
         return self._row_to_record(row)
 
-    def list_jobs(self) -> list[MigrationJobRecord]:
+    def get_job(self, job_id: str) -> MigrationJobRecord:
+        return self._row_to_record(self._fetch_row(job_id))
+
+    def record_dataset(
+        self, job_id: str, *, dataset_path: str, dataset_format: str, fingerprint: str
+    ) -> None:
+        """Remember which input a job read so ``--resume`` can refuse a changed file."""
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO ingest_datasets (job_id, dataset_path, dataset_format, fingerprint)
+            VALUES (?, ?, ?, ?)
+            """,
+            (job_id, dataset_path, dataset_format, fingerprint),
+        )
+        self._conn.commit()
+
+    def get_dataset(self, job_id: str) -> dict[str, str] | None:
+        row = self._conn.execute(
+            "SELECT dataset_path, dataset_format, fingerprint FROM ingest_datasets WHERE job_id = ?",
+            (job_id,),
+        ).fetchone()
+        return dict(row) if row else None
+
+    def record_subjob(self, parent_job_id: str, job_id: str, *, position: int) -> None:
+        """Link a per-file sub-job to the aggregate job of a multi-file ingest."""
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO ingest_subjobs (parent_job_id, job_id, position)
+            VALUES (?, ?, ?)
+            """,
+            (parent_job_id, job_id, position),
+        )
+        self._conn.commit()
+
+    def list_subjobs(self, parent_job_id: str) -> list[MigrationJobRecord]:
+        rows = self._conn.execute(
+            """
+            SELECT j.* FROM ingest_subjobs s
+              JOIN migration_jobs j ON j.job_id = s.job_id
+             WHERE s.parent_job_id = ?
+             ORDER BY s.position
+            """,
+            (parent_job_id,),
+        ).fetchall()
+        return [self._row_to_record(row) for row in rows]
+
+    def record_profile(self, job_id: str, report: dict[str, Any]) -> None:
+        """Store the ``--profile`` report of a run (a resumed run replaces the earlier one)."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO job_profiles (job_id, recorded_at, report) VALUES (?, ?, ?)",
+            (job_id, datetime.now(timezone.utc).isoformat(), json.dumps(report)),
+        )
+        self._conn.commit()
+
+    def get_profile(self, job_id: str) -> dict[str, Any] | None:
+        row = self._conn.execute(
+            "SELECT report FROM job_profiles WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return json.loads(row["report"]) if row else None
+
+    def record_checkpoint(
+        self,
+        job_id: str,
+        *,
+        resource: str,
+        batch_index: int,
+        start_offset: int,
+        item_count: int,
+    ) -> None:
+        """Persist an acknowledged batch of ``item_count`` items starting at ``start_offset``."""
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO ingest_checkpoints (
+                job_id, resource, batch_index, start_offset, item_count, acknowledged_at
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                job_id,
+                resource,
+                batch_index,
+                start_offset,
+                item_count,
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+        self._conn.commit()
+
+    def acknowledged_offset(self, job_id: str, resource: str) -> int:
+        """Return how many leading items of ``resource`` are covered by acknowledged batches.
+
+        Batches may be acknowledged out of order under ``--concurrency``; only the contiguous
+        prefix is safe to skip on resume.
+        """
+        rows = self._conn.execute(
+            """
+            SELECT start_offset, item_count FROM ingest_checkpoints
+             WHERE job_id = ? AND resource = ?
+             ORDER BY start_offset
+            """,
+            (job_id, resource),
+        ).fetchall()
+        offset = 0
+        for row in rows:
+            if row["start_offset"] > offset:
+                break
+            offset = max(offset, row["start_offset"] + row["item_count"])
+        return offset
+
+    def next_batch_index(self, job_id: str, resource: str) -> int:
+        row = self._conn.execute(
+            "SELECT MAX(batch_index) FROM ingest_checkpoints WHERE job_id = ? AND resource = ?",
+            (job_id, resource),
+        ).fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def list_jobs(
+        self,
+        *,
+        status: str | None = None,
+        source: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[MigrationJobRecord]:
+        """Return jobs newest first, optionally filtered and paginated.
+
+        ``since``/``until`` bound ``started_at`` (inclusive/exclusive). Filters and ordering
+        are served by the ``started_at`` indexes, so a page only reads and decodes its rows.
+        """
+        if limit is not None and limit <= 0:
+            raise ValueError("limit must be greater than zero")
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+        where, params = self._job_filters(status=status, source=source, since=since, until=until)
         rows = self._conn.execute(
-            "SELECT * FROM migration_jobs ORDER BY started_at DESC"
+            f"""
+            SELECT * FROM migration_jobs {where}
+             ORDER BY started_at DESC, job_id DESC
+             LIMIT ? OFFSET ?
+            """,
+            (*params, -1 if limit is None else limit, offset),
         ).fetchall()
         return [self._row_to_record(row) for row in rows]
 
+    def count_jobs(
+        self,
+        *,
+        status: str | None = None,
+        source: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> int:
+        where, params = self._job_filters(status=status, source=source, since=since, until=until)
+        row = self._conn.execute(f"SELECT COUNT(*) FROM migration_jobs {where}", params).fetchone()
+        return row[0]
+
+    def throughput_stats(
+        self,
+        *,
+        window: str = "day",
+        source: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Aggregate job metrics per source and time window inside SQLite.
+
+        Metrics are read with JSON1 ``json_extract``, so only one row per group leaves the
+        database. Per-job throughput is ``(nodesAccepted + edgesAccepted) / durationSeconds``
+        of succeeded jobs; its percentiles use the nearest-rank method over ``ROW_NUMBER()``,
+        and ``throughputChange`` compares a window's throughput with the previous window of the
+        same source. Sub-jobs of multi-file ingests are left out, since their aggregate job
+        already counts them.
+        """
+        if window not in STATS_WINDOWS:
+            raise ValueError(f"Window must be one of {', '.join(STATS_WINDOWS)}")
+        where, params = self._job_filters(status=None, source=source, since=since, until=until)
+        subjobs = "job_id NOT IN (SELECT job_id FROM ingest_subjobs)"
+        where = f"{where} AND {subjobs}" if where else f"WHERE {subjobs}"
+        percentile_columns = ",\n".join(
+            f"MAX(CASE WHEN position = MAX(1, (rated * {p} + 99) / 100) THEN rate END) AS p{p}"
+            for p in STATS_PERCENTILES
+        )
+        rows = self._conn.execute(
+            f"""
+            WITH runs AS (
+                SELECT source,
+                       strftime(?, started_at) AS bucket,
+                       status,
+                       COALESCE(json_extract(metrics, '$.nodesAccepted'), 0)
+                         + COALESCE(json_extract(metrics, '$.edgesAccepted'), 0) AS items,
+                       json_extract(metrics, '$.durationSeconds') AS duration,
+                       COALESCE(json_extract(metrics, '$.batches'), 0) AS batches
+                  FROM migration_jobs {where}
+            ),
+            rated AS (
+                SELECT *,
+                       CASE WHEN status = 'succeeded' AND duration > 0
+                            THEN 1.0 * items / duration END AS rate
+                  FROM runs
+            ),
+            ranked AS (
+                SELECT source, bucket, rate,
+                       ROW_NUMBER() OVER (PARTITION BY source, bucket ORDER BY rate) AS position,
+                       COUNT(*) OVER (PARTITION BY source, bucket) AS rated
+                  FROM rated
+                 WHERE rate IS NOT NULL
+            ),
+            percentiles AS (
+                SELECT source, bucket, {percentile_columns}
+                  FROM ranked
+                 GROUP BY source, bucket
+            ),
+            grouped AS (
+                SELECT source, bucket,
+                       COUNT(*) AS jobs,
+                       SUM(status = 'succeeded') AS succeeded,
+                       SUM(status = 'failed') AS failed,
+                       SUM(items) AS items,
+                       SUM(batches) AS batches,
+                       SUM(CASE WHEN rate IS NOT NULL THEN items END) AS rated_items,
+                       SUM(CASE WHEN rate IS NOT NULL THEN duration END) AS rated_seconds
+                  FROM rated
+                 GROUP BY source, bucket
+            )
+            SELECT g.source, g.bucket, g.jobs, g.succeeded, g.failed, g.items, g.batches,
+                   g.rated_seconds,
+                   1.0 * g.rated_items / g.rated_seconds AS throughput,
+                   LAG(1.0 * g.rated_items / g.rated_seconds)
+                     OVER (PARTITION BY g.source ORDER BY g.bucket) AS previous_throughput,
+                   {", ".join(f"p.p{p}" for p in STATS_PERCENTILES)}
+              FROM grouped g
+              LEFT JOIN percentiles p ON p.source = g.source AND p.bucket = g.bucket
+             ORDER BY g.source, g.bucket
+            """,
+            (STATS_WINDOWS[window], *params),
+        ).fetchall()
+        return [
+            {
+                "source": row["source"],
+                "window": row["bucket"],
+                "jobs": row["jobs"],
+                "succeeded": row["succeeded"],
+                "failed": row["failed"],
+                "items": row["items"],
+                "batches": row["batches"],
+                "durationSeconds": _rounded(row["rated_seconds"]),
+                "itemsPerSecond": _rounded(row["throughput"]),
+                "throughputChange": _rounded(
+                    row["throughput"] / row["previous_throughput"] - 1
+                    if row["throughput"] is not None and row["previous_throughput"]
+                    else None,
+                    4,
+                ),
+                "itemsPerSecondPercentiles": {
+                    f"p{p}": _rounded(row[f"p{p}"]) for p in STATS_PERCENTILES
+                },
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def _job_filters(
+        *,
+        status: str | None,
+        source: str | None,
+        since: datetime | None,
+        until: datetime | None,
+    ) -> tuple[str, list[Any]]:
+        if status is not None and status not in JOB_STATUSES:
+            raise ValueError(f"Unsupported status {status}")
+        clauses: list[str] = []
+        params: list[Any] = []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        # started_at is stored as a UTC ISO-8601 string, which sorts chronologically.
+        if since is not None:
+            clauses.append("started_at >= ?")
+            params.append(_utc_isoformat(since))
+        if until is not None:
+            clauses.append("started_at < ?")
+            params.append(_utc_isoformat(until))
+        return ("WHERE " + " AND ".join(clauses) if clauses else ""), params
+
     def _fetch_row(self, job_id: str) -> sqlite3.Row:
         row = self._conn.execute(
             "SELECT * FROM migration_jobs WHERE job_id = ?", (job_id,)
@@ -197,3 +593,13 @@ class MigrationJobStore:
             self.close()
         except Exception:  # pragma: no cover
             pass
+
+
+def _utc_isoformat(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _rounded(value: float | None, digits: int = 2) -> float | None:
+    return None if value is None else round(value, digits)
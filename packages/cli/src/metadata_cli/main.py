@@ -1,18 +1,152 @@
+"""Typer entry point.
+
+Cron wrappers and health probes run this module thousands of times a day, so it only imports
+typer and light local modules. httpx, pydantic, sqlalchemy, and rich are imported inside the
+commands that use them; ``test_help_starts_within_budget_without_heavy_imports`` in
+``tests/test_benchmarks.py`` holds ``--help`` to an import-time budget.
+"""
+
 from __future__ import annotations
 
+import inspect
+import json
+from functools import wraps
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import typer
 
-from metadata_cli.config import CliSettings
+from metadata_cli.config import CliSettings, TransportSettings
+from metadata_cli.db.migrations import STATS_WINDOWS, MigrationJobStore
 from metadata_cli.errors import CLIError, DatasetValidationError
-from metadata_cli.services.ingest import IngestionRunner
 
-app = typer.Typer(help="SQLite metadata ingestion CLI.", add_completion=False)
+# Plain click help: rich-formatted help alone imports rich, about 140 ms.
+app = typer.Typer(
+    help="SQLite metadata ingestion CLI.", add_completion=False, rich_markup_mode=None
+)
+jobs_app = typer.Typer(
+    help="Inspect the local job history.", no_args_is_help=True, rich_markup_mode=None
+)
+app.add_typer(jobs_app, name="jobs")
+
+DATETIME_FORMATS = ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S%z"]
+
+# The options that build a ``TransportSettings``, as (annotation, typer option) per parameter.
+TRANSPORT_OPTIONS: dict[str, tuple[Any, Any]] = {
+    "transport": (
+        str,
+        typer.Option(
+            "http1",
+            "--transport",
+            envvar="CLI_TRANSPORT",
+            help="http1, http2 (multiplexed streams; needs httpx[http2]), or uds (with --uds).",
+        ),
+    ),
+    "uds": (
+        Optional[Path],
+        typer.Option(
+            None,
+            "--uds",
+            envvar="CLI_UDS",
+            help="Unix domain socket of an API on the same host, for --transport uds.",
+        ),
+    ),
+    "connect_timeout": (
+        float,
+        typer.Option(
+            10.0, "--connect-timeout", envvar="CLI_CONNECT_TIMEOUT", help="Seconds to connect."
+        ),
+    ),
+    "read_timeout": (
+        float,
+        typer.Option(
+            60.0, "--read-timeout", envvar="CLI_READ_TIMEOUT", help="Seconds to wait for a reply."
+        ),
+    ),
+    "write_timeout": (
+        float,
+        typer.Option(
+            30.0, "--write-timeout", envvar="CLI_WRITE_TIMEOUT", help="Seconds to send a batch."
+        ),
+    ),
+    "pool_timeout": (
+        float,
+        typer.Option(
+            5.0,
+            "--pool-timeout",
+            envvar="CLI_POOL_TIMEOUT",
+            help="Seconds to wait for a free pooled connection.",
+        ),
+    ),
+    "max_connections": (
+        Optional[int],
+        typer.Option(
+            None,
+            "--max-connections",
+            envvar="CLI_MAX_CONNECTIONS",
+            min=1,
+            help="Connections per --api-url (default: enough for --concurrency).",
+        ),
+    ),
+    "max_keepalive": (
+        Optional[int],
+        typer.Option(
+            None,
+            "--max-keepalive",
+            envvar="CLI_MAX_KEEPALIVE",
+            min=0,
+            help="Idle connections kept open per --api-url (default: all of them).",
+        ),
+    ),
+    "keepalive_expiry": (
+        float,
+        typer.Option(
+            5.0,
+            "--keepalive-expiry",
+            envvar="CLI_KEEPALIVE_EXPIRY",
+            min=0.0,
+            help="Seconds an idle connection is kept open.",
+        ),
+    ),
+}
+
+
+def _with_transport_options(command: Callable[..., Any]) -> Callable[..., Any]:
+    """Expose ``TRANSPORT_OPTIONS`` in place of ``command``'s ``transport`` parameter.
+
+    Typer reads the rewritten signature, so every option keeps its flag, env var, and help; the
+    command gets one validated ``TransportSettings`` instead of a parameter per option.
+    """
+    signature = inspect.signature(command)
+    parameters = list(signature.parameters.values())
+    position = [parameter.name for parameter in parameters].index("transport")
+    kind = parameters[position].kind
+    parameters[position : position + 1] = [
+        inspect.Parameter(name, kind, default=option, annotation=annotation)
+        for name, (annotation, option) in TRANSPORT_OPTIONS.items()
+    ]
+
+    @wraps(command)
+    def wrapper(**kwargs: Any) -> Any:
+        options = {name: kwargs.pop(name) for name in TRANSPORT_OPTIONS}
+        try:
+            kwargs["transport"] = TransportSettings.from_options(**options)
+        except ValueError as exc:
+            typer.secho(f"Configuration error: {exc}", err=True, fg=typer.colors.RED)
+            raise typer.Exit(code=2) from exc
+        return command(**kwargs)
+
+    wrapper.__signature__ = signature.replace(parameters=parameters)  # type: ignore[attr-defined]
+    wrapper.__annotations__ = {
+        **{parameter.name: parameter.annotation for parameter in parameters},
+        "return": signature.return_annotation,
+    }
+    return wrapper
 
 
 @app.command()
+@_with_transport_options
 def ingest(
     dataset_format: str = typer.Option(
         "json",
@@ -20,13 +154,20 @@ def ingest(
         envvar="CLI_DATASET_FORMAT",
         help="Dataset format (currently only json).",
     ),
-    file: Path = typer.Argument(..., exists=True, readable=True, help="Dataset file to ingest."),
+    files: list[str] = typer.Argument(
+        ...,
+        metavar="FILES",
+        help="Dataset files, directories, or quoted glob patterns (e.g. 'shards/**/*.ndjson').",
+    ),
     org: str = typer.Option(..., "--org", "-o", help="Organization identifier."),
-    api_url: str = typer.Option(
+    api_url: Optional[list[str]] = typer.Option(
         None,
         "--api-url",
         envvar="API_URL",
-        help="Base URL for the metadata API (e.g. https://api.local).",
+        help=(
+            "Base URL for the metadata API (e.g. https://api.local). Repeat it to spread batches "
+            "over several replicas."
+        ),
     ),
     api_token: Optional[str] = typer.Option(
         None,
@@ -53,32 +194,269 @@ def ingest(
         envvar="CLI_JOB_STORE",
         help="Optional path for the local job history SQLite file.",
     ),
+    stream: bool = typer.Option(
+        False,
+        "--stream/--no-stream",
+        envvar="CLI_STREAM",
+        help="Read and validate records lazily so memory is bounded by the batch size.",
+    ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        envvar="CLI_CONCURRENCY",
+        min=1,
+        help="Number of batches kept in flight at once (uses an async HTTP client when > 1).",
+    ),
+    pipeline: bool = typer.Option(
+        False,
+        "--pipeline/--no-pipeline",
+        envvar="CLI_PIPELINE",
+        help="Send edge batches as soon as the node batches they reference are acknowledged.",
+    ),
+    adaptive_batching: bool = typer.Option(
+        False,
+        "--adaptive-batching/--no-adaptive-batching",
+        envvar="CLI_ADAPTIVE_BATCHING",
+        help="Grow/shrink the batch size (AIMD) to stay inside the per-batch latency budget.",
+    ),
+    min_batch_size: int = typer.Option(
+        1,
+        "--min-batch-size",
+        envvar="CLI_MIN_BATCH_SIZE",
+        min=1,
+        help="Lower bound for --adaptive-batching.",
+    ),
+    max_batch_size: int = typer.Option(
+        1000,
+        "--max-batch-size",
+        envvar="CLI_MAX_BATCH_SIZE",
+        min=1,
+        help="Upper bound for --adaptive-batching (the API accepts at most 1000 items).",
+    ),
+    compress: Optional[str] = typer.Option(
+        None,
+        "--compress",
+        envvar="CLI_COMPRESS",
+        help="Compress request bodies with gzip or deflate (sets Content-Encoding).",
+    ),
+    parse_workers: int = typer.Option(
+        1,
+        "--parse-workers",
+        envvar="CLI_PARSE_WORKERS",
+        min=1,
+        help="Processes used to parse CSV chunks and to validate NDJSON/CSV files up front.",
+    ),
+    max_errors: int = typer.Option(
+        1000,
+        "--max-errors",
+        envvar="CLI_MAX_ERRORS",
+        min=1,
+        help="Validation errors written to the error report; a failing file stops at this many.",
+    ),
+    skip_invalid: bool = typer.Option(
+        False,
+        "--skip-invalid",
+        envvar=["CLI_SKIP_INVALID", "METADATA_SKIP_INVALID"],
+        help="Report invalid records and load the valid ones instead of failing the file.",
+    ),
+    error_report: Optional[Path] = typer.Option(
+        None,
+        "--error-report",
+        envvar="CLI_ERROR_REPORT",
+        help="NDJSON file for validation errors (default: validation-errors.ndjson beside the "
+        "job store).",
+    ),
+    record_range: Optional[str] = typer.Option(
+        None,
+        "--range",
+        metavar="START:END",
+        help="Only ingest NDJSON records START..END-1 (0-based, blank lines skipped).",
+    ),
+    sample: Optional[int] = typer.Option(
+        None,
+        "--sample",
+        min=1,
+        help="Only ingest N NDJSON records spread evenly across the file (smoke tests).",
+    ),
+    preflight: str = typer.Option(
+        "off",
+        "--preflight",
+        envvar="CLI_PREFLIGHT",
+        help="Check duplicate IDs and dangling edges before shipping: off, warn, or strict.",
+    ),
+    delta: bool = typer.Option(
+        False,
+        "--delta/--no-delta",
+        envvar="CLI_DELTA",
+        help="Only send records whose content changed since the last acknowledged run.",
+    ),
+    delta_deletions: Optional[Path] = typer.Option(
+        None,
+        "--delta-deletions",
+        help="With --delta, write IDs that disappeared since the last run to this NDJSON file.",
+    ),
+    max_retries: int = typer.Option(
+        3,
+        "--max-retries",
+        envvar="CLI_MAX_RETRIES",
+        min=0,
+        help="Resend a batch up to N times on 429, 5xx, or connection errors.",
+    ),
+    retry_base_delay: float = typer.Option(
+        0.5,
+        "--retry-base-delay",
+        envvar="CLI_RETRY_BASE_DELAY",
+        min=0.0,
+        help="Backoff ceiling in seconds for the first retry; doubles per attempt (full jitter).",
+    ),
+    retry_max_delay: float = typer.Option(
+        30.0,
+        "--retry-max-delay",
+        envvar="CLI_RETRY_MAX_DELAY",
+        min=0.0,
+        help="Upper bound in seconds for any backoff, including Retry-After.",
+    ),
+    dead_letter: Optional[Path] = typer.Option(
+        None,
+        "--dead-letter",
+        envvar="CLI_DEAD_LETTER",
+        help="Bisect batches rejected with 400/422 and append the bad records to this NDJSON file.",
+    ),
+    metrics_port: Optional[int] = typer.Option(
+        None,
+        "--metrics-port",
+        envvar="CLI_METRICS_PORT",
+        help="Serve Prometheus metrics on http://0.0.0.0:PORT/metrics while the job runs.",
+    ),
+    metrics_textfile: Optional[Path] = typer.Option(
+        None,
+        "--metrics-textfile",
+        envvar="CLI_METRICS_TEXTFILE",
+        help="Write Prometheus metrics to this node_exporter textfile (*.prom) when the job ends.",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile/--no-profile",
+        envvar="CLI_PROFILE",
+        help="Time and memory-sample each stage; the JSON report is stored with the job.",
+    ),
+    profile_tracemalloc: int = typer.Option(
+        0,
+        "--profile-tracemalloc",
+        min=0,
+        metavar="TOP",
+        help="With --profile, trace allocations and report the TOP allocating source lines.",
+    ),
+    file_workers: int = typer.Option(
+        4,
+        "--file-workers",
+        envvar="CLI_FILE_WORKERS",
+        min=1,
+        help="With several files, how many are shipped at once over one shared connection pool.",
+    ),
+    log_format: str = typer.Option(
+        "rich",
+        "--log-format",
+        envvar="CLI_LOG_FORMAT",
+        help="rich (interactive) or json (NDJSON events on stderr for log pipelines).",
+    ),
+    log_sample_rate: float = typer.Option(
+        1.0,
+        "--log-sample-rate",
+        envvar="CLI_LOG_SAMPLE_RATE",
+        min=0.0,
+        max=1.0,
+        help="Fraction of routine per-batch events to log; failures and summaries always log.",
+    ),
+    eject_after: int = typer.Option(
+        3,
+        "--eject-after",
+        envvar="CLI_EJECT_AFTER",
+        min=1,
+        help="Consecutive 5xx/connection failures before an --api-url is taken out of rotation.",
+    ),
+    eject_seconds: float = typer.Option(
+        30.0,
+        "--eject-seconds",
+        envvar="CLI_EJECT_SECONDS",
+        min=0.0,
+        help="How long an ejected --api-url stays out (doubles on each repeat ejection).",
+    ),
+    transport: TransportSettings = TransportSettings(),
+    resume: Optional[str] = typer.Option(
+        None,
+        "--resume",
+        metavar="JOB_ID",
+        help="Resume a failed job from its last acknowledged batch (the file must be unchanged).",
+    ),
 ) -> None:
     """Ingest nodes and edges into the metadata API."""
+    from metadata_cli.services.ingest import IngestionRunner, expand_dataset_paths
+
     try:
         settings = CliSettings.from_options(
             org=org,
-            api_url=api_url or "",
+            api_url=api_url or [],
             api_token=api_token,
             batch_size=batch_size,
             source=source,
             job_store=job_store,
             dataset_format=dataset_format,
+            stream=stream,
+            concurrency=concurrency,
+            pipeline=pipeline,
+            adaptive_batching=adaptive_batching,
+            min_batch_size=min_batch_size,
+            max_batch_size=max_batch_size,
+            compression=compress,
+            parse_workers=parse_workers,
+            record_range=record_range,
+            sample=sample,
+            max_errors=max_errors,
+            skip_invalid=skip_invalid,
+            error_report=error_report,
+            preflight=preflight.lower(),
+            delta=delta,
+            delta_deletions=delta_deletions,
+            max_retries=max_retries,
+            retry_base_delay=retry_base_delay,
+            retry_max_delay=retry_max_delay,
+            dead_letter=dead_letter,
+            metrics_port=metrics_port,
+            metrics_textfile=metrics_textfile,
+            profile=profile,
+            profile_tracemalloc=profile_tracemalloc,
+            file_workers=file_workers,
+            log_format=log_format.lower(),
+            log_sample_rate=log_sample_rate,
+            eject_after=eject_after,
+            eject_seconds=eject_seconds,
+            transport=transport,
         )
     except ValueError as exc:
         typer.secho(f"Configuration error: {exc}", err=True, fg=typer.colors.RED)
         raise typer.Exit(code=2) from exc
 
+    try:
+        paths = expand_dataset_paths(files, settings.dataset_format)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="FILES") from exc
+    multi_file = len(paths) > 1 or any(Path(value).is_dir() for value in files)
+    if multi_file and resume:
+        raise typer.BadParameter("--resume takes a single dataset file", param_hint="--resume")
+
     runner = IngestionRunner(settings=settings)
 
     try:
-        job = runner.run(file)
+        job = runner.run_many(paths) if multi_file else runner.run(paths[0], resume_job_id=resume)
     except DatasetValidationError as exc:
         typer.secho(f"Dataset invalid: {exc}", err=True, fg=typer.colors.RED)
         raise typer.Exit(code=3) from exc
     except CLIError as exc:
         typer.secho(f"Ingestion failed: {exc}", err=True, fg=typer.colors.RED)
         raise typer.Exit(code=1) from exc
+    finally:
+        runner.logger.close()
 
     color = typer.colors.GREEN if job.status == "succeeded" else typer.colors.YELLOW
     typer.secho(
@@ -86,3 +464,306 @@ def ingest(
         f"edges={job.metrics.get('edgesAccepted', 0)}",
         fg=color,
     )
+
+
+@app.command("load-sqlite")
+def load_sqlite(
+    dataset_path: Path = typer.Argument(..., metavar="FILE", help="Dataset file to load."),
+    db: Path = typer.Option(
+        ...,
+        "--db",
+        help="SQLite database of the API (created with the API schema if missing).",
+    ),
+    org: str = typer.Option(..., "--org", "-o", help="Organization identifier."),
+    dataset_format: str = typer.Option(
+        "json",
+        "--dataset-format",
+        envvar="CLI_DATASET_FORMAT",
+        help="Dataset format: json, ndjson, or csv.",
+    ),
+    source: Optional[str] = typer.Option(
+        "cli",
+        "--source",
+        envvar="CLI_SOURCE",
+        help="Identifier recorded in job metadata and as the default createdBy.",
+    ),
+    job_store: Optional[Path] = typer.Option(
+        None,
+        "--job-store",
+        envvar="CLI_JOB_STORE",
+        help="Optional path for the local job history SQLite file.",
+    ),
+    batch_size: int = typer.Option(
+        5000,
+        "--batch-size",
+        min=1,
+        help="Rows per executemany call.",
+    ),
+    transaction_size: int = typer.Option(
+        100_000,
+        "--transaction-size",
+        min=1,
+        help="Rows written between commits.",
+    ),
+    parse_workers: int = typer.Option(
+        1,
+        "--parse-workers",
+        envvar="CLI_PARSE_WORKERS",
+        min=1,
+        help="Processes used to parse CSV chunks and to validate NDJSON/CSV files up front.",
+    ),
+    max_errors: int = typer.Option(
+        1000,
+        "--max-errors",
+        envvar="CLI_MAX_ERRORS",
+        min=1,
+        help="Validation errors written to the error report; a failing file stops at this many.",
+    ),
+    skip_invalid: bool = typer.Option(
+        False,
+        "--skip-invalid",
+        envvar=["CLI_SKIP_INVALID", "METADATA_SKIP_INVALID"],
+        help="Report invalid records and load the valid ones instead of failing the file.",
+    ),
+    error_report: Optional[Path] = typer.Option(
+        None,
+        "--error-report",
+        envvar="CLI_ERROR_REPORT",
+        help="NDJSON file for validation errors (default: validation-errors.ndjson beside the "
+        "job store).",
+    ),
+    record_range: Optional[str] = typer.Option(
+        None,
+        "--range",
+        metavar="START:END",
+        help="Only load NDJSON records START..END-1 (0-based, blank lines skipped).",
+    ),
+    sample: Optional[int] = typer.Option(
+        None,
+        "--sample",
+        min=1,
+        help="Only load N NDJSON records spread evenly across the file.",
+    ),
+    log_format: str = typer.Option(
+        "rich",
+        "--log-format",
+        envvar="CLI_LOG_FORMAT",
+        help="rich (interactive) or json (NDJSON events on stderr for log pipelines).",
+    ),
+    log_sample_rate: float = typer.Option(
+        1.0,
+        "--log-sample-rate",
+        envvar="CLI_LOG_SAMPLE_RATE",
+        min=0.0,
+        max=1.0,
+        help="Fraction of routine per-batch events to log; failures and summaries always log.",
+    ),
+) -> None:
+    """Write nodes and edges straight into the API's SQLite database, bypassing HTTP."""
+    from metadata_cli.services.sqlite_load import SqliteBulkLoader
+
+    try:
+        settings = CliSettings.from_options(
+            org=org,
+            api_url="",
+            api_token=None,
+            batch_size=batch_size,
+            source=source,
+            job_store=job_store,
+            dataset_format=dataset_format,
+            parse_workers=parse_workers,
+            record_range=record_range,
+            sample=sample,
+            max_errors=max_errors,
+            skip_invalid=skip_invalid,
+            error_report=error_report,
+            sqlite_db=db,
+            transaction_size=transaction_size,
+            log_format=log_format.lower(),
+            log_sample_rate=log_sample_rate,
+        )
+    except ValueError as exc:
+        typer.secho(f"Configuration error: {exc}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(code=2) from exc
+
+    loader = SqliteBulkLoader(settings)
+    try:
+        job = loader.run(dataset_path)
+    except DatasetValidationError as exc:
+        typer.secho(f"Dataset invalid: {exc}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(code=3) from exc
+    except CLIError as exc:
+        typer.secho(f"Load failed: {exc}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(code=1) from exc
+    finally:
+        loader.logger.close()
+
+    typer.secho(
+        f"Job {job.job_id} finished with status={job.status} nodes={job.metrics['nodesAccepted']} "
+        f"edges={job.metrics['edgesAccepted']} rejected_edges={job.metrics['edgesRejected']}",
+        fg=typer.colors.GREEN,
+    )
+
+
+def _job_store_option() -> Any:
+    return typer.Option(
+        None,
+        "--job-store",
+        envvar="CLI_JOB_STORE",
+        help="Path of the local job history SQLite file.",
+    )
+
+
+def _window_option(flag: str, help_text: str) -> Any:
+    return typer.Option(None, flag, formats=DATETIME_FORMATS, help=help_text)
+
+
+def _json_option() -> Any:
+    return typer.Option(False, "--json", help="Print JSON instead of a table.")
+
+
+def _echo_json(payload: Any) -> None:
+    typer.echo(json.dumps(payload, indent=2))
+
+
+def _items(metrics: dict[str, Any]) -> int:
+    return metrics.get("nodesAccepted", 0) + metrics.get("edgesAccepted", 0)
+
+
+def _format_number(value: float | None) -> str:
+    return "-" if value is None else f"{value:,.1f}"
+
+
+@jobs_app.command("list")
+def jobs_list(
+    status: Optional[str] = typer.Option(None, "--status", help="Only jobs with this status."),
+    source: Optional[str] = typer.Option(None, "--source", help="Only jobs from this source."),
+    since: Optional[datetime] = _window_option("--since", "Only jobs started at or after this."),
+    until: Optional[datetime] = _window_option("--until", "Only jobs started before this."),
+    limit: int = typer.Option(20, "--limit", min=1, help="Jobs per page."),
+    offset: int = typer.Option(0, "--offset", min=0, help="Jobs to skip (newest first)."),
+    job_store: Optional[Path] = _job_store_option(),
+    as_json: bool = _json_option(),
+) -> None:
+    """List jobs, newest first."""
+    from rich.console import Console
+    from rich.table import Table
+
+    store = MigrationJobStore(job_store)
+    filters = {"status": status, "source": source, "since": since, "until": until}
+    try:
+        jobs = store.list_jobs(**filters, limit=limit, offset=offset)
+        total = store.count_jobs(**filters)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    finally:
+        store.close()
+
+    if as_json:
+        _echo_json({"total": total, "offset": offset, "jobs": [job.to_dict() for job in jobs]})
+        return
+    table = Table("Job", "Source", "Status", "Started", "Duration (s)", "Items", "Items/s")
+    for job in jobs:
+        duration = job.metrics.get("durationSeconds")
+        items = _items(job.metrics)
+        table.add_row(
+            job.job_id,
+            job.source,
+            job.status,
+            job.started_at.strftime("%Y-%m-%d %H:%M:%S"),
+            _format_number(duration),
+            f"{items:,}",
+            _format_number(items / duration if duration else None),
+        )
+    console = Console()
+    console.print(table)
+    shown = f"{offset + 1}-{offset + len(jobs)}" if jobs else "0"
+    console.print(f"Showing {shown} of {total} jobs")
+
+
+@jobs_app.command("show")
+def jobs_show(
+    job_id: str = typer.Argument(..., help="Job to show."),
+    job_store: Optional[Path] = _job_store_option(),
+    as_json: bool = _json_option(),
+) -> None:
+    """Show one job with its metrics, dataset, sub-jobs, and profile."""
+    from rich.console import Console
+
+    store = MigrationJobStore(job_store)
+    try:
+        job = store.get_job(job_id)
+        payload = job.to_dict()
+        payload["dataset"] = store.get_dataset(job_id)
+        payload["subJobs"] = [subjob.to_dict() for subjob in store.list_subjobs(job_id)]
+        payload["profile"] = store.get_profile(job_id)
+    except KeyError as exc:
+        typer.secho(f"Job {job_id} not found", err=True, fg=typer.colors.RED)
+        raise typer.Exit(code=1) from exc
+    finally:
+        store.close()
+
+    if as_json:
+        _echo_json(payload)
+        return
+    console = Console()
+    for key in ("jobId", "source", "status", "startedAt", "completedAt", "imageDigest", "logsUrl"):
+        if payload[key] is not None:
+            console.print(f"[bold]{key}[/bold]: {payload[key]}")
+    if payload["dataset"]:
+        dataset = payload["dataset"]
+        console.print(
+            f"[bold]dataset[/bold]: {dataset['dataset_path']} ({dataset['dataset_format']})"
+        )
+    for subjob in payload["subJobs"]:
+        console.print(f"[bold]subJob[/bold]: {subjob['jobId']} {subjob['status']}")
+    console.print("[bold]metrics[/bold]:")
+    console.print_json(data=payload["metrics"])
+    if payload["profile"]:
+        console.print("[bold]profile[/bold]:")
+        console.print_json(data=payload["profile"])
+
+
+@jobs_app.command("stats")
+def jobs_stats(
+    window: str = typer.Option(
+        "day", "--window", help=f"Time bucket: {', '.join(STATS_WINDOWS)}."
+    ),
+    source: Optional[str] = typer.Option(None, "--source", help="Only jobs from this source."),
+    since: Optional[datetime] = _window_option("--since", "Only jobs started at or after this."),
+    until: Optional[datetime] = _window_option("--until", "Only jobs started before this."),
+    job_store: Optional[Path] = _job_store_option(),
+    as_json: bool = _json_option(),
+) -> None:
+    """Throughput per source and time window, aggregated inside SQLite."""
+    from rich.console import Console
+    from rich.table import Table
+
+    store = MigrationJobStore(job_store)
+    try:
+        groups = store.throughput_stats(window=window, source=source, since=since, until=until)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    finally:
+        store.close()
+
+    if as_json:
+        _echo_json({"window": window, "groups": groups})
+        return
+    table = Table(
+        "Source", "Window", "Jobs", "Failed", "Items", "Items/s", "Change", "p50", "p95", "p99"
+    )
+    for group in groups:
+        change = group["throughputChange"]
+        percentiles = group["itemsPerSecondPercentiles"]
+        table.add_row(
+            group["source"],
+            group["window"],
+            str(group["jobs"]),
+            str(group["failed"]),
+            f"{group['items']:,}",
+            _format_number(group["itemsPerSecond"]),
+            "-" if change is None else f"{change:+.1%}",
+            *(_format_number(value) for value in percentiles.values()),
+        )
+    Console().print(table)
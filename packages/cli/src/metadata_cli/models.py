@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from metadata_cli.records import MigrationJobRecord  # noqa: F401 - re-exported
+
 
 class NodeModel(BaseModel):
     id: str
@@ -39,15 +39,3 @@ class DatasetModel(BaseModel):
         if not self.nodes and not self.edges:
             raise ValueError("Dataset must contain at least one node or edge")
         return self
-
-
-@dataclass(slots=True)
-class MigrationJobRecord:
-    job_id: str
-    source: str
-    status: str
-    started_at: datetime
-    completed_at: Optional[datetime] = None
-    metrics: Dict[str, Any] = field(default_factory=dict)
-    image_digest: Optional[str] = None
-    logs_url: Optional[str] = None
@@ -0,0 +1,31 @@
+"""Plain job records, kept free of pydantic so the job store imports quickly."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+@dataclass(slots=True)
+class MigrationJobRecord:
+    job_id: str
+    source: str
+    status: str
+    started_at: datetime
+    completed_at: Optional[datetime] = None
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    image_digest: Optional[str] = None
+    logs_url: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "jobId": self.job_id,
+            "source": self.source,
+            "status": self.status,
+            "startedAt": self.started_at.isoformat(),
+            "completedAt": self.completed_at.isoformat() if self.completed_at else None,
+            "metrics": self.metrics,
+            "imageDigest": self.image_digest,
+            "logsUrl": self.logs_url,
+        }
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+SPLIT_STATUS = 413
+LATENCY_HEADROOM = 0.5
+DECREASE_FACTOR = 0.5
+
+
+@dataclass(slots=True)
+class AdaptiveBatchSizer:
+    """AIMD controller that sizes batches against a per-request latency budget.
+
+    The size grows additively while requests finish well inside the budget and is halved when a
+    request exceeds it or the API answers 413/5xx. It never leaves ``[minimum, maximum]``.
+    """
+
+    initial: int
+    minimum: int
+    maximum: int
+    latency_budget_seconds: float
+    current: int = field(init=False)
+    step: int = field(init=False)
+    increases: int = field(init=False, default=0)
+    decreases: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        if self.minimum <= 0 or self.minimum > self.maximum:
+            raise ValueError("Adaptive batch bounds must satisfy 0 < minimum <= maximum")
+        self.current = min(max(self.initial, self.minimum), self.maximum)
+        self.step = max(1, self.current // 10)
+
+    def observe(self, *, batch_size: int, duration_seconds: float, status: int) -> int:
+        """Feed back one finished request and return the size to use for the next batch."""
+        overloaded = status == SPLIT_STATUS or status >= 500
+        if overloaded or duration_seconds > self.latency_budget_seconds:
+            shrunk = max(self.minimum, int(self.current * DECREASE_FACTOR))
+            if shrunk < self.current:
+                self.current = shrunk
+                self.decreases += 1
+        elif (
+            status < 400
+            and duration_seconds < self.latency_budget_seconds * LATENCY_HEADROOM
+            # A short trailing batch says nothing about whether a larger one would fit.
+            and batch_size >= self.current
+        ):
+            grown = min(self.maximum, self.current + self.step)
+            if grown > self.current:
+                self.current = grown
+                self.increases += 1
+        return self.current
+
+    def can_split(self, batch_size: int) -> bool:
+        return batch_size > self.minimum
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "finalBatchSize": self.current,
+            "minBatchSize": self.minimum,
+            "maxBatchSize": self.maximum,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from metadata_cli.models import EdgeModel, NodeModel
+
+# Actor columns store -1 for "not set", so the encoder can still fall back to the job actor.
+_MISSING = -1
+_encode_properties = json.JSONEncoder(separators=(",", ":")).encode
+
+
+class StringTable:
+    """Interns strings as dense integer indexes.
+
+    Node IDs are stored once however many edges reference them, and types and actors collapse
+    to a handful of entries. ``freeze`` drops the lookup dict once loading is done; indexes
+    stay valid.
+    """
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self._index: Optional[dict[str, int]] = {}
+
+    def add(self, value: str) -> int:
+        if self._index is None:
+            raise RuntimeError("StringTable is frozen")
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def add_optional(self, value: Optional[str]) -> int:
+        return _MISSING if value is None else self.add(value)
+
+    def freeze(self) -> None:
+        self._index = None
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    @property
+    def nbytes(self) -> int:
+        total = sys.getsizeof(self.strings) + sum(map(sys.getsizeof, self.strings))
+        if self._index is not None:
+            total += sys.getsizeof(self._index)
+        return total
+
+
+class CompactRecords:
+    """Nodes or edges of one dataset stored column-wise.
+
+    A pydantic model costs about a kilobyte before its properties (the instance, its
+    ``__dict__``, ``fields_set``, and a separate ``str`` per ID even when thousands of edges
+    reference the same node). Here a record is one row of ``array`` columns: IDs, types, and
+    actors are indexes into a shared ``StringTable`` (``int64`` for ID columns, ``int32`` for
+    the rest), and properties are their compact JSON encoding in one ``bytearray``. Rows are
+    read through short-lived ``CompactNode``/``CompactEdge`` views with the model attributes,
+    so the shipper, pre-flight, and delta code work unchanged; properties are only decoded
+    when a batch is serialized.
+    """
+
+    def __init__(self, resource: str, strings: StringTable):
+        if resource not in ("nodes", "edges"):
+            raise ValueError(f"Unknown resource {resource}")
+        self.resource = resource
+        self.strings = strings
+        self.ids = array("q")
+        self.types = array("i")
+        self.created_by = array("i")
+        self.updated_by = array("i")
+        self.source_ids = array("q")
+        self.target_ids = array("q")
+        self.properties = bytearray()
+        self.property_offsets = array("q", [0])
+
+    def append(self, model: NodeModel | EdgeModel) -> None:
+        add = self.strings.add
+        self.ids.append(add(model.id))
+        self.types.append(add(model.type))
+        self.created_by.append(self.strings.add_optional(model.createdBy))
+        self.updated_by.append(self.strings.add_optional(model.updatedBy))
+        if self.resource == "edges":
+            self.source_ids.append(add(model.sourceId))
+            self.target_ids.append(add(model.targetId))
+        self.properties += _encode_properties(model.properties).encode()
+        self.property_offsets.append(len(self.properties))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, row: int) -> CompactNode | CompactEdge:
+        if not -len(self) <= row < len(self):
+            raise IndexError(row)
+        view = CompactEdge if self.resource == "edges" else CompactNode
+        return view(self, row % len(self))
+
+    def __iter__(self) -> Iterator[CompactNode | CompactEdge]:
+        view = CompactEdge if self.resource == "edges" else CompactNode
+        for row in range(len(self)):
+            yield view(self, row)
+
+    def raw_properties(self, row: int) -> bytes:
+        offsets = self.property_offsets
+        return bytes(self.properties[offsets[row] : offsets[row + 1]])
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by this resource's columns (the shared string table is not included)."""
+        columns = (
+            self.ids,
+            self.types,
+            self.created_by,
+            self.updated_by,
+            self.source_ids,
+            self.target_ids,
+            self.property_offsets,
+        )
+        return sum(column.itemsize * len(column) for column in columns) + len(self.properties)
+
+
+class CompactNode:
+    """Read-only view of one row of a ``CompactRecords``, shaped like ``NodeModel``."""
+
+    __slots__ = ("_records", "_row")
+
+    def __init__(self, records: CompactRecords, row: int):
+        self._records = records
+        self._row = row
+
+    def _string(self, column: array) -> Optional[str]:
+        index = column[self._row]
+        return None if index == _MISSING else self._records.strings.strings[index]
+
+    @property
+    def id(self) -> str:
+        return self._records.strings.strings[self._records.ids[self._row]]
+
+    @property
+    def type(self) -> str:
+        return self._records.strings.strings[self._records.types[self._row]]
+
+    @property
+    def createdBy(self) -> Optional[str]:
+        return self._string(self._records.created_by)
+
+    @property
+    def updatedBy(self) -> Optional[str]:
+        return self._string(self._records.updated_by)
+
+    @property
+    def properties(self) -> dict[str, Any]:
+        """Decoded on every access; only the batch encoder reads it."""
+        return json.loads(self._records.raw_properties(self._row))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r}, type={self.type!r})"
+
+
+class CompactEdge(CompactNode):
+    """Read-only view of one edge row, shaped like ``EdgeModel``."""
+
+    __slots__ = ()
+
+    @property
+    def sourceId(self) -> str:
+        return self._records.strings.strings[self._records.source_ids[self._row]]
+
+    @property
+    def targetId(self) -> str:
+        return self._records.strings.strings[self._records.target_ids[self._row]]
+
+
+@dataclass(slots=True)
+class CompactDataset:
+    """A loaded dataset whose nodes and edges share one string table."""
+
+    strings: StringTable = field(default_factory=StringTable)
+    nodes: CompactRecords = field(init=False)
+    edges: CompactRecords = field(init=False)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.nodes = CompactRecords("nodes", self.strings)
+        self.edges = CompactRecords("edges", self.strings)
+
+    def freeze(self) -> "CompactDataset":
+        self.strings.freeze()
+        return self
+
+    @property
+    def nbytes(self) -> int:
+        return self.strings.nbytes + self.nodes.nbytes + self.edges.nbytes
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+from metadata_cli.db.migrations import connect
+
+DELTA_DB_NAME = "delta-cache.sqlite"
+LOOKUP_CHUNK = 500
+
+
+def content_hash(item: dict[str, Any]) -> bytes:
+    """Stable 128-bit digest of a decorated record (key order does not matter)."""
+    encoded = json.dumps(item, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return blake2b(encoded, digest_size=16).digest()
+
+
+class DeltaCache:
+    """SQLite cache of record content hashes keyed by (org, resource, id).
+
+    ``seen_job_id`` marks records present in the latest run so IDs that disappeared from the
+    dataset can be listed once that run succeeds.
+    """
+
+    def __init__(self, db_path: Path | str):
+        path = Path(db_path)
+        if str(path) != ":memory:":
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = connect(path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS record_hashes (
+                org_id TEXT NOT NULL,
+                resource TEXT NOT NULL,
+                record_id TEXT NOT NULL,
+                content_hash BLOB NOT NULL,
+                job_id TEXT NOT NULL,
+                seen_job_id TEXT NOT NULL,
+                PRIMARY KEY (org_id, resource, record_id)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+    @classmethod
+    def beside(cls, job_store_path: Path | str) -> "DeltaCache":
+        """Open the cache that lives next to a ``MigrationJobStore`` file."""
+        if str(job_store_path) == ":memory:":
+            return cls(":memory:")
+        return cls(Path(job_store_path).parent / DELTA_DB_NAME)
+
+    def lookup(self, org_id: str, resource: str, record_ids: Sequence[str]) -> dict[str, bytes]:
+        known: dict[str, bytes] = {}
+        for start in range(0, len(record_ids), LOOKUP_CHUNK):
+            chunk = record_ids[start : start + LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"""
+                SELECT record_id, content_hash FROM record_hashes
+                 WHERE org_id = ? AND resource = ? AND record_id IN ({placeholders})
+                """,
+                (org_id, resource, *chunk),
+            )
+            known.update(rows)
+        return known
+
+    def mark_seen(self, org_id: str, resource: str, record_ids: Iterable[str], job_id: str) -> None:
+        self._conn.executemany(
+            """
+            UPDATE record_hashes SET seen_job_id = ?
+             WHERE org_id = ? AND resource = ? AND record_id = ?
+            """,
+            ((job_id, org_id, resource, record_id) for record_id in record_ids),
+        )
+        self._conn.commit()
+
+    def commit(
+        self, org_id: str, resource: str, entries: Iterable[tuple[str, bytes]], job_id: str
+    ) -> None:
+        """Store hashes for records the API has acknowledged."""
+        self._conn.executemany(
+            """
+            INSERT INTO record_hashes (org_id, resource, record_id, content_hash, job_id, seen_job_id)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(org_id, resource, record_id) DO UPDATE SET
+              content_hash = excluded.content_hash,
+              job_id = excluded.job_id,
+              seen_job_id = excluded.seen_job_id
+            """,
+            ((org_id, resource, record_id, digest, job_id, job_id) for record_id, digest in entries),
+        )
+        self._conn.commit()
+
+    def vanished(self, org_id: str, resource: str, job_id: str) -> Iterator[str]:
+        """IDs cached for ``org_id`` that the run ``job_id`` did not see."""
+        rows = self._conn.execute(
+            """
+            SELECT record_id FROM record_hashes
+             WHERE org_id = ? AND resource = ? AND seen_job_id != ?
+             ORDER BY record_id
+            """,
+            (org_id, resource, job_id),
+        )
+        for (record_id,) in rows:
+            yield record_id
+
+    def forget(self, org_id: str, resource: str, record_ids: Iterable[str]) -> None:
+        self._conn.executemany(
+            "DELETE FROM record_hashes WHERE org_id = ? AND resource = ? AND record_id = ?",
+            ((org_id, resource, record_id) for record_id in record_ids),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import time
+from array import array
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Callable, Sequence
+
+import httpx
+
+DEFAULT_EJECT_AFTER = 3
+DEFAULT_EJECT_SECONDS = 30.0
+MAX_EJECT_SECONDS = 300.0
+
+
+ENDPOINT_EXTENSION = "metadata_cli.endpoint"
+
+
+def is_endpoint_failure(status: int) -> bool:
+    """5xx answers count against an endpoint's health; 4xx and 429 are about the request."""
+    return status >= 500
+
+
+def served_by(response: httpx.Response) -> Endpoint:
+    """The endpoint that :meth:`EndpointPool.bind` addressed ``response``'s request to."""
+    return response.request.extensions[ENDPOINT_EXTENSION]
+
+
+@dataclass(slots=True)
+class Endpoint:
+    """One API base URL and what has been sent to it."""
+
+    url: str
+    outstanding: int = 0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    ejections: int = 0
+    ejected_until: float = 0.0
+    items: int = 0
+    bytes_sent: int = 0
+    latencies_ms: array = field(default_factory=lambda: array("d"))
+
+    def to_dict(self, elapsed_seconds: float, now: float) -> dict[str, Any]:
+        latencies = sorted(self.latencies_ms)
+
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))], 2)
+
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "ejections": self.ejections,
+            "ejected": self.ejected_until > now,
+            "itemsAccepted": self.items,
+            "bytesSent": self.bytes_sent,
+            "itemsPerSecond": round(self.items / elapsed_seconds, 1) if elapsed_seconds else 0.0,
+            "latencyMs": {
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": round(latencies[-1], 2) if latencies else 0.0,
+            },
+        }
+
+
+class EndpointPool:
+    """Spreads requests over API replicas by least outstanding requests.
+
+    Every send picks the healthy endpoint with the fewest requests in flight (then the fewest
+    sent so far, so an idle pool round-robins). ``eject_after`` consecutive transport errors or
+    5xx answers take an endpoint out for ``eject_seconds``, doubling on each repeat ejection up
+    to ``MAX_EJECT_SECONDS``. A returning endpoint is ejected again on its first failure. When
+    every endpoint is ejected the one due back soonest is used rather than stalling the job.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        *,
+        eject_after: int = DEFAULT_EJECT_AFTER,
+        eject_seconds: float = DEFAULT_EJECT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not urls:
+            raise ValueError("EndpointPool needs at least one URL")
+        self.endpoints = [Endpoint(url) for url in urls]
+        self.eject_after = eject_after
+        self.eject_seconds = eject_seconds
+        self._clock = clock
+        self._started = clock()
+
+    def reset(self) -> None:
+        """Start a new job's statistics; ejections stay in force."""
+        self._started = self._clock()
+        for endpoint in self.endpoints:
+            endpoint.requests = endpoint.failures = endpoint.items = endpoint.bytes_sent = 0
+            endpoint.latencies_ms = array("d")
+
+    @property
+    def urls(self) -> list[str]:
+        return [endpoint.url for endpoint in self.endpoints]
+
+    @property
+    def primary(self) -> Endpoint:
+        return self.endpoints[0]
+
+    def acquire(self) -> Endpoint:
+        now = self._clock()
+        healthy = [endpoint for endpoint in self.endpoints if endpoint.ejected_until <= now]
+        if healthy:
+            endpoint = min(healthy, key=attrgetter("outstanding", "requests"))
+        else:
+            endpoint = min(self.endpoints, key=attrgetter("ejected_until"))
+        endpoint.outstanding += 1
+        endpoint.requests += 1
+        return endpoint
+
+    def bind(self, endpoint: Endpoint, request: httpx.Request) -> httpx.Request:
+        """Address ``request`` (built with a relative URL) to ``endpoint``.
+
+        The bound request carries ``endpoint`` in its extensions, so the response can be
+        credited with :func:`served_by` however httpx normalised the URL.
+        """
+        endpoint.bytes_sent += len(request.content)
+        return httpx.Request(
+            request.method,
+            endpoint.url + request.url.raw_path.decode("ascii"),
+            headers=request.headers,
+            content=request.content,
+            extensions={ENDPOINT_EXTENSION: endpoint},
+        )
+
+    def release(
+        self, endpoint: Endpoint, *, duration_seconds: float, status: int | None = None
+    ) -> bool:
+        """Record one finished send (``status`` is ``None`` for a transport error).
+
+        Returns ``True`` when this failure ejected the endpoint.
+        """
+        endpoint.outstanding -= 1
+        endpoint.latencies_ms.append(duration_seconds * 1000)
+        if status is not None and not is_endpoint_failure(status):
+            endpoint.consecutive_failures = 0
+            return False
+        endpoint.failures += 1
+        endpoint.consecutive_failures += 1
+        if endpoint.consecutive_failures < self.eject_after or len(self.endpoints) == 1:
+            return False
+        now = self._clock()
+        if endpoint.ejected_until > now:
+            return False
+        backoff = self.eject_seconds * 2 ** min(endpoint.ejections, 16)
+        endpoint.ejected_until = now + min(backoff, MAX_EJECT_SECONDS)
+        endpoint.ejections += 1
+        # Back in rotation, a single failure is enough to eject it again.
+        endpoint.consecutive_failures = self.eject_after - 1
+        return True
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        now = self._clock()
+        return {
+            endpoint.url: endpoint.to_dict(now - self._started, now) for endpoint in self.endpoints
+        }
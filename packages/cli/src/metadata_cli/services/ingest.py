@@ -1,120 +1,399 @@
 from __future__ import annotations
 
-import csv
+import asyncio
+import glob
+import hashlib
 import json
 import time
 import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain, count, islice
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Generator,
+    Iterable,
+    Iterator,
+    Sequence,
+    TypeVar,
+)
 
 import httpx
-from pydantic import ValidationError
 
 from metadata_cli.config import CliSettings
 from metadata_cli.db.migrations import MigrationJobStore, MigrationJobRecord
-from metadata_cli.errors import DatasetValidationError, IngestionError
+from metadata_cli.errors import CLIError, DatasetValidationError, IngestionError
 from metadata_cli.models import DatasetModel, EdgeModel, NodeModel
-from metadata_cli.utils.logging import ProgressLogger, get_rss_mb
+from metadata_cli.services.batching import SPLIT_STATUS, AdaptiveBatchSizer
+from metadata_cli.services.compact import CompactDataset, CompactRecords
+from metadata_cli.services.csv_records import iter_csv_records
+from metadata_cli.services.delta import LOOKUP_CHUNK, DeltaCache, content_hash
+from metadata_cli.services.encoding import BatchEncoder, compress_body
+from metadata_cli.services.endpoints import Endpoint, EndpointPool, served_by
+from metadata_cli.services.ndjson_index import NdjsonIndex
+from metadata_cli.services.pipeline import HELD_BATCHES_PER_SLOT, HeldEdgeBatch, NodeDependencies
+from metadata_cli.services.preflight import PreflightReport, run_preflight
+from metadata_cli.services.retry import POISON_STATUSES, RetryPolicy, is_retryable
+from metadata_cli.services.transport import build_async_client, build_client
+from metadata_cli.services.validation import (
+    RecordValidator,
+    build_validator,
+    invalid_json,
+    payload_items,
+)
+from metadata_cli.utils.logging import ProgressLogger, build_logger, get_rss_mb
+from metadata_cli.utils.metrics import IngestMetrics, MetricsServer
+from metadata_cli.utils.profiling import DISABLED, StageProfiler
 
 BATCH_LATENCY_BUDGET_SECONDS = 5.0
 RSS_BUDGET_MB = 256.0
+RESOURCE_MODELS: dict[str, type[NodeModel] | type[EdgeModel]] = {
+    "nodes": NodeModel,
+    "edges": EdgeModel,
+}
 
+DATASET_SUFFIXES: dict[str, tuple[str, ...]] = {
+    "json": (".json",),
+    "ndjson": (".ndjson", ".jsonl"),
+    "csv": (".csv",),
+}
 
-def _batched(items: Sequence, size: int) -> Iterable[Sequence]:
-    for start in range(0, len(items), size):
-        yield items[start : start + size]
+T = TypeVar("T")
+# Exchanges yield a request to send or a delay in seconds to sleep before the next step.
+BatchStep = httpx.Request | float
+BatchExchange = Generator[BatchStep, httpx.Response | None, int]
+
+
+def _batched(items: Iterable[T], size: int | Callable[[], int]) -> Iterator[list[T]]:
+    """Chunk any iterable without materializing it, so generators stay lazy.
+
+    ``size`` may be a callable, re-evaluated before each batch, for adaptive batch sizing.
+    """
+    next_size = size if callable(size) else lambda: size
+    iterator = iter(items)
+    while batch := list(islice(iterator, next_size())):
+        yield batch
+
+
+def fingerprint_dataset(path: Path, *, content: bool = False, chunk_size: int = 1 << 20) -> str:
+    """Identify a dataset file by size and mtime, plus a SHA-256 of its content if asked.
+
+    Hashing reads the whole file, so it is left to jobs that may be resumed (see
+    ``IngestionRunner._seal_fingerprint``).
+    """
+    stat = path.stat()
+    fingerprint = f"{stat.st_size}:{stat.st_mtime_ns}"
+    if not content:
+        return fingerprint
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(chunk_size):
+            digest.update(chunk)
+    return f"{fingerprint}:{digest.hexdigest()}"
+
+
+def dataset_unchanged(path: Path, fingerprint: str) -> bool:
+    """Whether ``path`` still matches ``fingerprint``; the file is hashed only if it has to be."""
+    quick = fingerprint_dataset(path)
+    if fingerprint == quick:
+        return True
+    return fingerprint.startswith(f"{quick}:") and fingerprint == fingerprint_dataset(
+        path, content=True
+    )
+
+
+def _file_key(path: Path) -> tuple[Path, int, int]:
+    stat = path.stat()
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+def expand_dataset_paths(inputs: Sequence[str], data_format: str) -> list[Path]:
+    """Resolve files, directories, and glob patterns into an ordered, de-duplicated file list.
+
+    Directories contribute their files (non-recursively) whose suffix matches ``data_format``;
+    glob patterns (``**`` recurses) and directories are expanded in sorted order.
+    """
+    suffixes = DATASET_SUFFIXES.get(data_format, ())
+    resolved: dict[Path, None] = {}
+    for value in inputs:
+        path = Path(value)
+        if any(char in value for char in "*?["):
+            matches = sorted(Path(match) for match in glob.glob(value, recursive=True))
+            matches = [match for match in matches if match.is_file()]
+        elif path.is_dir():
+            matches = sorted(
+                child for child in path.iterdir() if child.is_file() and child.suffix in suffixes
+            )
+        elif path.is_file():
+            matches = [path]
+        else:
+            raise ValueError(f"Dataset path {value} does not exist")
+        if not matches:
+            raise ValueError(f"No {data_format} dataset files match {value}")
+        resolved.update(dict.fromkeys(matches))
+    return list(resolved)
+
+
+def _collect_results(done: Iterable[asyncio.Task[int]]) -> int:
+    """Sum finished batch tasks, re-raising the first failure after retrieving every result."""
+    errors = [task.exception() for task in done if task.exception() is not None]
+    if errors:
+        raise errors[0]
+    return sum(task.result() for task in done)
 
 
 class DatasetLoader:
-    """Loads and validates ingest datasets."""
+    """Loads and validates ingest datasets.
+
+    Records are validated one at a time by a ``RecordValidator``, so an invalid record is
+    reported with its location and the rest of the file is still checked. With
+    ``parse_workers > 1``, NDJSON and CSV files are parsed and validated in a process pool and
+    the validated records are used as they are.
+    """
 
-    def __init__(self, data_format: str = "json"):
+    def __init__(
+        self,
+        data_format: str = "json",
+        *,
+        parse_workers: int = 1,
+        record_range: tuple[int, int | None] | None = None,
+        sample: int | None = None,
+        profiler: StageProfiler = DISABLED,
+        validator: RecordValidator | None = None,
+    ):
         self._format = data_format
+        self._parse_workers = parse_workers
+        self._record_range = record_range
+        self._sample = sample
+        self._profiler = profiler
+        self.validator = validator or RecordValidator()
+        self._last_compact: tuple[tuple[Path, int, int], CompactDataset] | None = None
+        # Built on the first --range/--sample read of each file and shared by pre-flight, nodes,
+        # and edges; one entry per file, since run_many loads shards in parallel threads.
+        self._indexes: dict[Path, tuple[tuple[Path, int, int], NdjsonIndex]] = {}
 
     def load(self, path: Path) -> DatasetModel:
+        dataset = DatasetModel.model_construct(nodes=[], edges=[], metadata={})
+        for resource, model in self._tagged_models(path, dataset.metadata):
+            getattr(dataset, resource).append(model)
+        if not dataset.nodes and not dataset.edges:
+            raise DatasetValidationError("Dataset must contain at least one node or edge")
+        # Every record was validated on the way in; the container itself needs no second pass.
+        return dataset
+
+    def load_compact(self, path: Path) -> CompactDataset:
+        """Load a whole dataset into array-backed columns (see ``CompactRecords``).
+
+        Same validation as :meth:`load`, but each record is folded into the columns as soon as
+        it is validated, so at most one model is alive at a time.
+        """
+        dataset = CompactDataset()
+        for resource, model in self._tagged_models(path, dataset.metadata):
+            getattr(dataset, resource).append(model)
+        if not dataset.nodes and not dataset.edges:
+            raise DatasetValidationError("Dataset must contain at least one node or edge")
+        return dataset.freeze()
+
+    def _tagged_models(
+        self, path: Path, metadata: dict[str, Any]
+    ) -> Iterator[tuple[str, NodeModel | EdgeModel]]:
+        """``(resource, model)`` of every valid record, reading the file once for both resources.
+
+        A JSON document still has to be parsed in one piece. Raises once the file is read if
+        it failed validation.
+        """
         if not path.exists():
             raise DatasetValidationError(f"Dataset file {path} does not exist")
-        if self._format == "json":
-            payloads = [self._load_json(path)]
-        elif self._format == "ndjson":
-            payloads = list(self._load_ndjson(path))
-        elif self._format == "csv":
-            payloads = [self._load_csv(path)]
+        if self._parallel:
+            records = self.validator.parallel_records(
+                path, self._format, RESOURCE_MODELS, workers=self._parse_workers, metadata=metadata
+            )
+            yield from self._profiler.iterate("validate", records)
         else:
-            raise DatasetValidationError(f"Unsupported dataset format: {self._format}")
+            if self._format == "json":
+                tagged = self._tagged_items(path, [("", self._load_json(path))], metadata)
+            elif self._format == "ndjson":
+                tagged = self._tagged_items(path, self._ndjson_payloads(path), metadata)
+            elif self._format == "csv":
+                tagged = self._csv_records(path)
+            else:
+                raise DatasetValidationError(f"Unsupported dataset format: {self._format}")
+            validate = self._profiler.wrap("validate", self.validator.validate)
+            yield from self.validator.tagged_records(path, tagged, validate)
+        self.validator.check(path)
 
-        combined = self._merge_payloads(payloads)
+    def _compact(self, path: Path) -> CompactDataset:
+        """``load_compact(path)``, reused while the file is unchanged (JSON ``stream`` calls)."""
+        key = _file_key(path)
+        if self._last_compact is None or self._last_compact[0] != key:
+            self._last_compact = None  # let the previous dataset go before loading the next
+            self._last_compact = (key, self.load_compact(path))
+        return self._last_compact[1]
 
-        try:
-            return DatasetModel.model_validate(combined)
-        except ValidationError as exc:
-            raise DatasetValidationError(str(exc)) from exc
+    def _index(self, path: Path) -> NdjsonIndex:
+        """The line index of ``path``, built once and reused while the file is unchanged."""
+        key = _file_key(path)
+        cached = self._indexes.get(path)
+        if cached is None or cached[0] != key:
+            with self._profiler.stage("read"):
+                cached = self._indexes[path] = (key, NdjsonIndex(path))
+        return cached[1]
+
+    def close(self) -> None:
+        """Release the cached line indexes (their memory maps)."""
+        for _, index in self._indexes.values():
+            index.close()
+        self._indexes.clear()
 
-    def _load_json(self, path: Path) -> dict:
+    @property
+    def _parallel(self) -> bool:
+        """Validate in a process pool; --range and --sample only read a few lines."""
+        return (
+            self._parse_workers > 1
+            and self._format in ("ndjson", "csv")
+            and self._record_range is None
+            and self._sample is None
+        )
+
+    def _load_json(self, path: Path) -> Any:
+        with self._profiler.stage("read"):
+            text = path.read_text(encoding="utf-8")
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
+            with self._profiler.stage("parse"):
+                return json.loads(text)
         except json.JSONDecodeError as exc:
             raise DatasetValidationError("Dataset file is not valid JSON") from exc
 
-    def _load_ndjson(self, path: Path) -> Iterable[dict]:
-        payloads: list[dict] = []
-        try:
-            for line in path.read_text(encoding="utf-8").splitlines():
-                if not line.strip():
-                    continue
-                payloads.append(json.loads(line))
-        except json.JSONDecodeError as exc:
-            raise DatasetValidationError("NDJSON file contains invalid JSON line") from exc
-        if not payloads:
-            raise DatasetValidationError("NDJSON file is empty")
-        return payloads
-
-    def _merge_payloads(self, payloads: Sequence[dict]) -> dict:
-        merged: dict[str, list] = {"nodes": [], "edges": [], "metadata": {}}
-        for payload in payloads:
-            merged["nodes"].extend(payload.get("nodes", []))
-            merged["edges"].extend(payload.get("edges", []))
-            merged["metadata"].update(payload.get("metadata", {}))
-        return merged
-
-    def _load_csv(self, path: Path) -> dict:
-        nodes: list[dict] = []
-        edges: list[dict] = []
-        with path.open(encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            for row in reader:
-                clean = {k: v for k, v in row.items() if v not in (None, "", "null")}
-                properties = self._coerce_properties(clean.pop("properties", "{}"))
-                if "sourceId" in clean and "targetId" in clean:
-                    edges.append(
-                        {
-                            "id": clean.get("id") or uuid.uuid4().hex,
-                            "sourceId": clean["sourceId"],
-                            "targetId": clean["targetId"],
-                            "type": clean.get("type", "link"),
-                            "properties": properties,
-                        }
-                    )
-                else:
-                    nodes.append(
-                        {
-                            "id": clean.get("id") or uuid.uuid4().hex,
-                            "type": clean.get("type", "node"),
-                            "properties": properties,
-                            "createdBy": clean.get("createdBy"),
-                        }
-                    )
-        if not nodes and not edges:
-            raise DatasetValidationError("CSV file is empty or missing node/edge rows")
-        return {"nodes": nodes, "edges": edges, "metadata": {}}
+    def _ndjson_payloads(self, path: Path) -> Iterator[tuple[str, Any]]:
+        """Yield ``(location, payload)`` per line; invalid JSON lines go to the validator."""
+        loads = self._profiler.wrap("parse", json.loads)
+        for location, line in self._ndjson_lines(path):
+            try:
+                yield location, loads(line)
+            except json.JSONDecodeError as exc:
+                self.validator.reject(path, invalid_json(location, exc))
 
-    def _coerce_properties(self, raw: str) -> dict:
-        if not raw:
-            return {}
-        try:
-            return json.loads(raw)
-        except json.JSONDecodeError:
-            return {"raw": raw}
+    def _ndjson_lines(self, path: Path) -> Iterator[tuple[str, str | bytes]]:
+        """Yield ``(location, line)`` for non-blank NDJSON lines, honouring --range/--sample."""
+        if self._record_range is None and self._sample is None:
+            with path.open(encoding="utf-8") as handle:
+                for line_no, line in enumerate(self._profiler.iterate("read", handle), start=1):
+                    if line.strip():
+                        yield f"line {line_no}", line
+            return
+        index = self._index(path)
+        if self._sample is not None:
+            records = ((record, index.line(record)) for record in index.sample(self._sample))
+        else:
+            start, stop = self._record_range or (0, None)
+            records = index.iter_range(start, stop)
+        for record, line in self._profiler.iterate("read", records):
+            yield f"record {record + 1}", line
+
+    def _payload_items(
+        self, path: Path, payloads: Iterable[tuple[str, Any]], resource: str
+    ) -> Iterator[tuple[str, Any]]:
+        for location, payload in payloads:
+            items, shape_error = payload_items(payload, resource, location)
+            if shape_error is not None:
+                self.validator.reject(path, shape_error)
+            yield from items
+
+    def _tagged_items(
+        self, path: Path, payloads: Iterable[tuple[str, Any]], metadata: dict[str, Any]
+    ) -> Iterator[tuple[str, str, Any]]:
+        """``(location, resource, record)`` for both resources of each payload, in one pass."""
+        for location, payload in payloads:
+            for resource in RESOURCE_MODELS:
+                items, shape_error = payload_items(payload, resource, location)
+                if shape_error is not None:
+                    self.validator.reject(path, shape_error)
+                for item_location, item in items:
+                    yield item_location, resource, item
+            if isinstance(payload, dict) and isinstance(payload.get("metadata"), dict):
+                metadata.update(payload["metadata"])
+
+    def _csv_records(self, path: Path) -> Iterable[tuple[str, str, dict]]:
+        # The csv module reads and tokenizes in one pass, so both count as "parse".
+        records = iter_csv_records(path)
+        return self._profiler.iterate("parse", records)
+
+    def stream(
+        self, path: Path, resource: str, *, skip: int = 0
+    ) -> Iterator[NodeModel] | Iterator[EdgeModel]:
+        """Lazily yield validated records of one resource (``nodes`` or ``edges``).
+
+        NDJSON and CSV are read line by line, so memory stays bounded by the caller's batch
+        size. JSON documents cannot be parsed incrementally and fall back to :meth:`load`.
+        The first ``skip`` records (already acknowledged by a resumed job) are left out; NDJSON
+        and CSV records are dropped before validation unless --skip-invalid is set.
+        """
+        if not path.exists():
+            raise DatasetValidationError(f"Dataset file {path} does not exist")
+        if resource not in RESOURCE_MODELS:
+            raise ValueError(f"Unknown resource {resource}")
+        if self._format == "json":
+            return islice(getattr(self._compact(path), resource), skip, None)
+        if self._parallel:
+            return islice(self._stream_parallel(path, resource), skip, None)
+        if self._format == "ndjson":
+            return self._stream_ndjson(path, resource, skip)
+        if self._format == "csv":
+            return self._stream_csv(path, resource, skip)
+        raise DatasetValidationError(f"Unsupported dataset format: {self._format}")
+
+    def _stream_ndjson(
+        self, path: Path, resource: str, skip: int
+    ) -> Iterator[NodeModel | EdgeModel]:
+        items = self._payload_items(path, self._ndjson_payloads(path), resource)
+        yield from self._validated(path, resource, items, skip)
+        self.validator.check(path)
+
+    def _stream_csv(self, path: Path, resource: str, skip: int) -> Iterator[NodeModel | EdgeModel]:
+        items = (
+            (location, record)
+            for location, row_resource, record in self._csv_records(path)
+            if row_resource == resource
+        )
+        yield from self._validated(path, resource, items, skip)
+        self.validator.check(path)
+
+    def _stream_parallel(self, path: Path, resource: str) -> Iterator[NodeModel | EdgeModel]:
+        records = self.validator.parallel_records(
+            path, self._format, (resource,), workers=self._parse_workers
+        )
+        for _, model in self._profiler.iterate("validate", records):
+            yield model
+        self.validator.check(path)
+
+    def _validated(
+        self, path: Path, resource: str, items: Iterable[tuple[str, Any]], skip: int = 0
+    ) -> Iterator[NodeModel | EdgeModel]:
+        if skip and not self.validator.skip_invalid:
+            # Any invalid record fails the file, so the acknowledged prefix was all valid.
+            items, skip = islice(items, skip, None), 0
+        validate = self._profiler.wrap("validate", self.validator.validate)
+        records = self.validator.records(path, resource, items, validate=validate)
+        return islice(records, skip, None) if skip else records
+
+
+@dataclass(slots=True)
+class _Shard:
+    """One file of a multi-file ingest and its sub-job."""
+
+    path: Path
+    job_id: str
+    metrics: dict[str, Any] = field(
+        default_factory=lambda: {"nodesAccepted": 0, "edgesAccepted": 0, "batches": 0}
+    )
+    error: CLIError | None = None
+    # Without --stream, loaded with the nodes and held until the edge phase.
+    edges: CompactRecords | None = None
 
 
 class IngestionRunner:
@@ -126,34 +405,129 @@ class IngestionRunner:
         *,
         job_store: MigrationJobStore | None = None,
         http_client: httpx.Client | None = None,
+        async_http_client: httpx.AsyncClient | None = None,
         logger: ProgressLogger | None = None,
+        delta_cache: DeltaCache | None = None,
     ):
         self.settings = settings
         self.job_store = job_store or MigrationJobStore(settings.job_store_path)
-        timeout = httpx.Timeout(connect=10.0, read=60.0, write=30.0, pool=5.0)
-        self.http_client = http_client or httpx.Client(timeout=timeout)
-        self.logger = logger or ProgressLogger()
-        self.loader = DatasetLoader(settings.dataset_format)
+        self.delta_cache = None
+        if settings.delta:
+            self.delta_cache = delta_cache or DeltaCache.beside(self.job_store.path)
+        self.endpoints = EndpointPool(
+            settings.base_urls,
+            eject_after=settings.eject_after,
+            eject_seconds=settings.eject_seconds,
+        )
+        # One connection pool per API endpoint; an injected client serves all of them.
+        self._http_clients = {
+            url: http_client or build_client(settings, url) for url in self.endpoints.urls
+        }
+        self.http_client = self._http_clients[self.endpoints.primary.url]
+        # Created lazily inside the event loop when --concurrency > 1 and none is injected.
+        self.async_http_client = async_http_client
+        self.logger = logger or build_logger(
+            settings.log_format, sample_rate=settings.log_sample_rate
+        )
+        self.profiler = (
+            StageProfiler(tracemalloc_top=settings.profile_tracemalloc)
+            if settings.profile
+            else DISABLED
+        )
+        self.loader = DatasetLoader(
+            settings.dataset_format,
+            parse_workers=settings.parse_workers,
+            record_range=settings.record_range,
+            sample=settings.sample,
+            profiler=self.profiler,
+            validator=build_validator(settings, self.job_store.path),
+        )
+        self._batch_sizers: dict[str, AdaptiveBatchSizer] = {}
+        self._encoder = BatchEncoder(settings.source)
+        self._retry_policy = RetryPolicy(
+            max_retries=settings.max_retries,
+            base_delay=settings.retry_base_delay,
+            max_delay=settings.retry_max_delay,
+        )
+        self.ingest_metrics = IngestMetrics(settings.org_id)
+        # (resource, id) pairs sent to the dead-letter file during the current run.
+        self._quarantined: set[tuple[str, str]] = set()
+        # Delta-cache "seen" marker: the job ID, or the aggregate job ID for run_many.
+        self._delta_run_id = ""
 
-    def run(self, dataset_path: Path) -> MigrationJobRecord:
-        dataset = self.loader.load(dataset_path)
+    def run(self, dataset_path: Path, *, resume_job_id: str | None = None) -> MigrationJobRecord:
+        self.profiler.start()
+        self.endpoints.reset()
+        if self.settings.stream:
+            records = partial(self.loader.stream, dataset_path)
+        else:
+            dataset = self.loader.load_compact(dataset_path)
+            records = partial(getattr, dataset)
+        self.profiler.snapshot("loaded")
+        preflight = self._preflight(records) if self.settings.preflight != "off" else None
 
-        metrics = {"nodesAccepted": 0, "edgesAccepted": 0, "batches": 0}
-        job_id = uuid.uuid4().hex
+        if resume_job_id:
+            job_id = resume_job_id
+            metrics = self._resume_metrics(job_id, dataset_path)
+        else:
+            job_id = uuid.uuid4().hex
+            metrics = {"nodesAccepted": 0, "edgesAccepted": 0, "batches": 0}
+        # Acknowledged records are already in the delta cache, so a resumed delta run filters
+        # them out by content instead of skipping the checkpointed offset.
+        skip = metrics.get("resumedFrom", {}) if self.delta_cache is None else {}
+        if self.settings.stream:
+            nodes, edges = (
+                self.loader.stream(dataset_path, resource, skip=skip.get(resource, 0))
+                for resource in RESOURCE_MODELS
+            )
+        else:
+            nodes, edges = (
+                islice(records(resource), skip.get(resource, 0), None)
+                for resource in RESOURCE_MODELS
+            )
+        if preflight is not None:
+            metrics["preflight"] = preflight.to_dict()
+        self._delta_run_id = job_id
+        if self.delta_cache is not None:
+            nodes = self._only_changed("nodes", nodes, metrics)
+            edges = self._only_changed("edges", edges, metrics)
 
         job_record = self.job_store.start_job(job_id=job_id, source=self.settings.source)
+        self._quarantined.clear()
+        if not resume_job_id:
+            self.job_store.record_dataset(
+                job_id,
+                dataset_path=str(dataset_path.resolve()),
+                dataset_format=self.settings.dataset_format,
+                fingerprint=fingerprint_dataset(dataset_path),
+            )
         start = time.perf_counter()
+        metrics_server = self._start_metrics_server()
+        self._init_batch_sizers()
 
         try:
-            metrics["nodesAccepted"] = self._ship_collection(
-                "nodes", dataset.nodes, job_record.job_id, metrics
-            )
-            metrics["edgesAccepted"] = self._ship_collection(
-                "edges", dataset.edges, job_record.job_id, metrics
-            )
+            if self.settings.concurrency > 1 or self.settings.pipeline:
+                asyncio.run(self._ship_all_async(nodes, edges, job_record.job_id, metrics))
+            else:
+                metrics["nodesAccepted"] = self._ship_collection(
+                    "nodes", nodes, job_record.job_id, metrics
+                )
+                metrics["edgesAccepted"] = self._ship_collection(
+                    "edges", edges, job_record.job_id, metrics
+                )
+            self.profiler.snapshot("shipped")
+            self._record_validation(metrics)
             total_items = metrics["nodesAccepted"] + metrics["edgesAccepted"]
+            skipped = sum(metrics.get("quarantined", {}).values())
+            if "delta" in metrics:
+                skipped += sum(metrics["delta"]["unchanged"].values())
+            if total_items + skipped == 0:
+                raise DatasetValidationError("Dataset must contain at least one node or edge")
+            if self.delta_cache is not None and self.settings.delta_deletions:
+                metrics["delta"]["deleted"] = self._emit_deletions(job_record.job_id)
             duration = time.perf_counter() - start
             metrics["durationSeconds"] = round(duration, 3)
+            metrics["endpoints"] = self.endpoints.to_dict()
             job_record = self.job_store.complete_job(
                 job_record.job_id, status="succeeded", metrics=metrics
             )
@@ -168,67 +542,812 @@ class IngestionRunner:
             )
             return job_record
         except DatasetValidationError:
+            # Only streamed datasets can fail validation after the job has started.
+            self._record_validation(metrics)
+            metrics["endpoints"] = self.endpoints.to_dict()
+            self.job_store.complete_job(job_record.job_id, status="failed", metrics=metrics)
             raise
         except IngestionError as exc:
+            metrics["endpoints"] = self.endpoints.to_dict()
             self.job_store.complete_job(job_record.job_id, status="failed", metrics=metrics)
             raise exc
         except Exception as exc:  # pragma: no cover - defensive
+            metrics["endpoints"] = self.endpoints.to_dict()
             self.job_store.complete_job(job_record.job_id, status="failed", metrics=metrics)
             raise IngestionError(str(exc)) from exc
+        finally:
+            if job_record.status != "succeeded":
+                self._seal_fingerprint(job_record.job_id, dataset_path)
+            self._finish_run(job_record.job_id, metrics_server)
+
+    def run_many(self, dataset_paths: Sequence[Path]) -> MigrationJobRecord:
+        """Ingest several dataset files as one aggregate job with a sub-job per file.
+
+        Up to ``settings.file_workers`` files are shipped at once by tasks on one event loop
+        sharing a single ``httpx.AsyncClient`` connection pool. Every node shard is acknowledged
+        before the first edge shard starts, so edges never reference nodes still in flight. A
+        file that fails marks only its sub-job failed (its edges are skipped); the aggregate
+        job fails if any sub-job did.
+        """
+        self.profiler.start()
+        self.endpoints.reset()
+        records = self._file_records
+        preflight = None
+        if self.settings.preflight != "off":
+            # Edges may point at nodes in another shard, so the check spans all files.
+            preflight = self._preflight(
+                lambda resource: chain.from_iterable(
+                    records(path, resource) for path in dataset_paths
+                )
+            )
+
+        aggregate_id = uuid.uuid4().hex
+        aggregate = self.job_store.start_job(job_id=aggregate_id, source=self.settings.source)
+        self._quarantined.clear()
+        self._delta_run_id = aggregate_id
+        shards: list[_Shard] = []
+        for position, path in enumerate(dataset_paths):
+            shard = _Shard(path=path, job_id=uuid.uuid4().hex)
+            shard.metrics["parentJobId"] = aggregate_id
+            self.job_store.start_job(job_id=shard.job_id, source=self.settings.source)
+            self.job_store.record_dataset(
+                shard.job_id,
+                dataset_path=str(path.resolve()),
+                dataset_format=self.settings.dataset_format,
+                fingerprint=fingerprint_dataset(path),
+            )
+            self.job_store.record_subjob(aggregate_id, shard.job_id, position=position)
+            shards.append(shard)
+
+        start = time.perf_counter()
+        metrics_server = self._start_metrics_server()
+        self._init_batch_sizers()
+        metrics: dict[str, Any] = {"files": len(shards)}
+        if preflight is not None:
+            metrics["preflight"] = preflight.to_dict()
+        try:
+            asyncio.run(self._ship_files_async(shards))
+            self.profiler.snapshot("shipped")
+            for shard in shards:
+                if shard.error is not None:
+                    shard.metrics["error"] = str(shard.error)
+                if invalid := self.loader.validator.report.invalid(shard.path):
+                    shard.metrics["invalidRecords"] = invalid
+                self.job_store.complete_job(
+                    shard.job_id,
+                    status="failed" if shard.error else "succeeded",
+                    metrics=shard.metrics,
+                )
+            for key in ("nodesAccepted", "edgesAccepted", "batches", "retries"):
+                metrics[key] = sum(shard.metrics.get(key, 0) for shard in shards)
+            metrics["subJobs"] = [shard.job_id for shard in shards]
+            self._record_validation(metrics)
+            failed = [shard for shard in shards if shard.error]
+            if failed:
+                metrics["failedFiles"] = [str(shard.path) for shard in failed]
+                raise IngestionError(
+                    f"{len(failed)} of {len(shards)} files failed: "
+                    + "; ".join(f"{shard.path.name}: {shard.error}" for shard in failed[:5])
+                )
+            if self.delta_cache is not None and self.settings.delta_deletions:
+                metrics["deleted"] = self._emit_deletions(aggregate_id)
+            duration = time.perf_counter() - start
+            metrics["durationSeconds"] = round(duration, 3)
+            metrics["endpoints"] = self.endpoints.to_dict()
+            aggregate = self.job_store.complete_job(
+                aggregate_id, status="succeeded", metrics=metrics
+            )
+            total_items = metrics["nodesAccepted"] + metrics["edgesAccepted"]
+            self.logger.throughput(total_items, duration)
+            self.logger.info(
+                "ingest.complete",
+                job_id=aggregate_id,
+                status=aggregate.status,
+                files=len(shards),
+                nodes=metrics["nodesAccepted"],
+                edges=metrics["edgesAccepted"],
+                batches=metrics["batches"],
+            )
+            return aggregate
+        except CLIError:
+            metrics["endpoints"] = self.endpoints.to_dict()
+            self.job_store.complete_job(aggregate_id, status="failed", metrics=metrics)
+            raise
+        except Exception as exc:  # pragma: no cover - defensive
+            metrics["endpoints"] = self.endpoints.to_dict()
+            self.job_store.complete_job(aggregate_id, status="failed", metrics=metrics)
+            raise IngestionError(str(exc)) from exc
+        finally:
+            self._finish_run(aggregate_id, metrics_server)
+
+    def _file_records(self, path: Path, resource: str) -> Iterator[NodeModel | EdgeModel]:
+        """One resource of one file for pre-flight; without --stream each call loads the file."""
+        if self.settings.stream:
+            return self.loader.stream(path, resource)
+        return iter(getattr(self.loader.load_compact(path), resource))
+
+    async def _shard_records(
+        self, shard: _Shard, resource: str
+    ) -> Iterator[NodeModel | EdgeModel]:
+        """One resource of a shard; without --stream the file is loaded once, with its nodes.
+
+        The load parses and validates the whole file, so it runs in a worker thread rather than
+        stalling the requests of the other shards on the event loop.
+        """
+        if self.settings.stream:
+            return self.loader.stream(shard.path, resource)
+        if resource == "nodes":
+            dataset = await asyncio.to_thread(self.loader.load_compact, shard.path)
+            shard.edges = dataset.edges
+            return iter(dataset.nodes)
+        edges, shard.edges = shard.edges, None
+        return iter(edges or ())
+
+    @asynccontextmanager
+    async def _async_clients(
+        self, max_connections: int
+    ) -> AsyncIterator[dict[str, httpx.AsyncClient]]:
+        """An ``httpx.AsyncClient`` per API endpoint (or the injected one), closed on exit."""
+        if self.async_http_client is not None:
+            yield dict.fromkeys(self.endpoints.urls, self.async_http_client)
+            return
+        clients = {
+            url: build_async_client(self.settings, url, max_connections=max_connections)
+            for url in self.endpoints.urls
+        }
+        try:
+            yield clients
+        finally:
+            for client in clients.values():
+                await client.aclose()
+
+    async def _ship_files_async(self, shards: Sequence[_Shard]) -> None:
+        slots = asyncio.Semaphore(self.settings.file_workers)
+
+        async def ship(shard: _Shard, resource: str) -> None:
+            async with slots:
+                if shard.error is not None:
+                    return
+                try:
+                    items: Iterable[Any] = await self._shard_records(shard, resource)
+                    if self.delta_cache is not None:
+                        items = self._only_changed(resource, items, shard.metrics)
+                    shard.metrics[f"{resource}Accepted"] = await self._ship_collection_async(
+                        clients, resource, items, shard.job_id, shard.metrics
+                    )
+                except CLIError as exc:
+                    shard.error, shard.edges = exc, None
+                    self.logger.warn(
+                        "ingest.file_failed", file=str(shard.path), endpoint=resource, error=exc
+                    )
+
+        connections = self.settings.concurrency * self.settings.file_workers
+        async with self._async_clients(connections) as clients:
+            for resource in ("nodes", "edges"):
+                await asyncio.gather(*(ship(shard, resource) for shard in shards))
+
+    def _start_metrics_server(self) -> MetricsServer | None:
+        if self.settings.metrics_port is None:
+            return None
+        server = MetricsServer(self.ingest_metrics, self.settings.metrics_port).start()
+        self.logger.info("metrics.serving", port=server.port)
+        return server
+
+    def _init_batch_sizers(self) -> None:
+        if not self.settings.adaptive_batching:
+            return
+        # One controller per resource: node and edge payloads have very different sizes.
+        self._batch_sizers = {
+            resource: AdaptiveBatchSizer(
+                initial=self.settings.batch_size,
+                minimum=self.settings.min_batch_size,
+                maximum=self.settings.max_batch_size,
+                latency_budget_seconds=BATCH_LATENCY_BUDGET_SECONDS,
+            )
+            for resource in RESOURCE_MODELS
+        }
+
+    def _record_validation(self, metrics: dict[str, Any]) -> None:
+        report = self.loader.validator.report
+        if not report.invalid_records:
+            return
+        metrics["validation"] = report.to_dict()
+        if self.loader.validator.skip_invalid:
+            self.logger.warn(
+                "validation.skipped_invalid",
+                records=report.invalid_records,
+                errors=report.errors,
+                report=str(report.path),
+            )
+
+    def _finish_run(self, job_id: str, metrics_server: MetricsServer | None) -> None:
+        self.loader.validator.report.write()
+        self.loader.close()
+        if self.profiler.enabled:
+            self.job_store.record_profile(job_id, self.profiler.report())
+            self.logger.info("profile.stored", job_id=job_id)
+        if self.settings.metrics_textfile:
+            self.ingest_metrics.write_textfile(self.settings.metrics_textfile)
+        if metrics_server is not None:
+            metrics_server.close()
+
+    def _preflight(self, records: Callable[[str], Iterable[Any]]) -> PreflightReport:
+        """Check duplicate IDs and dangling edges before anything is sent."""
+        report = run_preflight(partial(records, "nodes"), partial(records, "edges"))
+        fields = {
+            "nodes": report.nodes,
+            "edges": report.edges,
+            "duplicate_node_ids": report.duplicate_nodes,
+            "duplicate_edge_ids": report.duplicate_edges,
+            "dangling_edges": report.dangling_edges,
+        }
+        if report.ok:
+            self.logger.info("preflight.passed", **fields)
+        elif self.settings.preflight == "strict":
+            raise DatasetValidationError(f"Pre-flight check failed: {report.summary()}")
+        else:
+            self.logger.warn("preflight.issues", **fields)
+        return report
+
+    def _seal_fingerprint(self, job_id: str, dataset_path: Path) -> None:
+        """Add a content hash to the fingerprint of a job that did not finish.
+
+        Only such jobs can be resumed, so successful runs never read the file a second time.
+        A file that changed during the run keeps its size/mtime fingerprint and will not match.
+        """
+        dataset = self.job_store.get_dataset(job_id)
+        if dataset is None or dataset["fingerprint"] != fingerprint_dataset(dataset_path):
+            return
+        self.job_store.record_dataset(
+            job_id,
+            dataset_path=dataset["dataset_path"],
+            dataset_format=dataset["dataset_format"],
+            fingerprint=fingerprint_dataset(dataset_path, content=True),
+        )
+
+    def _resume_metrics(self, job_id: str, dataset_path: Path) -> dict:
+        """Validate that ``job_id`` can be resumed against the current file and seed its metrics."""
+        try:
+            previous = self.job_store.get_job(job_id)
+        except KeyError as exc:
+            raise IngestionError(f"Cannot resume unknown job {job_id}") from exc
+        if previous.status == "succeeded":
+            raise IngestionError(f"Job {job_id} already succeeded; nothing to resume")
+        dataset = self.job_store.get_dataset(job_id)
+        if dataset is None:
+            raise IngestionError(f"Job {job_id} has no recorded dataset to resume from")
+        if dataset["dataset_format"] != self.settings.dataset_format:
+            raise IngestionError(
+                f"Job {job_id} read a {dataset['dataset_format']} dataset, "
+                f"not {self.settings.dataset_format}"
+            )
+        if not dataset_unchanged(dataset_path, dataset["fingerprint"]):
+            raise IngestionError(
+                f"Dataset changed since job {job_id} started ({dataset['dataset_path']}); "
+                "refusing to resume"
+            )
+        resumed = {
+            resource: self.job_store.acknowledged_offset(job_id, resource)
+            for resource in RESOURCE_MODELS
+        }
+        return {
+            **previous.metrics,
+            "nodesAccepted": resumed["nodes"],
+            "edgesAccepted": resumed["edges"],
+            "batches": previous.metrics.get("batches", 0),
+            "resumedFrom": resumed,
+        }
 
     def _ship_collection(
         self,
         resource: str,
-        items: Sequence[NodeModel] | Sequence[EdgeModel],
+        items: Iterable[NodeModel] | Iterable[EdgeModel],
         job_id: str,
-        metrics: dict[str, int | float],
+        metrics: dict[str, Any],
     ) -> int:
-        if not items:
-            return 0
-
-        total = 0
-        path = f"/orgs/{self.settings.org_id}/{resource}"
-        url = f"{self.settings.base_url}{path}"
-
-        for batch in _batched(items, self.settings.batch_size):
-            batch_start = time.perf_counter()
-            payload = {
-                "items": [
-                    self._decorate_item(model).model_dump(by_alias=True) for model in batch
-                ],
-                "jobId": job_id,
-            }
-            response = self.http_client.post(url, headers=self.settings.default_headers, json=payload)
-            metrics["batches"] += 1
-            duration = time.perf_counter() - batch_start
-            self.logger.log_batch(
-                endpoint=resource,
-                batch_size=len(batch),
-                status=response.status_code,
-                duration_seconds=duration,
-                rss_mb=get_rss_mb(),
-                latency_budget_seconds=BATCH_LATENCY_BUDGET_SECONDS,
-                rss_budget_mb=RSS_BUDGET_MB,
+        total = offset = self.job_store.acknowledged_offset(job_id, resource)
+        batch_index = self.job_store.next_batch_index(job_id, resource)
+
+        for batch in self._batches(resource, items):
+            total += self._drive(self._exchange(resource, batch, job_id, metrics))
+            self._acknowledge(job_id, resource, batch, batch_index, offset)
+            batch_index += 1
+            offset += len(batch)
+
+        return total
+
+    async def _ship_all_async(
+        self,
+        nodes: Iterable[NodeModel],
+        edges: Iterable[EdgeModel],
+        job_id: str,
+        metrics: dict[str, Any],
+    ) -> None:
+        # With --pipeline, node and edge batches each get their own --concurrency window.
+        windows = len(RESOURCE_MODELS) if self.settings.pipeline else 1
+        async with self._async_clients(self.settings.concurrency * windows) as clients:
+            if self.settings.pipeline:
+                await self._ship_pipelined_async(clients, nodes, edges, job_id, metrics)
+                return
+            # Nodes are fully acknowledged before the first edge batch leaves so edges never
+            # reference nodes that are still in flight.
+            metrics["nodesAccepted"] = await self._ship_collection_async(
+                clients, "nodes", nodes, job_id, metrics
             )
-            if response.status_code >= 400:
-                raise IngestionError(
-                    f"{resource} request failed with status {response.status_code}"
-                )
-            total += len(batch)
+            metrics["edgesAccepted"] = await self._ship_collection_async(
+                clients, "edges", edges, job_id, metrics
+            )
+
+    async def _ship_pipelined_async(
+        self,
+        clients: dict[str, httpx.AsyncClient],
+        nodes: Iterable[NodeModel],
+        edges: Iterable[EdgeModel],
+        job_id: str,
+        metrics: dict[str, Any],
+    ) -> None:
+        """Ship nodes and edges side by side, releasing an edge batch once its nodes are in.
+
+        Each resource keeps up to ``settings.concurrency`` batches in flight. Edge batches are
+        still cut in file order, so checkpoints and ``--resume`` work as in the phased path; up
+        to ``HELD_BATCHES_PER_SLOT * concurrency`` of them are read ahead and held until
+        ``NodeDependencies`` clears them. The node ID map costs one dict entry per node.
+        """
+        dependencies = NodeDependencies()
+        offsets: dict[str, int] = {}
+        batch_indexes: dict[str, int] = {}
+        for resource in RESOURCE_MODELS:
+            offsets[resource] = self.job_store.acknowledged_offset(job_id, resource)
+            batch_indexes[resource] = self.job_store.next_batch_index(job_id, resource)
+            metrics[f"{resource}Accepted"] = offsets[resource]
+        node_batches = self._batches("nodes", nodes)
+        edge_batches = self._batches("edges", edges)
+        held: list[HeldEdgeBatch] = []
+        hold_limit = HELD_BATCHES_PER_SLOT * self.settings.concurrency
+        edges_read = False
+        stats = metrics.setdefault(
+            "pipeline", {"overlappedEdgeBatches": 0, "heldEdgeBatchesPeak": 0}
+        )
+        in_flight: dict[asyncio.Task[int], str] = {}
+        running = dict.fromkeys(RESOURCE_MODELS, 0)
+
+        async def send(
+            resource: str,
+            batch: list[NodeModel] | list[EdgeModel],
+            batch_index: int,
+            start_offset: int,
+            sequence: int | None = None,
+        ) -> int:
+            accepted = await self._drive_async(
+                clients, self._exchange(resource, batch, job_id, metrics)
+            )
+            self._acknowledge(job_id, resource, batch, batch_index, start_offset)
+            if sequence is not None:
+                dependencies.acknowledge(sequence)
+            return accepted
+
+        def start(resource: str, step: Coroutine[Any, Any, int]) -> None:
+            in_flight[asyncio.create_task(step)] = resource
+            running[resource] += 1
+
+        def fill() -> None:
+            nonlocal edges_read
+            while True:
+                while not edges_read and len(held) < hold_limit:
+                    batch = next(edge_batches, None)
+                    if batch is None:
+                        edges_read = True
+                        break
+                    held.append(dependencies.hold(batch, batch_indexes["edges"], offsets["edges"]))
+                    batch_indexes["edges"] += 1
+                    offsets["edges"] += len(batch)
+                stats["heldEdgeBatchesPeak"] = max(stats["heldEdgeBatchesPeak"], len(held))
+                if running["edges"] < self.settings.concurrency:
+                    position = dependencies.first_ready(held)
+                    if position is not None:
+                        edge = held.pop(position)
+                        if not dependencies.settled:
+                            stats["overlappedEdgeBatches"] += 1
+                        step = send("edges", edge.batch, edge.batch_index, edge.start_offset)
+                        start("edges", step)
+                        continue
+                if running["nodes"] >= self.settings.concurrency or dependencies.exhausted:
+                    return
+                batch = next(node_batches, None)
+                if batch is None:
+                    # Endpoints still unseen belong to nodes that already exist server-side.
+                    dependencies.exhausted = True
+                    continue
+                sequence = dependencies.add_batch(node.id for node in batch)
+                step = send("nodes", batch, batch_indexes["nodes"], offsets["nodes"], sequence)
+                start("nodes", step)
+                batch_indexes["nodes"] += 1
+                offsets["nodes"] += len(batch)
+
+        try:
+            while True:
+                fill()
+                if not in_flight:
+                    break
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for resource in RESOURCE_MODELS:
+                    finished = [task for task in done if in_flight[task] == resource]
+                    running[resource] -= len(finished)
+                    metrics[f"{resource}Accepted"] += _collect_results(finished)
+                for task in done:
+                    del in_flight[task]
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _ship_collection_async(
+        self,
+        clients: dict[str, httpx.AsyncClient],
+        resource: str,
+        items: Iterable[NodeModel] | Iterable[EdgeModel],
+        job_id: str,
+        metrics: dict[str, Any],
+    ) -> int:
+        """Ship batches keeping up to ``settings.concurrency`` requests in flight."""
+        total = offset = self.job_store.acknowledged_offset(job_id, resource)
+        batch_index = self.job_store.next_batch_index(job_id, resource)
+        in_flight: set[asyncio.Task[int]] = set()
+
+        async def send(
+            batch: list[NodeModel] | list[EdgeModel], batch_index: int, start_offset: int
+        ) -> int:
+            accepted = await self._drive_async(
+                clients, self._exchange(resource, batch, job_id, metrics)
+            )
+            self._acknowledge(job_id, resource, batch, batch_index, start_offset)
+            return accepted
+
+        try:
+            for batch in self._batches(resource, items):
+                if len(in_flight) >= self.settings.concurrency:
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    total += _collect_results(done)
+                in_flight.add(asyncio.create_task(send(batch, batch_index, offset)))
+                batch_index += 1
+                offset += len(batch)
+            while in_flight:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                total += _collect_results(done)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
 
         return total
 
-    def _decorate_item(self, model: NodeModel | EdgeModel) -> NodeModel | EdgeModel:
-        payload = model.model_copy()
-        actor = self.settings.source
-        if isinstance(payload, NodeModel):
-            if not payload.createdBy:
-                payload.createdBy = actor
-            if not payload.updatedBy:
-                payload.updatedBy = payload.createdBy
-        else:
-            if not payload.createdBy:
-                payload.createdBy = actor
-            if not payload.updatedBy:
-                payload.updatedBy = payload.createdBy
-        return payload
+    def _acknowledge(
+        self,
+        job_id: str,
+        resource: str,
+        batch: Sequence[NodeModel | EdgeModel],
+        batch_index: int,
+        start_offset: int,
+    ) -> None:
+        self.job_store.record_checkpoint(
+            job_id,
+            resource=resource,
+            batch_index=batch_index,
+            start_offset=start_offset,
+            item_count=len(batch),
+        )
+        if self.delta_cache is not None:
+            item, org_id = self._encoder.item, self.settings.org_id
+            accepted = [model for model in batch if (resource, model.id) not in self._quarantined]
+            self.delta_cache.commit(
+                org_id,
+                resource,
+                [(model.id, content_hash(item(model))) for model in accepted],
+                self._delta_run_id,
+            )
+            if len(accepted) < len(batch):
+                # Quarantined records keep their old hash (so the next run retries them) but
+                # are still in the dataset, so they must not be reported as deleted.
+                self.delta_cache.mark_seen(
+                    org_id,
+                    resource,
+                    [model.id for model in batch if (resource, model.id) in self._quarantined],
+                    self._delta_run_id,
+                )
+
+    def _only_changed(
+        self, resource: str, items: Iterable[T], metrics: dict[str, Any]
+    ) -> Iterator[T]:
+        """Drop records whose decorated content matches the delta cache.
+
+        Unchanged records are only marked as seen by the current run; changed ones get their
+        new hash in ``_acknowledge`` once the API has accepted their batch.
+        """
+        delta = metrics.setdefault("delta", {"changed": {}, "unchanged": {}})
+        delta["changed"].setdefault(resource, 0)
+        delta["unchanged"].setdefault(resource, 0)
+        org_id, item = self.settings.org_id, self._encoder.item
+        for chunk in _batched(items, LOOKUP_CHUNK):
+            hashes = [content_hash(item(model)) for model in chunk]
+            known = self.delta_cache.lookup(org_id, resource, [model.id for model in chunk])
+            unchanged = [
+                model.id for model, digest in zip(chunk, hashes) if known.get(model.id) == digest
+            ]
+            self.delta_cache.mark_seen(org_id, resource, unchanged, self._delta_run_id)
+            delta["unchanged"][resource] += len(unchanged)
+            delta["changed"][resource] += len(chunk) - len(unchanged)
+            for model, digest in zip(chunk, hashes):
+                if known.get(model.id) != digest:
+                    yield model
+
+    def _emit_deletions(self, job_id: str) -> dict[str, int]:
+        """Write cached IDs missing from this run to ``settings.delta_deletions`` as NDJSON.
+
+        Edges are listed before nodes so they can be removed first. Reported IDs are dropped
+        from the cache, so each deletion is emitted once.
+        """
+        counts: dict[str, int] = {}
+        org_id = self.settings.org_id
+        # Records left out by --skip-invalid are still in the dataset, just not shipped.
+        for resource, record_ids in self.loader.validator.invalid_ids.items():
+            self.delta_cache.mark_seen(org_id, resource, record_ids, job_id)
+        with self.settings.delta_deletions.open("w", encoding="utf-8") as handle:
+            for resource in ("edges", "nodes"):
+                vanished = list(self.delta_cache.vanished(org_id, resource, job_id))
+                for record_id in vanished:
+                    handle.write(json.dumps({"resource": resource, "id": record_id}) + "\n")
+                self.delta_cache.forget(org_id, resource, vanished)
+                counts[resource] = len(vanished)
+        self.logger.info("delta.deletions", path=str(self.settings.delta_deletions), **counts)
+        return counts
+
+    def _batches(self, resource: str, items: Iterable[T]) -> Iterator[list[T]]:
+        sizer = self._batch_sizers.get(resource)
+        if sizer is None:
+            return _batched(items, self.settings.batch_size)
+        return _batched(items, lambda: sizer.current)
+
+    def _drive(self, exchange: BatchExchange) -> int:
+        """Run a batch exchange to completion on the synchronous clients."""
+        try:
+            step = next(exchange)
+            while True:
+                if not isinstance(step, httpx.Request):
+                    time.sleep(step)
+                    step = exchange.send(None)
+                    continue
+                endpoint = self.endpoints.acquire()
+                sent_at = time.perf_counter()
+                try:
+                    with self.profiler.stage("http"):
+                        response = self._http_clients[endpoint.url].send(
+                            self.endpoints.bind(endpoint, step)
+                        )
+                except httpx.TransportError as exc:
+                    self._release(endpoint, sent_at, None)
+                    step = exchange.throw(exc)
+                else:
+                    self._release(endpoint, sent_at, response.status_code)
+                    step = exchange.send(response)
+        except StopIteration as stop:
+            return stop.value
+
+    async def _drive_async(
+        self, clients: dict[str, httpx.AsyncClient], exchange: BatchExchange
+    ) -> int:
+        """Run a batch exchange to completion on the async clients."""
+        try:
+            step = next(exchange)
+            while True:
+                if not isinstance(step, httpx.Request):
+                    await asyncio.sleep(step)
+                    step = exchange.send(None)
+                    continue
+                endpoint = self.endpoints.acquire()
+                sent_at = time.perf_counter()
+                try:
+                    with self.profiler.stage("http"):
+                        response = await clients[endpoint.url].send(
+                            self.endpoints.bind(endpoint, step)
+                        )
+                except httpx.TransportError as exc:
+                    self._release(endpoint, sent_at, None)
+                    step = exchange.throw(exc)
+                else:
+                    self._release(endpoint, sent_at, response.status_code)
+                    step = exchange.send(response)
+        except StopIteration as stop:
+            return stop.value
+
+    def _release(self, endpoint: Endpoint, sent_at: float, status: int | None) -> None:
+        duration = time.perf_counter() - sent_at
+        if self.endpoints.release(endpoint, duration_seconds=duration, status=status):
+            self.logger.warn(
+                "endpoint.ejected",
+                url=endpoint.url,
+                ejections=endpoint.ejections,
+                seconds=round(endpoint.ejected_until - time.monotonic(), 1),
+            )
+
+    def _exchange(
+        self,
+        resource: str,
+        batch: Sequence[NodeModel | EdgeModel],
+        job_id: str,
+        metrics: dict[str, Any],
+    ) -> BatchExchange:
+        """Deliver one batch, yielding HTTP requests and receiving their responses.
+
+        Keeping the protocol free of I/O lets the sync and async clients share the same
+        accounting, retries, 413 split-and-resend, and 400/422 bisection.
+        """
+        batch_start = time.perf_counter()
+        headers = self.settings.default_headers
+        with self.profiler.stage("decorate"):
+            items = self._encoder.decorate(batch)
+        with self.profiler.stage("serialize"):
+            body = self._encoder.serialize(items, job_id)
+        del items
+        if self.settings.compression:
+            raw_size = len(body)
+            with self.profiler.stage("compress"):
+                body = compress_body(body, self.settings.compression)
+            headers["content-encoding"] = self.settings.compression
+            self._record_compression(metrics, raw_size, len(body))
+        self.ingest_metrics.observe_request_bytes(resource, len(body))
+        request = httpx.Request(
+            "POST", self._resource_path(resource), headers=headers, content=body
+        )
+        response = yield from self._send_with_retry(resource, request, metrics)
+        endpoint = served_by(response)
+        sizer = self._batch_sizers.get(resource)
+        if sizer and response.status_code == SPLIT_STATUS and sizer.can_split(len(batch)):
+            self._record_batch(
+                resource, batch, response, endpoint, batch_start, metrics, raise_for_status=False
+            )
+            metrics["batchesSplit"] = metrics.get("batchesSplit", 0) + 1
+            part_size = min(sizer.current, (len(batch) + 1) // 2)
+            accepted = 0
+            for part in _batched(batch, part_size):
+                accepted += yield from self._exchange(resource, part, job_id, metrics)
+            return accepted
+        if self.settings.dead_letter_path and response.status_code in POISON_STATUSES:
+            self._record_batch(
+                resource, batch, response, endpoint, batch_start, metrics, raise_for_status=False
+            )
+            if len(batch) == 1:
+                self._quarantine(resource, batch[0], response, metrics)
+                return 0
+            # Bisect until the records the API rejects are isolated; the rest still lands.
+            metrics["batchesBisected"] = metrics.get("batchesBisected", 0) + 1
+            accepted = 0
+            for part in _batched(batch, (len(batch) + 1) // 2):
+                accepted += yield from self._exchange(resource, part, job_id, metrics)
+            return accepted
+        return self._record_batch(resource, batch, response, endpoint, batch_start, metrics)
+
+    def _send_with_retry(
+        self, resource: str, request: httpx.Request, metrics: dict[str, Any]
+    ) -> Generator[BatchStep, httpx.Response | None, httpx.Response]:
+        """Send ``request``, backing off and resending on 429/5xx and connection errors.
+
+        The last response is returned once retries run out so the caller reports its status;
+        a connection error on the last attempt becomes an ``IngestionError``.
+        """
+        policy = self._retry_policy
+        for attempt in count():
+            try:
+                response = yield request
+            except httpx.TransportError as exc:
+                if attempt >= policy.max_retries:
+                    self.ingest_metrics.count_failure(resource)
+                    raise IngestionError(f"{resource} request failed: {exc}") from exc
+                delay, reason = policy.backoff(attempt), type(exc).__name__
+            else:
+                if not is_retryable(response.status_code) or attempt >= policy.max_retries:
+                    return response
+                delay = policy.backoff(attempt, response.headers.get("retry-after"))
+                reason = str(response.status_code)
+            metrics["retries"] = metrics.get("retries", 0) + 1
+            self.ingest_metrics.count_retry(resource)
+            self.logger.warn(
+                "batch.retry",
+                endpoint=resource,
+                attempt=attempt + 1,
+                reason=reason,
+                delay_seconds=round(delay, 3),
+            )
+            yield delay
+
+    def _quarantine(
+        self,
+        resource: str,
+        model: NodeModel | EdgeModel,
+        response: httpx.Response,
+        metrics: dict[str, Any],
+    ) -> None:
+        """Append a record the API rejected on its own to the dead-letter NDJSON file."""
+        entry = {
+            "resource": resource,
+            "status": response.status_code,
+            "error": response.text[:1000],
+            "record": self._encoder.item(model),
+        }
+        with self.settings.dead_letter_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry) + "\n")
+        self._quarantined.add((resource, model.id))
+        quarantined = metrics.setdefault("quarantined", {})
+        quarantined[resource] = quarantined.get(resource, 0) + 1
+        self.logger.warn(
+            "batch.quarantined", endpoint=resource, id=model.id, status=response.status_code
+        )
+
+    def _record_compression(self, metrics: dict[str, Any], raw_size: int, sent_size: int) -> None:
+        """Keep running totals and the ratio range, not a per-batch list that grows with the job."""
+        ratio = round(sent_size / raw_size, 4) if raw_size else 1.0
+        stats = metrics.setdefault(
+            "compression",
+            {
+                "algorithm": self.settings.compression,
+                "batches": 0,
+                "rawBytes": 0,
+                "compressedBytes": 0,
+                "minRatio": ratio,
+                "maxRatio": ratio,
+            },
+        )
+        stats["batches"] += 1
+        stats["rawBytes"] += raw_size
+        stats["compressedBytes"] += sent_size
+        stats["minRatio"] = min(stats["minRatio"], ratio)
+        stats["maxRatio"] = max(stats["maxRatio"], ratio)
+        stats["ratio"] = round(stats["compressedBytes"] / stats["rawBytes"], 4)
+
+    def _resource_path(self, resource: str) -> str:
+        """Relative to the API base URL; ``EndpointPool.bind`` picks the endpoint per send."""
+        return f"/orgs/{self.settings.org_id}/{resource}"
+
+    def _record_batch(
+        self,
+        resource: str,
+        batch: Sequence[NodeModel | EdgeModel],
+        response: httpx.Response,
+        endpoint: Endpoint,
+        batch_start: float,
+        metrics: dict[str, Any],
+        *,
+        raise_for_status: bool = True,
+    ) -> int:
+        metrics["batches"] += 1
+        duration = time.perf_counter() - batch_start
+        rss_mb = get_rss_mb()
+        self.ingest_metrics.observe_batch(
+            resource,
+            duration_ms=duration * 1000,
+            items=len(batch),
+            status=response.status_code,
+            rss_mb=rss_mb,
+        )
+        self.logger.log_batch(
+            endpoint=resource,
+            batch_size=len(batch),
+            status=response.status_code,
+            duration_seconds=duration,
+            rss_mb=rss_mb,
+            latency_budget_seconds=BATCH_LATENCY_BUDGET_SECONDS,
+            rss_budget_mb=RSS_BUDGET_MB,
+        )
+        sizer = self._batch_sizers.get(resource)
+        if sizer:
+            sizer.observe(
+                batch_size=len(batch), duration_seconds=duration, status=response.status_code
+            )
+            metrics.setdefault("adaptiveBatching", {})[resource] = sizer.summary()
+        if raise_for_status and response.status_code >= 400:
+            raise IngestionError(f"{resource} request failed with status {response.status_code}")
+        endpoint.items += len(batch)
+        return len(batch)
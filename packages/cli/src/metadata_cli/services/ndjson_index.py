@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import mmap
+from array import array
+from pathlib import Path
+from typing import Iterator
+
+BLANK_BYTES = frozenset(b" \t\r")
+
+
+class NdjsonIndex:
+    """Compact line-offset index over a memory-mapped NDJSON file.
+
+    Stores the start offset of every non-blank line in an ``array('q')`` (8 bytes per record),
+    so any record or record range can be re-read without rescanning the file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        # The map keeps its own descriptor, so the file itself need not stay open.
+        with path.open("rb") as handle:
+            size = path.stat().st_size
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.size = size
+        self.offsets = array("q")
+        self._build()
+
+    def _build(self) -> None:
+        if self._map is None:
+            return
+        mm, offsets, size = self._map, self.offsets, self.size
+        start = 0
+        while start < size:
+            end = mm.find(b"\n", start)
+            if end == -1:
+                end = size
+            # Only copy the line to test for blankness when it starts with whitespace.
+            if end > start and (mm[start] not in BLANK_BYTES or mm[start:end].strip()):
+                offsets.append(start)
+            start = end + 1
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __enter__(self) -> "NdjsonIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def line(self, record: int) -> bytes:
+        """Return the raw bytes of record ``record`` (0-based, blank lines excluded)."""
+        if self._map is None:
+            raise IndexError(record)
+        start = self.offsets[record]
+        end = self._map.find(b"\n", start)
+        return self._map[start : self.size if end == -1 else end]
+
+    def iter_range(self, start: int = 0, stop: int | None = None) -> Iterator[tuple[int, bytes]]:
+        """Yield ``(record, raw_line)`` for records in ``[start, stop)``."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        for record in range(max(start, 0), stop):
+            yield record, self.line(record)
+
+    def sample(self, count: int) -> list[int]:
+        """Pick ``count`` records spread evenly across the file (always including the first)."""
+        total = len(self)
+        if count >= total:
+            return list(range(total))
+        return [index * total // count for index in range(count)]
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
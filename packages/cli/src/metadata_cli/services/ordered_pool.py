@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Iterable, Iterator
+
+
+def run_ordered(tasks: Iterable[tuple[Any, ...]], workers: int) -> Iterator[Any]:
+    """Run ``(func, *args)`` tasks in a process pool and yield their results in task order.
+
+    At most ``2 * workers`` tasks run ahead of the consumer, so memory stays bounded by the
+    task size rather than the input size. With one worker or one task, tasks run in-process.
+    """
+    tasks = list(tasks)
+    if workers <= 1 or len(tasks) <= 1:
+        for func, *args in tasks:
+            yield func(*args)
+        return
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending: deque[Future[Any]] = deque()
+        remaining = iter(tasks)
+        for func, *args in remaining:
+            pending.append(pool.submit(func, *args))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            result = pending.popleft().result()
+            task = next(remaining, None)
+            if task is not None:
+                pending.append(pool.submit(*task))
+            yield result
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
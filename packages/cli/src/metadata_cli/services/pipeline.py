@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Sequence
+
+# Edge batches read ahead of their nodes, per request kept in flight.
+HELD_BATCHES_PER_SLOT = 4
+
+
+@dataclass(slots=True)
+class HeldEdgeBatch:
+    """An edge batch read in file order, waiting for the node batches it references."""
+
+    batch: list[Any]
+    batch_index: int
+    start_offset: int
+    waits_on: set[int] = field(default_factory=set)
+    # Endpoints not seen among this run's nodes yet: a later node batch, or already on the API.
+    unseen: set[str] = field(default_factory=set)
+    # Node batches read when ``unseen`` was last looked up; it only shrinks when more arrive.
+    checked: int = -1
+
+
+class NodeDependencies:
+    """Knows which node batch carries each node ID and which of them the API acknowledged.
+
+    An edge may leave once every endpoint is in an acknowledged batch or, after the last node
+    batch was read, is not among this run's nodes at all (skipped on resume, unchanged under
+    ``--delta``, or created by an earlier job). Only the first batch carrying an ID counts: the
+    API upserts, so that batch is the one that creates the node.
+    """
+
+    def __init__(self) -> None:
+        self._batch_of: dict[str, int] = {}
+        self._acknowledged: set[int] = set()
+        self.batches = 0
+        self.exhausted = False
+
+    def add_batch(self, node_ids: Iterable[str]) -> int:
+        """Register a node batch about to be sent and return its sequence number."""
+        sequence = self.batches
+        self.batches += 1
+        batch_of = self._batch_of
+        for node_id in node_ids:
+            batch_of.setdefault(node_id, sequence)
+        return sequence
+
+    def acknowledge(self, sequence: int) -> None:
+        self._acknowledged.add(sequence)
+
+    @property
+    def settled(self) -> bool:
+        """Every node batch has been read and acknowledged."""
+        return self.exhausted and len(self._acknowledged) == self.batches
+
+    def hold(self, batch: list[Any], batch_index: int, start_offset: int) -> HeldEdgeBatch:
+        held = HeldEdgeBatch(batch, batch_index, start_offset)
+        held.unseen.update(edge.sourceId for edge in batch)
+        held.unseen.update(edge.targetId for edge in batch)
+        return held
+
+    def blocked(self, held: HeldEdgeBatch) -> bool:
+        """Resolve what ``held`` still waits for; ``False`` once it is safe to send."""
+        if held.unseen and held.checked < self.batches:
+            batch_of = self._batch_of
+            found = [node_id for node_id in held.unseen if node_id in batch_of]
+            held.waits_on.update(batch_of[node_id] for node_id in found)
+            held.unseen.difference_update(found)
+            held.checked = self.batches
+        if self.exhausted:
+            held.unseen.clear()
+        held.waits_on.difference_update(self._acknowledged)
+        return bool(held.unseen or held.waits_on)
+
+    def first_ready(self, held: Sequence[HeldEdgeBatch]) -> int | None:
+        """Position of the first held batch that may be sent, in file order."""
+        for position, candidate in enumerate(held):
+            if not self.blocked(candidate):
+                return position
+        return None
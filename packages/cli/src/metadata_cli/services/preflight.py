@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from typing import Any, Callable, Iterable
+
+from metadata_cli.models import EdgeModel, NodeModel
+
+SAMPLE_LIMIT = 5
+SORT_CHUNK = 1 << 20
+
+
+def hash_id(value: str) -> int:
+    """64-bit digest of an ID; collisions are negligible below billions of IDs."""
+    return int.from_bytes(blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _sorted_array(values: array, chunk: int = SORT_CHUNK) -> array:
+    """Sort an ``array('Q')`` without materializing it as one big list of Python ints."""
+    if len(values) <= chunk:
+        return array("Q", sorted(values))
+    runs = [
+        array("Q", sorted(values[start : start + chunk]))
+        for start in range(0, len(values), chunk)
+    ]
+    merged = array("Q")
+    merged.extend(heapq.merge(*runs))
+    return merged
+
+
+class IdIndex:
+    """Memory-compact ID set: 8 bytes per ID in a sorted ``array('Q')`` of hashes."""
+
+    def __init__(self) -> None:
+        self._hashes = array("Q")
+        self._frozen = False
+
+    def add(self, value: str) -> None:
+        if self._frozen:
+            raise RuntimeError("IdIndex is frozen")
+        self._hashes.append(hash_id(value))
+
+    def freeze(self) -> dict[int, int]:
+        """Sort the index and return ``{hash: occurrences}`` for IDs seen more than once."""
+        self._hashes = _sorted_array(self._hashes)
+        self._frozen = True
+        duplicates: dict[int, int] = {}
+        previous = None
+        for value in self._hashes:
+            if value == previous:
+                duplicates[value] = duplicates.get(value, 1) + 1
+            previous = value
+        return duplicates
+
+    def __contains__(self, value: str) -> bool:
+        target = hash_id(value)
+        position = bisect_left(self._hashes, target)
+        return position < len(self._hashes) and self._hashes[position] == target
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    @property
+    def nbytes(self) -> int:
+        return self._hashes.itemsize * len(self._hashes)
+
+
+@dataclass(slots=True)
+class PreflightReport:
+    nodes: int = 0
+    edges: int = 0
+    duplicate_nodes: int = 0
+    duplicate_edges: int = 0
+    dangling_edges: int = 0
+    duplicate_node_samples: list[str] = field(default_factory=list)
+    duplicate_edge_samples: list[str] = field(default_factory=list)
+    dangling_edge_samples: list[dict[str, Any]] = field(default_factory=list)
+    index_bytes: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not (self.duplicate_nodes or self.duplicate_edges or self.dangling_edges)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "nodes": self.nodes,
+            "edges": self.edges,
+            "duplicateNodeIds": self.duplicate_nodes,
+            "duplicateEdgeIds": self.duplicate_edges,
+            "danglingEdges": self.dangling_edges,
+            "samples": {
+                "duplicateNodeIds": self.duplicate_node_samples,
+                "duplicateEdgeIds": self.duplicate_edge_samples,
+                "danglingEdges": self.dangling_edge_samples,
+            },
+            "indexBytes": self.index_bytes,
+        }
+
+    def summary(self) -> str:
+        return (
+            f"{self.duplicate_nodes} duplicate node ids, "
+            f"{self.duplicate_edges} duplicate edge ids, "
+            f"{self.dangling_edges} dangling edges (samples: {self.to_dict()['samples']})"
+        )
+
+
+def run_preflight(
+    nodes: Callable[[], Iterable[NodeModel]],
+    edges: Callable[[], Iterable[EdgeModel]],
+) -> PreflightReport:
+    """Check duplicate IDs and edge endpoints in streaming passes.
+
+    ``nodes``/``edges`` are factories so streamed datasets can be re-read: one pass over nodes
+    builds the hashed ID index, one pass over edges checks endpoints, and an extra node/edge
+    pass only runs to recover sample strings when duplicates were found.
+    """
+    report = PreflightReport()
+    node_index = IdIndex()
+    for node in nodes():
+        node_index.add(node.id)
+    report.nodes = len(node_index)
+    node_duplicates = node_index.freeze()
+
+    edge_index = IdIndex()
+    for edge in edges():
+        edge_index.add(edge.id)
+        missing = [
+            endpoint for endpoint in (edge.sourceId, edge.targetId) if endpoint not in node_index
+        ]
+        if missing:
+            report.dangling_edges += 1
+            if len(report.dangling_edge_samples) < SAMPLE_LIMIT:
+                report.dangling_edge_samples.append({"id": edge.id, "missing": missing})
+    report.edges = len(edge_index)
+    edge_duplicates = edge_index.freeze()
+    report.index_bytes = node_index.nbytes + edge_index.nbytes
+
+    report.duplicate_nodes = sum(count - 1 for count in node_duplicates.values())
+    report.duplicate_edges = sum(count - 1 for count in edge_duplicates.values())
+    if node_duplicates:
+        report.duplicate_node_samples = _duplicate_samples(nodes(), node_duplicates)
+    if edge_duplicates:
+        report.duplicate_edge_samples = _duplicate_samples(edges(), edge_duplicates)
+    return report
+
+
+def _duplicate_samples(
+    records: Iterable[NodeModel | EdgeModel], duplicates: dict[int, int]
+) -> list[str]:
+    samples: list[str] = []
+    for record in records:
+        if record.id not in samples and hash_id(record.id) in duplicates:
+            samples.append(record.id)
+            if len(samples) >= SAMPLE_LIMIT:
+                break
+    return samples
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+POISON_STATUSES = frozenset({400, 422})
+THROTTLE_STATUS = 429
+
+
+def is_retryable(status: int) -> bool:
+    """429 and 5xx answers are transient; 501 means the endpoint will never work."""
+    return status == THROTTLE_STATUS or (status >= 500 and status != 501)
+
+
+def parse_retry_after(value: str | None, *, now: datetime | None = None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+@dataclass(slots=True)
+class RetryPolicy:
+    """Capped exponential backoff with full jitter.
+
+    Attempt ``n`` waits a uniform random time in ``[0, min(max_delay, base_delay * 2**n)]``,
+    unless the server sent ``Retry-After``, which is honored up to ``max_delay``.
+    """
+
+    max_retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        if self.base_delay < 0 or self.max_delay < self.base_delay:
+            raise ValueError("Retry delays must satisfy 0 <= base_delay <= max_delay")
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        requested = parse_retry_after(retry_after)
+        if requested is not None:
+            return min(requested, self.max_delay)
+        ceiling = min(self.max_delay, self.base_delay * (2**attempt))
+        return self.rng.uniform(0, ceiling)
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from sqlalchemy import Connection, Engine, Table, bindparam, create_engine, text, update
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from metadata_cli.config import CliSettings
+from metadata_cli.db import graph_schema
+from metadata_cli.db.migrations import MigrationJobRecord, MigrationJobStore
+from metadata_cli.errors import DatasetValidationError, IngestionError
+from metadata_cli.models import EdgeModel, NodeModel
+from metadata_cli.services.encoding import BatchEncoder
+from metadata_cli.services.ingest import DatasetLoader, fingerprint_dataset
+from metadata_cli.services.validation import build_validator
+from metadata_cli.utils.logging import ProgressLogger, build_logger
+
+USER_AGENT = "metadata-cli load-sqlite"
+
+# Applied for the duration of the load only. WAL stays on afterwards (the API uses it too);
+# synchronous=OFF means a power loss mid-load can corrupt the file, so seed a copy and swap it in.
+LOAD_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -262144",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA foreign_keys = OFF",
+)
+FINISH_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA optimize",
+    "PRAGMA wal_checkpoint(TRUNCATE)",
+)
+
+NODE_COLUMNS = (
+    "id", "org_id", "type", "properties", "created_by", "updated_by", "user_agent", "client_ip",
+    "job_id",
+)
+EDGE_COLUMNS = (
+    "id", "org_id", "source_id", "target_id", "type", "properties", "created_by", "updated_by",
+    "job_id",
+)
+NODE_CONFLICT_SET = ("type", "properties", "updated_by", "user_agent", "client_ip", "job_id")
+EDGE_CONFLICT_SET = ("source_id", "target_id", "type", "properties", "updated_by", "job_id")
+# Node IDs per endpoint lookup, below SQLite's historical 999-variable limit.
+ENDPOINT_LOOKUP_CHUNK = 500
+
+
+def upsert_sql(table: Table, columns: tuple[str, ...], conflict_set: tuple[str, ...]) -> str:
+    """Compile the API's ``onConflictDoUpdate`` upsert once, with positional ``?`` parameters
+    in ``columns`` order, so rows can go straight to ``executemany`` as tuples."""
+    statement = insert(table).values({name: bindparam(name) for name in columns})
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.org_id, table.c.id],
+        set_={
+            **{name: statement.excluded[name] for name in conflict_set},
+            "updated_at": text("CURRENT_TIMESTAMP"),
+        },
+    )
+    compiled = statement.compile(dialect=sqlite.dialect())
+    if tuple(compiled.positiontup or ()) != columns:
+        raise ValueError(f"Unexpected parameter order for {table.name}: {compiled.positiontup}")
+    return str(compiled)
+
+
+def _chunks(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class SqliteBulkLoader:
+    """Writes a dataset straight into the API's SQLite database, bypassing HTTP.
+
+    Records come from the same ``DatasetLoader`` streams as ``ingest`` and are upserted into
+    ``graph_nodes``/``graph_edges`` with the API's semantics (``createdBy`` falls back to the
+    source, ``properties`` is compact JSON, every row is stamped with the job ID). Rows go in
+    through ``executemany`` in chunks of ``batch_size`` and are committed every
+    ``transaction_size`` rows. When the graph tables start out empty, their secondary indexes
+    are dropped and built once after the load instead of being maintained row by row. Foreign
+    keys are off during the load, so each edge chunk is checked against ``graph_nodes`` before
+    it is written: edges with a missing endpoint are skipped and counted as ``edgesRejected``,
+    leaving any row already stored under their ID untouched, as the API would.
+    """
+
+    def __init__(
+        self,
+        settings: CliSettings,
+        *,
+        job_store: MigrationJobStore | None = None,
+        logger: ProgressLogger | None = None,
+        engine: Engine | None = None,
+    ):
+        if settings.sqlite_db is None and engine is None:
+            raise ValueError("load-sqlite needs a target database path")
+        self.settings = settings
+        self.job_store = job_store or MigrationJobStore(settings.job_store_path)
+        self.logger = logger or build_logger(
+            settings.log_format, sample_rate=settings.log_sample_rate
+        )
+        self.engine = engine or create_engine(f"sqlite:///{settings.sqlite_db}")
+        self.loader = DatasetLoader(
+            settings.dataset_format,
+            parse_workers=settings.parse_workers,
+            record_range=settings.record_range,
+            sample=settings.sample,
+            validator=build_validator(settings, self.job_store.path),
+        )
+        self._encoder = BatchEncoder(settings.source)
+        # ensure_ascii=False matches the API's JSON.stringify byte for byte.
+        self._encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+        self._statements: dict[str, tuple[str, Callable[[Any, str], tuple]]] = {
+            "nodes": (
+                upsert_sql(graph_schema.graph_nodes, NODE_COLUMNS, NODE_CONFLICT_SET),
+                self._node_row,
+            ),
+            "edges": (
+                upsert_sql(graph_schema.graph_edges, EDGE_COLUMNS, EDGE_CONFLICT_SET),
+                self._edge_row,
+            ),
+        }
+
+    def run(self, dataset_path: Path) -> MigrationJobRecord:
+        if not dataset_path.exists():
+            raise DatasetValidationError(f"Dataset file {dataset_path} does not exist")
+        job_id = uuid.uuid4().hex
+        self.job_store.start_job(job_id=job_id, source=self.settings.source)
+        metrics: dict[str, Any] = {
+            "nodesAccepted": 0,
+            "edgesAccepted": 0,
+            "batches": 0,
+            "transactions": 0,
+            "edgesRejected": 0,
+            "target": str(self.settings.sqlite_db or self.engine.url.database),
+        }
+        start = time.perf_counter()
+        status = "failed"
+        try:
+            self.job_store.record_dataset(
+                job_id,
+                dataset_path=str(dataset_path.resolve()),
+                dataset_format=self.settings.dataset_format,
+                fingerprint=fingerprint_dataset(dataset_path),
+            )
+            with self.engine.connect() as conn:
+                deferred = self._prepare(conn, job_id)
+                metrics["deferredIndexes"] = deferred
+                try:
+                    metrics["nodesAccepted"] = self._load(
+                        conn, dataset_path, "nodes", job_id, metrics
+                    )
+                    metrics["edgesAccepted"] = self._load(
+                        conn, dataset_path, "edges", job_id, metrics
+                    )
+                    rejected = metrics["edgesRejected"]
+                    if metrics["nodesAccepted"] + metrics["edgesAccepted"] + rejected == 0:
+                        raise DatasetValidationError(
+                            "Dataset must contain at least one node or edge"
+                        )
+                    status = "succeeded"
+                finally:
+                    metrics["durationSeconds"] = round(time.perf_counter() - start, 3)
+                    if self.loader.validator.report.invalid_records:
+                        metrics["validation"] = self.loader.validator.report.to_dict()
+                    self._finish(conn, job_id, status, metrics, build_indexes=deferred)
+        except DatasetValidationError:
+            self.job_store.complete_job(job_id, status="failed", metrics=metrics)
+            raise
+        except SQLAlchemyError as exc:
+            self.job_store.complete_job(job_id, status="failed", metrics=metrics)
+            raise IngestionError(f"SQLite load failed: {exc}") from exc
+        except BaseException:
+            # OSError from the dataset, KeyboardInterrupt, ...: never leave the job "running".
+            self.job_store.complete_job(job_id, status="failed", metrics=metrics)
+            raise
+        finally:
+            self.engine.dispose()
+            self.loader.validator.report.write()
+
+        job_record = self.job_store.complete_job(job_id, status=status, metrics=metrics)
+        total = metrics["nodesAccepted"] + metrics["edgesAccepted"]
+        self.logger.throughput(total, metrics["durationSeconds"])
+        if metrics["edgesRejected"]:
+            self.logger.warn(
+                "load.dangling_edges_skipped", job_id=job_id, edges=metrics["edgesRejected"]
+            )
+        self.logger.info(
+            "load.complete",
+            job_id=job_record.job_id,
+            status=job_record.status,
+            nodes=metrics["nodesAccepted"],
+            edges=metrics["edgesAccepted"],
+            transactions=metrics["transactions"],
+        )
+        return job_record
+
+    def _prepare(self, conn: Connection, job_id: str) -> bool:
+        """Tune the connection, create missing tables, and record the job.
+
+        Returns whether index creation is deferred, which only pays off on empty tables: on a
+        populated database, rebuilding the indexes would cost more than maintaining them.
+        """
+        for pragma in LOAD_PRAGMAS:
+            conn.exec_driver_sql(pragma)
+        for ddl in graph_schema.create_tables_ddl():
+            conn.execute(ddl)
+        empty = conn.exec_driver_sql(
+            "SELECT NOT EXISTS (SELECT 1 FROM graph_nodes)"
+            " AND NOT EXISTS (SELECT 1 FROM graph_edges)"
+        ).scalar_one()
+        if empty:
+            for statement in graph_schema.drop_indexes_sql():
+                conn.exec_driver_sql(statement)
+        conn.execute(
+            graph_schema.migration_jobs.insert().values(
+                job_id=job_id,
+                org_id=self.settings.org_id,
+                source=self.settings.source,
+                status="running",
+            )
+        )
+        conn.commit()
+        return bool(empty)
+
+    def _load(
+        self, conn: Connection, path: Path, resource: str, job_id: str, metrics: dict[str, Any]
+    ) -> int:
+        sql, to_row = self._statements[resource]
+        rows = (to_row(model, job_id) for model in self.loader.stream(path, resource))
+        loaded = 0
+        pending = 0
+        for chunk in _chunks(rows, self.settings.batch_size):
+            if resource == "edges":
+                attached = self._attached_edges(conn, chunk)
+                metrics["edgesRejected"] += len(chunk) - len(attached)
+                if not attached:
+                    continue
+                chunk = attached
+            conn.exec_driver_sql(sql, chunk)
+            loaded += len(chunk)
+            pending += len(chunk)
+            metrics["batches"] += 1
+            if pending >= self.settings.transaction_size:
+                self._commit(conn, resource, loaded, metrics)
+                pending = 0
+        if pending:
+            self._commit(conn, resource, loaded, metrics)
+        return loaded
+
+    def _commit(self, conn: Connection, resource: str, loaded: int, metrics: dict) -> None:
+        conn.commit()
+        metrics["transactions"] += 1
+        self.logger.info("load.commit", resource=resource, rows=loaded)
+
+    def _node_row(self, model: NodeModel, job_id: str) -> tuple:
+        item = self._encoder.item(model)
+        return (
+            item["id"],
+            self.settings.org_id,
+            item["type"],
+            self._encode(item["properties"]),
+            item["createdBy"],
+            item["updatedBy"],
+            USER_AGENT,
+            None,
+            job_id,
+        )
+
+    def _edge_row(self, model: EdgeModel, job_id: str) -> tuple:
+        item = self._encoder.item(model)
+        return (
+            item["id"],
+            self.settings.org_id,
+            item["sourceId"],
+            item["targetId"],
+            item["type"],
+            self._encode(item["properties"]),
+            item["createdBy"],
+            item["updatedBy"],
+            job_id,
+        )
+
+    def _attached_edges(self, conn: Connection, rows: list[tuple]) -> list[tuple]:
+        """The edge rows whose source and target nodes exist (this load's nodes included)."""
+        endpoints = list({row[2] for row in rows} | {row[3] for row in rows})
+        present: set[str] = set()
+        for offset in range(0, len(endpoints), ENDPOINT_LOOKUP_CHUNK):
+            chunk = endpoints[offset : offset + ENDPOINT_LOOKUP_CHUNK]
+            result = conn.exec_driver_sql(
+                "SELECT id FROM graph_nodes WHERE org_id = ?"
+                f" AND id IN ({', '.join('?' * len(chunk))})",
+                (self.settings.org_id, *chunk),
+            )
+            present.update(node_id for (node_id,) in result)
+        return [row for row in rows if row[2] in present and row[3] in present]
+
+    def _finish(
+        self, conn: Connection, job_id: str, status: str, metrics: dict, *, build_indexes: bool
+    ) -> None:
+        """Build deferred indexes, record the job outcome, and restore durable settings.
+
+        Runs on failure too, so a partial load still leaves a complete schema behind; its rows
+        can be removed by ``job_id``.
+        """
+        conn.rollback()
+        if build_indexes:
+            with self.logger.time_block("load.create_indexes"):
+                for ddl in graph_schema.create_indexes_ddl():
+                    conn.execute(ddl)
+        conn.execute(
+            update(graph_schema.migration_jobs)
+            .where(graph_schema.migration_jobs.c.job_id == job_id)
+            .values(
+                status=status,
+                completed_at=text("CURRENT_TIMESTAMP"),
+                metrics=json.dumps(metrics),
+            )
+        )
+        conn.commit()
+        for pragma in FINISH_PRAGMAS:
+            conn.exec_driver_sql(pragma)
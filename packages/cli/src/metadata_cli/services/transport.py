@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+
+from metadata_cli.config import CliSettings, TransportSettings
+
+# httpx's own default pool size, kept for the synchronous client.
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+def build_timeout(settings: TransportSettings) -> httpx.Timeout:
+    return httpx.Timeout(
+        connect=settings.connect_timeout,
+        read=settings.read_timeout,
+        write=settings.write_timeout,
+        pool=settings.pool_timeout,
+    )
+
+
+def build_limits(settings: TransportSettings, max_connections: int | None = None) -> httpx.Limits:
+    """Pool limits; ``max_connections`` is the runner's default when --max-connections is unset.
+
+    Without --max-keepalive every pooled connection is kept alive between batches.
+    """
+    connections = settings.max_connections or max_connections or DEFAULT_MAX_CONNECTIONS
+    keepalive = settings.max_keepalive if settings.max_keepalive is not None else connections
+    return httpx.Limits(
+        max_connections=connections,
+        max_keepalive_connections=keepalive,
+        keepalive_expiry=settings.keepalive_expiry,
+    )
+
+
+def _pool_options(
+    settings: TransportSettings, url: str, max_connections: int | None
+) -> dict[str, Any]:
+    http2 = settings.protocol == "http2"
+    # httpx only negotiates HTTP/2 through TLS ALPN; plain http:// needs prior knowledge (h2c).
+    http1 = not (http2 and url.startswith("http://"))
+    return {"limits": build_limits(settings, max_connections), "http1": http1, "http2": http2}
+
+
+def build_client(
+    settings: CliSettings, url: str, *, max_connections: int | None = None
+) -> httpx.Client:
+    """A client for one API endpoint, shaped by --transport and the timeout/pool options.
+
+    HTTP/2 multiplexes concurrent batches as streams over a single connection. A Unix domain
+    socket (--uds) skips TCP for an API on the same host; ``url`` still sets the Host header.
+    """
+    transport_settings = settings.transport
+    options = _pool_options(transport_settings, url, max_connections)
+    timeout = build_timeout(transport_settings)
+    if transport_settings.uds_path is not None:
+        transport = httpx.HTTPTransport(uds=str(transport_settings.uds_path), **options)
+        return httpx.Client(timeout=timeout, transport=transport)
+    return httpx.Client(timeout=timeout, **options)
+
+
+def build_async_client(
+    settings: CliSettings, url: str, *, max_connections: int | None = None
+) -> httpx.AsyncClient:
+    """The ``httpx.AsyncClient`` counterpart of ``build_client``."""
+    transport_settings = settings.transport
+    options = _pool_options(transport_settings, url, max_connections)
+    timeout = build_timeout(transport_settings)
+    if transport_settings.uds_path is not None:
+        transport = httpx.AsyncHTTPTransport(uds=str(transport_settings.uds_path), **options)
+        return httpx.AsyncClient(timeout=timeout, transport=transport)
+    return httpx.AsyncClient(timeout=timeout, **options)
@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from pydantic import TypeAdapter, ValidationError
+
+from metadata_cli.config import CliSettings
+from metadata_cli.errors import DatasetValidationError
+from metadata_cli.models import EdgeModel, NodeModel
+from metadata_cli.services.csv_records import parse_csv_chunk, split_csv
+from metadata_cli.services.ordered_pool import run_ordered
+
+ERROR_REPORT_NAME = "validation-errors.ndjson"
+DEFAULT_MAX_ERRORS = 1000
+NDJSON_CHUNK_BYTES = 8 * 1024 * 1024
+SAMPLE_LIMIT = 5
+SCAN_FORMATS = ("ndjson", "csv")
+RESOURCES = ("nodes", "edges")
+
+ADAPTERS: dict[str, TypeAdapter[Any]] = {
+    "nodes": TypeAdapter(NodeModel),
+    "edges": TypeAdapter(EdgeModel),
+}
+MODELS: dict[str, type[NodeModel] | type[EdgeModel]] = {"nodes": NodeModel, "edges": EdgeModel}
+FIELD_NAMES = {resource: tuple(model.model_fields) for resource, model in MODELS.items()}
+
+
+@dataclass(slots=True)
+class InvalidRecord:
+    """A record that failed validation, with one ``{field, type, message}`` dict per error."""
+
+    location: str
+    resource: str
+    record_id: str | None
+    errors: list[dict[str, str]]
+
+
+# What a validation worker returns per record, in file order: ``(resource, field values)`` in
+# ``FIELD_NAMES`` order, ``("metadata", dict)`` for an NDJSON metadata line, or the reasons a
+# record is invalid; an NDJSON chunk ends with ``("lines", newline count)``. Tuples pickle
+# smaller and faster than dicts or models.
+ChunkEntry = tuple[str, tuple[Any, ...] | dict[str, Any] | int] | InvalidRecord
+
+
+def _field_path(loc: tuple[int | str, ...]) -> str:
+    path = ""
+    for part in loc:
+        if isinstance(part, int):
+            path += f"[{part}]"
+        else:
+            path += f".{part}" if path else part
+    return path
+
+
+def check_record(
+    resource: str, location: str, item: Any
+) -> tuple[NodeModel | EdgeModel | None, InvalidRecord | None]:
+    """Validate one record; returns the model, or the reasons it is invalid."""
+    try:
+        return ADAPTERS[resource].validate_python(item), None
+    except ValidationError as exc:
+        errors = [
+            {"field": _field_path(error["loc"]), "type": error["type"], "message": error["msg"]}
+            for error in exc.errors(include_url=False, include_input=False)
+        ]
+        record_id = item.get("id") if isinstance(item, dict) else None
+        return None, InvalidRecord(
+            location, resource, record_id if isinstance(record_id, str) else None, errors
+        )
+
+
+def rebuild_model(resource: str, values: tuple[Any, ...]) -> NodeModel | EdgeModel:
+    """The model for field values a worker already validated, without validating again."""
+    names = FIELD_NAMES[resource]
+    return MODELS[resource].model_construct(_fields_set=set(names), **dict(zip(names, values)))
+
+
+def invalid_json(location: str, exc: json.JSONDecodeError) -> InvalidRecord:
+    error = {"field": "", "type": "json_invalid", "message": f"invalid JSON ({exc.msg})"}
+    return InvalidRecord(location, "", None, [error])
+
+
+def payload_items(
+    payload: Any, resource: str, location: str
+) -> tuple[list[tuple[str, Any]], InvalidRecord | None]:
+    """Split a JSON document or NDJSON line into ``(location, record)`` pairs of ``resource``.
+
+    Locations look like ``line 7, edges[2]`` (or ``edges[2]`` for a JSON document).
+    """
+    prefix = f"{location}, " if location else ""
+    if not isinstance(payload, dict):
+        error = {"field": "", "type": "dict_type", "message": "Input should be a JSON object"}
+        return [], InvalidRecord(location or "document", "", None, [error])
+    items = payload.get(resource, [])
+    if not isinstance(items, list):
+        error = {"field": resource, "type": "list_type", "message": "Input should be a valid list"}
+        return [], InvalidRecord(f"{prefix}{resource}", resource, None, [error])
+    return [(f"{prefix}{resource}[{index}]", item) for index, item in enumerate(items)], None
+
+
+class ValidationReport:
+    """Invalid records found during a run, written to an NDJSON error report.
+
+    Each report line is one field error: ``file``, ``location`` (line or row, plus the record's
+    index within the line), ``resource``, ``id``, ``field``, ``type``, and ``message``. Only the
+    first ``max_errors`` errors are written; the rest are counted. Files are read more than
+    once per run (pre-flight, then nodes, then edges), so a record is recorded the first time
+    only.
+    """
+
+    def __init__(self, path: Path | None = None, *, max_errors: int = DEFAULT_MAX_ERRORS):
+        self.path = path
+        self.max_errors = max_errors
+        self.errors = 0
+        self.files: dict[str, int] = {}
+        # Capped by max_errors, so holding them until ``write`` keeps no file open mid-run.
+        self.entries: list[dict[str, Any]] = []
+        self._seen: set[tuple[str, str]] = set()
+        self._written = 0
+
+    @classmethod
+    def beside(cls, job_store_path: Path | str, *, max_errors: int) -> "ValidationReport":
+        """Report to the file that lives next to a ``MigrationJobStore`` file."""
+        if str(job_store_path) == ":memory:":
+            return cls(None, max_errors=max_errors)
+        return cls(Path(job_store_path).parent / ERROR_REPORT_NAME, max_errors=max_errors)
+
+    @property
+    def invalid_records(self) -> int:
+        return sum(self.files.values())
+
+    @property
+    def full(self) -> bool:
+        return self.errors >= self.max_errors
+
+    def invalid(self, path: Path) -> int:
+        return self.files.get(str(path), 0)
+
+    def add(self, path: Path, record: InvalidRecord) -> None:
+        key = (str(path), record.location)
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        self.files[key[0]] = self.files.get(key[0], 0) + 1
+        for error in record.errors:
+            self.errors += 1
+            if len(self.entries) < self.max_errors:
+                self.entries.append(
+                    {
+                        "file": key[0],
+                        "location": record.location,
+                        "resource": record.resource,
+                        "id": record.record_id,
+                        **error,
+                    }
+                )
+
+    def summary(self, path: Path) -> str:
+        samples = "; ".join(
+            " ".join(filter(None, (entry["location"], entry["field"]))) + f": {entry['message']}"
+            for entry in self.entries[:SAMPLE_LIMIT]
+            if entry["file"] == str(path)
+        )
+        report = f" (full report: {self.path})" if self.path and self.entries else ""
+        return f"{self.invalid(path)} invalid records in {path}{report}: {samples}"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "invalidRecords": self.invalid_records,
+            "errors": self.errors,
+            "errorsReported": len(self.entries),
+            "truncated": self.errors > len(self.entries),
+            "report": str(self.path) if self.path and self.entries else None,
+            "files": dict(self.files),
+            "samples": self.entries[:SAMPLE_LIMIT],
+        }
+
+    def write(self) -> None:
+        """(Re)write the report file with every entry so far; a no-op without errors."""
+        if self.path is None or len(self.entries) == self._written:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w", encoding="utf-8") as handle:
+            for entry in self.entries:
+                handle.write(json.dumps(entry) + "\n")
+        self._written = len(self.entries)
+
+
+class RecordValidator:
+    """Validates dataset records one at a time, collecting every invalid one in a report.
+
+    Without ``skip_invalid``, the first invalid record of a file stops that file's records
+    from being yielded, validation carries on until the report is full, and ``check`` then
+    fails the file with the located errors. With ``skip_invalid``, invalid records are
+    reported and left out, and the valid ones are shipped anyway.
+    """
+
+    def __init__(
+        self,
+        report: ValidationReport | None = None,
+        *,
+        skip_invalid: bool = False,
+        ndjson_chunk_bytes: int = NDJSON_CHUNK_BYTES,
+    ):
+        self.report = report or ValidationReport()
+        self.skip_invalid = skip_invalid
+        self.ndjson_chunk_bytes = ndjson_chunk_bytes
+        # IDs of invalid records by resource: with skip_invalid they stay in the dataset.
+        self.invalid_ids: dict[str, set[str]] = {}
+
+    def validate(
+        self, path: Path, resource: str, location: str, item: Any
+    ) -> NodeModel | EdgeModel | None:
+        model, invalid = check_record(resource, location, item)
+        if invalid is not None:
+            self.reject(path, invalid)
+        return model
+
+    def reject(self, path: Path, invalid: InvalidRecord) -> None:
+        self.report.add(path, invalid)
+        if invalid.resource and invalid.record_id is not None:
+            self.invalid_ids.setdefault(invalid.resource, set()).add(invalid.record_id)
+
+    def failed(self, path: Path) -> bool:
+        return not self.skip_invalid and self.report.invalid(path) > 0
+
+    def exhausted(self, path: Path) -> bool:
+        """Whether reading ``path`` further is pointless: it failed and the report is full."""
+        return self.failed(path) and self.report.full
+
+    def check(self, path: Path) -> None:
+        if self.failed(path):
+            self.report.write()
+            raise DatasetValidationError(self.report.summary(path))
+
+    def records(
+        self,
+        path: Path,
+        resource: str,
+        items: Iterable[tuple[str, Any]],
+        *,
+        validate: Callable[..., NodeModel | EdgeModel | None] | None = None,
+    ) -> Iterator[NodeModel | EdgeModel]:
+        """Yield the valid models of ``(location, record)`` pairs; callers ``check`` after."""
+        validate = validate or self.validate
+        for location, item in items:
+            if self.exhausted(path):
+                return
+            model = validate(path, resource, location, item)
+            if model is not None and not self.failed(path):
+                yield model
+
+    def tagged_records(
+        self,
+        path: Path,
+        items: Iterable[tuple[str, str, Any]],
+        validate: Callable[..., NodeModel | EdgeModel | None] | None = None,
+    ) -> Iterator[tuple[str, NodeModel | EdgeModel]]:
+        """``(resource, model)`` of ``(location, resource, record)`` triples of either resource."""
+        validate = validate or self.validate
+        for location, resource, item in items:
+            if self.exhausted(path):
+                return
+            model = validate(path, resource, location, item)
+            if model is not None and not self.failed(path):
+                yield resource, model
+
+    def parallel_records(
+        self,
+        path: Path,
+        data_format: str,
+        resources: Iterable[str],
+        *,
+        workers: int,
+        metadata: dict[str, Any] | None = None,
+    ) -> Iterator[tuple[str, NodeModel | EdgeModel]]:
+        """``(resource, model)`` of an NDJSON or CSV file, parsed and validated in a pool.
+
+        Each of ``workers`` processes reads its own byte range, validates the records of
+        ``resources``, and returns their validated fields in file order; models are rebuilt here
+        without validating again. Invalid records go to the report as in ``tagged_records``.
+        NDJSON workers number lines from the start of their range, so their locations are
+        shifted by the lines of the ranges before them.
+        """
+        wanted = tuple(resource for resource in RESOURCES if resource in resources)
+        if data_format == "ndjson":
+            chunks = ndjson_chunks(path, self.ndjson_chunk_bytes)
+            tasks = [(_validate_ndjson_chunk, str(path), chunk, wanted) for chunk in chunks]
+        elif data_format == "csv":
+            fieldnames, ranges = split_csv(path)
+            tasks = [
+                (_validate_csv_chunk, str(path), chunk, fieldnames, wanted) for chunk in ranges
+            ]
+        else:
+            raise ValueError(f"Parallel validation supports {', '.join(SCAN_FORMATS)}")
+        lines_before = 0
+        for entries in run_ordered(tasks, workers):
+            for entry in entries:
+                if isinstance(entry, InvalidRecord):
+                    if lines_before:
+                        entry.location = _shift_line(entry.location, lines_before)
+                    self.reject(path, entry)
+                    if self.exhausted(path):
+                        return
+                    continue
+                resource, values = entry
+                if resource == "lines":
+                    lines_before += values
+                elif resource == "metadata":
+                    if metadata is not None:
+                        metadata.update(values)
+                elif not self.failed(path):
+                    yield resource, rebuild_model(resource, values)
+
+
+def build_validator(settings: CliSettings, job_store_path: Path | str) -> RecordValidator:
+    """The validator for a run: ``--error-report`` or the report beside the job store."""
+    if settings.error_report_path is not None:
+        report = ValidationReport(settings.error_report_path, max_errors=settings.max_errors)
+    else:
+        report = ValidationReport.beside(job_store_path, max_errors=settings.max_errors)
+    return RecordValidator(report, skip_invalid=settings.skip_invalid)
+
+
+def ndjson_chunks(path: Path, chunk_bytes: int = NDJSON_CHUNK_BYTES) -> list[tuple[int, int]]:
+    """Split an NDJSON file into ``[start, end)`` byte ranges without reading it.
+
+    Each range owns the lines that start inside it; ``read_owned_lines`` finds their
+    boundaries in the worker, so the parent never scans the file.
+    """
+    size = path.stat().st_size
+    return [(start, min(start + chunk_bytes, size)) for start in range(0, size, chunk_bytes)]
+
+
+def read_owned_lines(path: str, byte_range: tuple[int, int]) -> bytes:
+    """The whole lines that start in ``[start, end)``, including one that runs past ``end``."""
+    start, end = byte_range
+    with open(path, "rb") as handle:
+        if start:
+            # The line holding byte ``start - 1`` belongs to the previous range.
+            handle.seek(start - 1)
+            handle.readline()
+        first = handle.tell()
+        if first >= end:
+            return b""
+        data = handle.read(end - first)
+        if not data.endswith(b"\n"):
+            data += handle.readline()
+    return data
+
+
+def _shift_line(location: str, lines: int) -> str:
+    """``line 3, nodes[1]`` -> ``line {3 + lines}, nodes[1]``."""
+    head, separator, rest = location.partition(", ")
+    return f"line {int(head.removeprefix('line ')) + lines}{separator}{rest}"
+
+
+def _validate_ndjson_chunk(
+    path: str, chunk: tuple[int, int], resources: tuple[str, ...]
+) -> list[ChunkEntry]:
+    data = read_owned_lines(path, chunk)
+    entries: list[ChunkEntry] = []
+    for line_no, line in enumerate(data.split(b"\n"), start=1):
+        if not line.strip():
+            continue
+        location = f"line {line_no}"
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as exc:
+            entries.append(invalid_json(location, exc))
+            continue
+        for resource in resources:
+            items, shape_error = payload_items(payload, resource, location)
+            if shape_error is not None:
+                entries.append(shape_error)
+            entries.extend(_checked(resource, items))
+        if isinstance(payload, dict) and isinstance(payload.get("metadata"), dict):
+            entries.append(("metadata", payload["metadata"]))
+    entries.append(("lines", data.count(b"\n")))
+    return entries
+
+
+def _validate_csv_chunk(
+    path: str, byte_range: tuple[int, int], fieldnames: list[str], resources: tuple[str, ...]
+) -> list[ChunkEntry]:
+    rows = parse_csv_chunk(path, byte_range, fieldnames)
+    entries: list[ChunkEntry] = []
+    for location, resource, record in rows:
+        if resource in resources:
+            entries.extend(_checked(resource, [(location, record)]))
+    return entries
+
+
+def _checked(resource: str, items: Iterable[tuple[str, Any]]) -> Iterator[ChunkEntry]:
+    for location, item in items:
+        model, invalid = check_record(resource, location, item)
+        yield (resource, tuple(model.__dict__.values())) if model is not None else invalid
@@ -1 +1 @@
-"""Utility helpers for logging and progress output."""
+"""Utility helpers for logging, progress output, and metrics export."""
@@ -1,28 +1,57 @@
 from __future__ import annotations
 
+import atexit
+import json
+import os
 import resource
+import sys
+import threading
 import time
-from typing import Any
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, TextIO
 
-from rich.console import Console
+if TYPE_CHECKING:
+    from rich.console import Console
+
+LOG_FORMATS = ("rich", "json")
 
 
 class ProgressLogger:
-    """Structured logger emitting ingestion progress events."""
+    """Structured logger emitting ingestion progress events.
+
+    ``sample_rate`` thins out routine per-batch events (``batch.sent``): with ``0.1`` every
+    tenth one is logged. Batches that fail or break a budget, and all other events, are always
+    logged.
+    """
+
+    def __init__(self, console: Console | None = None, *, sample_rate: float = 1.0):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("Log sample rate must be in (0, 1]")
+        self._console = console
+        self.sample_rate = sample_rate
+        self._sample_credit = 0.0
+
+    @property
+    def console(self) -> Console:
+        """The rich console, created on first use so ``JsonLogger`` never imports rich."""
+        if self._console is None:
+            from rich.console import Console
 
-    def __init__(self, console: Console | None = None):
-        self._console = console or Console()
+            self._console = Console()
+        return self._console
 
     def info(self, message: str, **fields: Any) -> None:
         if fields:
             kv = " ".join(f"{key}={value}" for key, value in fields.items())
-            self._console.log(f"{message} | {kv}")
+            self.console.log(f"{message} | {kv}")
         else:
-            self._console.log(message)
+            self.console.log(message)
 
     def warn(self, message: str, **fields: Any) -> None:
         kv = " ".join(f"{key}={value}" for key, value in fields.items())
-        self._console.log(f"[yellow]{message}[/yellow] | {kv}")
+        self.console.log(f"[yellow]{message}[/yellow] | {kv}")
 
     def throughput(self, items: int, duration_seconds: float) -> None:
         rate = 0 if duration_seconds <= 0 else round(items / duration_seconds, 2)
@@ -33,6 +62,14 @@ class ProgressLogger:
             items_per_second=rate,
         )
 
+    def _sampled(self) -> bool:
+        # Deterministic and evenly spaced, unlike a random draw per batch.
+        self._sample_credit += self.sample_rate
+        if self._sample_credit < 1:
+            return False
+        self._sample_credit -= 1
+        return True
+
     def log_batch(
         self,
         *,
@@ -44,6 +81,9 @@ class ProgressLogger:
         latency_budget_seconds: float,
         rss_budget_mb: float,
     ) -> None:
+        over_budget = duration_seconds > latency_budget_seconds or rss_mb > rss_budget_mb
+        if not over_budget and status < 400 and not self._sampled():
+            return
         fields = {
             "endpoint": endpoint,
             "batch_size": batch_size,
@@ -51,7 +91,7 @@ class ProgressLogger:
             "duration": f"{duration_seconds:.3f}s",
             "rss_mb": round(rss_mb, 2),
         }
-        if duration_seconds > latency_budget_seconds or rss_mb > rss_budget_mb:
+        if over_budget:
             self.warn("batch.performance_budget_exceeded", **fields)
         else:
             self.info("batch.sent", **fields)
@@ -69,9 +109,166 @@ class ProgressLogger:
 
         return _Timer()
 
+    def close(self) -> None:
+        """Flush buffered output; the rich console writes synchronously, so nothing to do."""
+
+
+class BufferedJsonWriter:
+    """Writes NDJSON events from a background thread.
+
+    ``write`` only appends the event to a deque, so the caller never formats or blocks on I/O.
+    A daemon thread encodes whatever has queued up every ``flush_interval`` seconds (sooner
+    once ``max_pending`` events wait) and hands it to the stream as a single write.
+    """
+
+    def __init__(
+        self, stream: TextIO, *, flush_interval: float = 0.25, max_pending: int = 10_000
+    ):
+        self._stream = stream
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._pending: deque[dict[str, Any]] = deque()
+        self._encode = json.JSONEncoder(separators=(",", ":"), default=str).encode
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="json-log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, event: dict[str, Any]) -> None:
+        self._pending.append(event)
+        if len(self._pending) >= self._max_pending:
+            self._wake.set()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self._flush_interval)
+            self._wake.clear()
+            self._drain()
+        self._drain()
+
+    def _drain(self) -> None:
+        pending = self._pending
+        lines = []
+        while pending:
+            lines.append(self._encode(pending.popleft()))
+        if lines:
+            self._stream.write("\n".join(lines) + "\n")
+            self._stream.flush()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+
+
+class JsonLogger(ProgressLogger):
+    """``--log-format json``: one JSON object per event, for log pipelines.
+
+    Events carry ``ts`` (Unix seconds), ``level``, ``event``, and their fields, with durations
+    as numbers (``duration_seconds``). They go to stderr, leaving stdout to the command result.
+    Sampled batch events include ``sample_rate`` so counts can be scaled back up.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        *,
+        sample_rate: float = 1.0,
+        flush_interval: float = 0.25,
+    ):
+        super().__init__(sample_rate=sample_rate)
+        self._writer = BufferedJsonWriter(stream or sys.stderr, flush_interval=flush_interval)
+        # Flushes what is still queued if the command exits without closing the logger.
+        atexit.register(self.close)
+
+    def _emit(self, level: str, message: str, fields: dict[str, Any]) -> None:
+        self._writer.write({"ts": time.time(), "level": level, "event": message, **fields})
+
+    def info(self, message: str, **fields: Any) -> None:
+        self._emit("info", message, fields)
+
+    def warn(self, message: str, **fields: Any) -> None:
+        self._emit("warn", message, fields)
+
+    def throughput(self, items: int, duration_seconds: float) -> None:
+        rate = 0 if duration_seconds <= 0 else round(items / duration_seconds, 2)
+        self.info(
+            "throughput",
+            items=items,
+            duration_seconds=round(duration_seconds, 6),
+            items_per_second=rate,
+        )
+
+    def log_batch(
+        self,
+        *,
+        endpoint: str,
+        batch_size: int,
+        status: int,
+        duration_seconds: float,
+        rss_mb: float,
+        latency_budget_seconds: float,
+        rss_budget_mb: float,
+    ) -> None:
+        over_budget = duration_seconds > latency_budget_seconds or rss_mb > rss_budget_mb
+        if not over_budget and status < 400 and not self._sampled():
+            return
+        fields: dict[str, Any] = {
+            "endpoint": endpoint,
+            "batch_size": batch_size,
+            "status": status,
+            "duration_seconds": round(duration_seconds, 6),
+            "rss_mb": round(rss_mb, 2),
+        }
+        if over_budget:
+            self._emit("warn", "batch.performance_budget_exceeded", fields)
+        else:
+            if self.sample_rate < 1:
+                fields["sample_rate"] = self.sample_rate
+            self._emit("info", "batch.sent", fields)
+
+    @contextmanager
+    def time_block(self, label: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.info(label, duration_seconds=round(time.perf_counter() - start, 6))
+
+    def close(self) -> None:
+        atexit.unregister(self.close)
+        self._writer.close()
+
+
+def build_logger(log_format: str = "rich", *, sample_rate: float = 1.0) -> ProgressLogger:
+    if log_format == "json":
+        return JsonLogger(sample_rate=sample_rate)
+    if log_format == "rich":
+        return ProgressLogger(sample_rate=sample_rate)
+    raise ValueError(f"Log format must be one of {', '.join(LOG_FORMATS)}")
+
+
+STATM_PATH = Path("/proc/self/statm")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
 
 def get_rss_mb() -> float:
-    """Return resident set size in MB using resource module (portable enough for CI/containers)."""
+    """Return the current resident set size in MB.
+
+    Reads ``/proc/self/statm`` (resident pages) on Linux so the value drops when memory is
+    released; elsewhere falls back to the peak reported by :func:`get_peak_rss_mb`.
+    """
+    try:
+        resident_pages = int(STATM_PATH.read_bytes().split()[1])
+    except (OSError, IndexError, ValueError):
+        return get_peak_rss_mb()
+    return resident_pages * PAGE_SIZE / (1024 * 1024)
+
+
+def get_peak_rss_mb() -> float:
+    """Return peak resident set size in MB from ``ru_maxrss`` (portable across CI/containers)."""
     usage = resource.getrusage(resource.RUSAGE_SELF)
     rss_kb = usage.ru_maxrss
     # On Linux ru_maxrss is kilobytes; on macOS it's bytes. Normalize by assuming >1e6 means bytes.
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import os
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+# Same buckets as HISTOGRAM_BUCKETS_MS in packages/api/src/plugins/metrics.ts.
+LATENCY_BUCKETS_MS = (25, 50, 100, 200, 500)
+REQUEST_BYTES_BUCKETS = (1 << 10, 16 << 10, 64 << 10, 256 << 10, 1 << 20, 4 << 20)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PREFIX = "metadata_cli"
+
+Labels = tuple[str, str]
+"""``(endpoint, org)`` label values."""
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "total", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        position = bisect_left(self.bounds, value)
+        if position < len(self.counts):
+            self.counts[position] += 1
+        self.total += 1
+        self.sum += value
+
+    def cumulative(self) -> Iterator[tuple[str, int]]:
+        running = 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            yield _format_number(bound), running
+        yield "+Inf", self.total
+
+
+class IngestMetrics:
+    """Prometheus metrics for one CLI process, labelled by endpoint and org.
+
+    Names follow the API's ``plugins/metrics.ts`` (``duration_ms``, ``rss_mb`` and its latency
+    buckets) so CLI and server panels line up. ``render`` produces the text exposition format
+    used by both the ``--metrics-port`` endpoint and node_exporter textfiles.
+    """
+
+    def __init__(self, org_id: str):
+        self.org_id = org_id
+        self._lock = threading.Lock()
+        self._durations: dict[Labels, _Histogram] = {}
+        self._request_bytes: dict[Labels, _Histogram] = {}
+        self._counters: dict[str, dict[Labels, int]] = {
+            "items": {},
+            "batches": {},
+            "retries": {},
+            "failures": {},
+        }
+        self._rss_mb = 0.0
+
+    def observe_batch(
+        self, endpoint: str, *, duration_ms: float, items: int, status: int, rss_mb: float
+    ) -> None:
+        labels = (endpoint, self.org_id)
+        with self._lock:
+            histogram = self._durations.get(labels)
+            if histogram is None:
+                histogram = self._durations[labels] = _Histogram(LATENCY_BUCKETS_MS)
+            histogram.observe(duration_ms)
+            self._increment("batches", labels)
+            if status < 400:
+                self._increment("items", labels, items)
+            else:
+                self._increment("failures", labels)
+            self._rss_mb = rss_mb
+
+    def observe_request_bytes(self, endpoint: str, size: int) -> None:
+        labels = (endpoint, self.org_id)
+        with self._lock:
+            histogram = self._request_bytes.get(labels)
+            if histogram is None:
+                histogram = self._request_bytes[labels] = _Histogram(REQUEST_BYTES_BUCKETS)
+            histogram.observe(size)
+
+    def count_retry(self, endpoint: str) -> None:
+        with self._lock:
+            self._increment("retries", (endpoint, self.org_id))
+
+    def count_failure(self, endpoint: str) -> None:
+        with self._lock:
+            self._increment("failures", (endpoint, self.org_id))
+
+    def _increment(self, name: str, labels: Labels, amount: int = 1) -> None:
+        counter = self._counters[name]
+        counter[labels] = counter.get(labels, 0) + amount
+
+    def render(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            self._render_histogram(
+                lines, "batch_duration_ms", "Batch request latency in ms.", self._durations
+            )
+            self._render_histogram(
+                lines, "request_bytes", "Batch request body size in bytes.", self._request_bytes
+            )
+            help_text = {
+                "items": "Records accepted by the API.",
+                "batches": "Batch requests completed, including failed ones.",
+                "retries": "Batch requests resent after 429/5xx or connection errors.",
+                "failures": "Batch requests that ended with an error status or connection error.",
+            }
+            for name, counter in self._counters.items():
+                metric = f"{PREFIX}_{name}_total"
+                lines.append(f"# HELP {metric} {help_text[name]}")
+                lines.append(f"# TYPE {metric} counter")
+                for labels, value in sorted(counter.items()):
+                    lines.append(f"{metric}{{{_labels(labels)}}} {value}")
+            metric = f"{PREFIX}_rss_mb"
+            lines.append(f"# HELP {metric} Current resident set size of the CLI in megabytes.")
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f'{metric}{{org="{_escape(self.org_id)}"}} {round(self._rss_mb, 2)}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histogram(
+        lines: list[str], name: str, help_text: str, histograms: dict[Labels, _Histogram]
+    ) -> None:
+        metric = f"{PREFIX}_{name}"
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} histogram")
+        for labels, histogram in sorted(histograms.items()):
+            label_text = _labels(labels)
+            for bound, count in histogram.cumulative():
+                lines.append(f'{metric}_bucket{{{label_text},le="{bound}"}} {count}')
+            lines.append(f"{metric}_sum{{{label_text}}} {_format_number(histogram.sum)}")
+            lines.append(f"{metric}_count{{{label_text}}} {histogram.total}")
+
+    def write_textfile(self, path: Path) -> None:
+        """Atomically write a node_exporter textfile so scrapes never see a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        staging.write_text(self.render(), encoding="utf-8")
+        os.replace(staging, path)
+
+
+class MetricsServer:
+    """Serves ``IngestMetrics.render()`` on ``/metrics`` from a daemon thread."""
+
+    def __init__(self, metrics: IngestMetrics, port: int, host: str = "0.0.0.0"):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                return
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> "MetricsServer":
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+def _labels(labels: Labels) -> str:
+    endpoint, org = labels
+    return f'endpoint="{_escape(endpoint)}",org="{_escape(org)}"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
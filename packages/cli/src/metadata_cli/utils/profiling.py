@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, ContextManager, Iterable, Iterator, TypeVar
+
+from metadata_cli.utils.logging import get_peak_rss_mb, get_rss_mb
+
+T = TypeVar("T")
+
+STAGES = ("read", "parse", "validate", "decorate", "serialize", "compress", "http")
+RSS_SAMPLE_EVERY = 256
+_DISABLED_STAGE = nullcontext()
+
+
+@dataclass(slots=True)
+class StageStats:
+    calls: int = 0
+    seconds: float = 0.0
+    max_rss_mb: float = 0.0
+    allocated_bytes: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "seconds": round(self.seconds, 6),
+            "maxRssMb": round(self.max_rss_mb, 2),
+            "allocatedBytes": self.allocated_bytes,
+        }
+
+
+class StageProfiler:
+    """Per-stage wall time and memory sampling for ``--profile`` runs.
+
+    Stages are timed through ``stage`` (a context manager), ``wrap`` (a timed function), or
+    ``iterate`` (times each ``next()`` on an iterator). Current RSS is sampled on the first call
+    of a stage and every ``RSS_SAMPLE_EVERY`` calls after that. With ``tracemalloc_top`` set,
+    tracemalloc also attributes net allocated bytes to each stage and ``snapshot`` records the
+    top allocating source lines. A disabled profiler hands back the original callables and a
+    shared no-op context, so instrumented code costs nothing outside profile mode.
+    """
+
+    def __init__(self, *, enabled: bool = True, tracemalloc_top: int = 0):
+        self.enabled = enabled
+        self.tracemalloc_top = tracemalloc_top if enabled else 0
+        self.stages: dict[str, StageStats] = {}
+        self.snapshots: dict[str, list[dict[str, Any]]] = {}
+        self._rss_start_mb = 0.0
+        self._started_tracemalloc = False
+
+    @property
+    def tracing(self) -> bool:
+        return self.tracemalloc_top > 0 and tracemalloc.is_tracing()
+
+    def start(self) -> None:
+        self.stages.clear()
+        self.snapshots.clear()
+        self._rss_start_mb = get_rss_mb()
+        if self.tracemalloc_top and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stage(self, name: str) -> ContextManager[None]:
+        if not self.enabled:
+            return _DISABLED_STAGE
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        traced = tracemalloc.get_traced_memory()[0] if self.tracing else 0
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, time.perf_counter() - started, traced)
+
+    def wrap(self, name: str, func: Callable[..., T]) -> Callable[..., T]:
+        if not self.enabled:
+            return func
+
+        @wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> T:
+            traced = tracemalloc.get_traced_memory()[0] if self.tracing else 0
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record(name, time.perf_counter() - started, traced)
+
+        return timed
+
+    def iterate(self, name: str, iterable: Iterable[T]) -> Iterable[T]:
+        if not self.enabled:
+            return iterable
+        return self._iterate(name, iter(iterable))
+
+    def _iterate(self, name: str, iterator: Iterator[T]) -> Iterator[T]:
+        while True:
+            traced = tracemalloc.get_traced_memory()[0] if self.tracing else 0
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            self._record(name, time.perf_counter() - started, traced)
+            yield item
+
+    def _record(self, name: str, seconds: float, traced_before: int) -> None:
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        if self.tracing:
+            stats.allocated_bytes += max(0, tracemalloc.get_traced_memory()[0] - traced_before)
+        if stats.calls % RSS_SAMPLE_EVERY == 1:
+            stats.max_rss_mb = max(stats.max_rss_mb, get_rss_mb())
+
+    def snapshot(self, label: str) -> None:
+        """Record the top ``tracemalloc_top`` allocating source lines at this point."""
+        if not self.tracing:
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        self.snapshots[label] = [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "sizeBytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in snapshot.statistics("lineno")[: self.tracemalloc_top]
+        ]
+
+    def report(self) -> dict[str, Any]:
+        """Stop tracemalloc if this profiler started it and return the JSON-ready report."""
+        traced_peak = None
+        if self.tracing:
+            traced_peak = tracemalloc.get_traced_memory()[1]
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        ordered = sorted(
+            self.stages.items(),
+            key=lambda item: STAGES.index(item[0]) if item[0] in STAGES else len(STAGES),
+        )
+        return {
+            "stages": {name: stats.to_dict() for name, stats in ordered},
+            "rss": {
+                "startMb": round(self._rss_start_mb, 2),
+                "endMb": round(get_rss_mb(), 2),
+                "peakMb": round(get_peak_rss_mb(), 2),
+            },
+            "tracemalloc": None
+            if traced_peak is None
+            else {"peakBytes": traced_peak, "top": self.snapshots},
+        }
+
+
+DISABLED = StageProfiler(enabled=False)
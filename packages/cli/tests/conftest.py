@@ -68,6 +68,7 @@ def cli_settings() -> CliSettings:
         api_token="test-token",
         batch_size=2,
         source="unit-tests",
+        retry_base_delay=0.0,
     )
 
 
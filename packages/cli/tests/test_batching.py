@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+
+from metadata_cli.services.batching import AdaptiveBatchSizer
+
+
+def _sizer(**overrides) -> AdaptiveBatchSizer:
+    options = {"initial": 100, "minimum": 10, "maximum": 200, "latency_budget_seconds": 1.0}
+    options.update(overrides)
+    return AdaptiveBatchSizer(**options)
+
+
+def test_sizer_grows_additively_while_under_budget():
+    sizer = _sizer()
+
+    assert sizer.observe(batch_size=100, duration_seconds=0.1, status=202) == 110
+    assert sizer.observe(batch_size=110, duration_seconds=0.1, status=202) == 120
+    # Trailing partial batches and slow-but-within-budget batches hold the size steady.
+    assert sizer.observe(batch_size=30, duration_seconds=0.1, status=202) == 120
+    assert sizer.observe(batch_size=120, duration_seconds=0.8, status=202) == 120
+
+
+def test_sizer_halves_on_budget_breach_and_server_errors():
+    sizer = _sizer()
+
+    assert sizer.observe(batch_size=100, duration_seconds=1.5, status=202) == 50
+    assert sizer.observe(batch_size=50, duration_seconds=0.1, status=413) == 25
+    assert sizer.observe(batch_size=25, duration_seconds=0.1, status=503) == 12
+    assert sizer.observe(batch_size=12, duration_seconds=0.1, status=503) == 10
+    assert sizer.summary() == {
+        "finalBatchSize": 10,
+        "minBatchSize": 10,
+        "maxBatchSize": 200,
+        "increases": 0,
+        "decreases": 4,
+    }
+
+
+def test_sizer_clamps_initial_size_and_rejects_bad_bounds():
+    assert _sizer(initial=500).current == 200
+    assert _sizer(initial=1).current == 10
+    with pytest.raises(ValueError):
+        _sizer(minimum=300)
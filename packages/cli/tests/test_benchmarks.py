@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from metadata_cli.benchmarks.ingest import compare, percentile, run_benchmark
+from metadata_cli.benchmarks.startup import DEFAULT_BUDGET_MS, measure_startup
+from metadata_cli.benchmarks.stub_api import StubBehavior
+from metadata_cli.benchmarks.synthetic import GraphSpec, write_dataset
+from metadata_cli.services.ingest import DatasetLoader
+
+
+@pytest.mark.parametrize("data_format", ["json", "ndjson", "csv"])
+def test_synthetic_datasets_load_in_every_format(data_format, tmp_path: Path):
+    spec = GraphSpec(nodes=40, edges=100, property_bytes=16)
+    path = write_dataset(tmp_path / f"graph.{data_format}", spec)
+
+    dataset = DatasetLoader(data_format).load(path)
+
+    assert len(dataset.nodes) == 40
+    assert len(dataset.edges) == 100
+    node_ids = {node.id for node in dataset.nodes}
+    assert all(edge.sourceId in node_ids and edge.targetId in node_ids for edge in dataset.edges)
+    assert len(dataset.nodes[0].properties["blob"]) == 16
+
+
+def test_powerlaw_degree_concentrates_edges_on_hubs(tmp_path: Path):
+    spec = GraphSpec(nodes=200, edges=2000, degree="powerlaw", alpha=1.5)
+    dataset = DatasetLoader("ndjson").load(write_dataset(tmp_path / "graph.ndjson", spec))
+
+    hub_edges = sum(edge.sourceId == "node-0" for edge in dataset.edges)
+    assert hub_edges > 2000 / 200 * 10
+
+
+def test_local_degree_links_nearby_nodes(tmp_path: Path):
+    spec = GraphSpec(nodes=1000, edges=3000, degree="local")
+    dataset = DatasetLoader("ndjson").load(write_dataset(tmp_path / "graph.ndjson", spec))
+
+    def position(node_id: str) -> int:
+        return int(node_id.removeprefix("node-"))
+
+    assert all(
+        abs(position(edge.sourceId) - position(edge.targetId)) <= 10 for edge in dataset.edges
+    )
+    assert position(dataset.edges[0].sourceId) == 0
+    assert position(dataset.edges[-1].sourceId) == 999
+
+
+def test_run_benchmark_reports_throughput_against_stub(tmp_path: Path):
+    report = run_benchmark(
+        GraphSpec(nodes=30, edges=50, property_bytes=8),
+        StubBehavior(error_rate=0.2, seed=3),
+        data_format="ndjson",
+        workdir=tmp_path,
+        cli_options={"batch_size": 10, "stream": True, "retry_base_delay": 0.0, "max_retries": 10},
+    )
+
+    results = report["results"]
+    assert results["items"] == 80
+    assert results["batches"] == 8
+    assert results["retries"] == results["stubErrors"] > 0
+    assert results["stubRequests"] == 8 + results["retries"]
+    latency = results["latencyMs"]
+    assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    assert compare(report, report)["itemsPerSecond"] == 1.0
+
+
+def test_percentile_matches_nearest_rank():
+    assert percentile([], 0.5) == 0.0
+    assert percentile([5, 1, 3, 2, 4], 0.5) == 3
+    assert percentile(list(range(1, 101)), 0.95) == 96
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["jobs", "stats", "--help"]])
+def test_help_starts_within_budget_without_heavy_imports(argv):
+    report = measure_startup(argv, runs=3)
+
+    assert report["heavyModules"] == []
+    assert report["bestMs"] < DEFAULT_BUDGET_MS, report["slowestImports"]
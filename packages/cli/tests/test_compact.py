@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from metadata_cli.benchmarks.memory import compare
+from metadata_cli.benchmarks.synthetic import GraphSpec, write_dataset
+from metadata_cli.models import EdgeModel, NodeModel
+from metadata_cli.services.compact import CompactDataset
+from metadata_cli.services.encoding import BatchEncoder
+from metadata_cli.services.ingest import DatasetLoader
+
+
+@pytest.mark.parametrize("data_format", ["json", "ndjson", "csv"])
+def test_compact_batches_encode_like_models(data_format, tmp_path: Path):
+    spec = GraphSpec(nodes=30, edges=80, property_bytes=8)
+    path = write_dataset(tmp_path / f"graph.{data_format}", spec)
+    loader = DatasetLoader(data_format)
+    models = loader.load(path)
+    compact = loader.load_compact(path)
+    encoder = BatchEncoder("tester")
+
+    for resource in ("nodes", "edges"):
+        expected = encoder.encode_batch(getattr(models, resource), "job")
+        assert encoder.encode_batch(list(getattr(compact, resource)), "job") == expected
+    assert compact.metadata == models.metadata
+
+
+def test_string_table_interns_ids_and_keeps_missing_actors():
+    dataset = CompactDataset()
+    dataset.nodes.append(NodeModel(id="a", type="workspace", properties={"x": 1}))
+    dataset.nodes.append(NodeModel(id="b", type="workspace", properties={}, createdBy="ann"))
+    for index in range(3):
+        dataset.edges.append(
+            EdgeModel(id=f"e{index}", sourceId="a", targetId="b", type="link", properties={})
+        )
+    dataset.freeze()
+
+    # a, workspace, b, ann, e0, link, e1, e2: shared IDs and types are stored once.
+    assert len(dataset.strings) == 8
+    first, second = dataset.nodes
+    assert (first.createdBy, second.createdBy, second.updatedBy) == (None, "ann", None)
+    assert first.properties == {"x": 1}
+    assert [(edge.sourceId, edge.targetId) for edge in dataset.edges] == [("a", "b")] * 3
+    assert dataset.edges[-1].id == "e2"
+    with pytest.raises(IndexError):
+        dataset.edges[3]
+    with pytest.raises(RuntimeError, match="frozen"):
+        dataset.nodes.append(NodeModel(id="c", type="workspace", properties={}))
+
+
+def test_compact_load_holds_an_order_of_magnitude_less(tmp_path: Path):
+    spec = GraphSpec(nodes=500, edges=10_000, property_bytes=0)
+    path = write_dataset(tmp_path / "graph.ndjson", spec)
+
+    report = compare(path, "ndjson")
+
+    assert report["reduction"] >= 10, json.dumps(report)
+
+
+@pytest.mark.parametrize(
+    ("data_format", "reader"),
+    [("json", "_load_json"), ("ndjson", "_ndjson_payloads"), ("csv", "_csv_records")],
+)
+def test_compact_load_reads_the_file_once(data_format, reader, tmp_path: Path, monkeypatch):
+    path = write_dataset(tmp_path / f"graph.{data_format}", GraphSpec(nodes=20, edges=40))
+    loader = DatasetLoader(data_format)
+    reads: list[Path] = []
+    read = getattr(loader, reader)
+    monkeypatch.setattr(loader, reader, lambda path: reads.append(path) or read(path))
+
+    dataset = loader.load_compact(path)
+    assert (len(dataset.nodes), len(dataset.edges), reads) == (20, 40, [path])
+
+    if data_format == "json":
+        # --stream cannot parse JSON incrementally; both resources come from one load.
+        streamed = [len(list(loader.stream(path, resource))) for resource in ("nodes", "edges")]
+        assert streamed == [20, 40]
+        assert reads == [path, path]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from metadata_cli.services.csv_records import iter_csv_records, parse_csv_chunk, split_csv
+from metadata_cli.services.ingest import DatasetLoader
+from metadata_cli.services.ordered_pool import run_ordered
+
+
+@pytest.fixture()
+def multiline_csv(tmp_path: Path) -> Path:
+    """CSV whose quoted properties span lines and contain escaped quotes and commas."""
+    dataset_path = tmp_path / "multiline.csv"
+    with dataset_path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["id", "type", "properties", "sourceId", "targetId"])
+        for index in range(40):
+            note = f'line one\nline "two", {index}\n' if index % 3 == 0 else f"plain {index}"
+            writer.writerow([f"node-{index}", "workspace", json.dumps({"note": note}), "", ""])
+        for index in range(39):
+            writer.writerow(
+                [f"edge-{index}", "link", "{}", f"node-{index}", f"node-{index + 1}"]
+            )
+    return dataset_path
+
+
+def test_split_csv_aligns_chunks_to_record_boundaries(multiline_csv: Path):
+    fieldnames, ranges = split_csv(multiline_csv, chunk_bytes=64)
+
+    assert fieldnames == ["id", "type", "properties", "sourceId", "targetId"]
+    assert len(ranges) > 10
+    assert ranges[-1][1] == multiline_csv.stat().st_size
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    raw = multiline_csv.read_bytes()
+    for start, end in ranges:
+        rows = list(csv.reader(raw[start:end].decode("utf-8").splitlines(keepends=True)))
+        assert all(len(row) == len(fieldnames) for row in rows)
+
+
+def test_parallel_parse_preserves_input_order(multiline_csv: Path):
+    sequential = [(resource, record) for _, resource, record in iter_csv_records(multiline_csv)]
+    fieldnames, ranges = split_csv(multiline_csv, chunk_bytes=64)
+    tasks = [(parse_csv_chunk, str(multiline_csv), chunk, fieldnames) for chunk in ranges]
+    parallel = [
+        (resource, record)
+        for chunk in run_ordered(tasks, workers=2)
+        for _, resource, record in chunk
+    ]
+
+    assert parallel == sequential
+    assert parallel[0][1]["properties"]["note"].startswith("line one\n")
+
+
+def test_loader_uses_parse_workers_for_csv(multiline_csv: Path):
+    eager = DatasetLoader("csv", parse_workers=2).load(multiline_csv)
+
+    assert [node.id for node in eager.nodes] == [f"node-{index}" for index in range(40)]
+    assert len(eager.edges) == 39
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+
+from metadata_cli.benchmarks import encoding as encoding_benchmark
+from metadata_cli.models import EdgeModel, NodeModel
+from metadata_cli.services.encoding import BatchEncoder
+
+
+def test_batch_encoder_matches_legacy_payload_without_mutating_models():
+    nodes = [
+        NodeModel(id="node-1", type="workspace", properties={"name": "alpha"}),
+        NodeModel(id="node-2", type="workspace", properties={}, createdBy="importer"),
+    ]
+    encoded = BatchEncoder("benchmark").encode_batch(nodes, "job-1")
+
+    assert json.loads(encoded) == json.loads(encoding_benchmark.legacy_encode(nodes, "job-1"))
+    assert json.loads(encoded)["items"][1]["updatedBy"] == "importer"
+    assert nodes[0].createdBy is None
+
+
+def test_batch_encoder_keeps_edge_fields():
+    edge = EdgeModel(
+        id="edge-1",
+        sourceId="node-1",
+        targetId="node-2",
+        type="link",
+        properties={},
+        updatedBy="ops",
+    )
+
+    item = json.loads(BatchEncoder("cli").encode_batch([edge], "job-2"))["items"][0]
+
+    assert item == {
+        "id": "edge-1",
+        "sourceId": "node-1",
+        "targetId": "node-2",
+        "type": "link",
+        "properties": {},
+        "createdBy": "cli",
+        "updatedBy": "ops",
+    }
+
+
+def test_encoding_benchmark_reports_both_paths(capsys):
+    report = encoding_benchmark.main(["--nodes", "50", "--batch-size", "20"])
+
+    assert report["legacy"]["bytes"] > report["batchEncoder"]["bytes"] > 0
+    assert json.loads(capsys.readouterr().out)["nodes"] == 50
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import httpx
+import pytest
+
+from metadata_cli.config import CliSettings
+from metadata_cli.services.endpoints import MAX_EJECT_SECONDS, EndpointPool
+from metadata_cli.services.ingest import IngestionRunner
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_pool_prefers_least_outstanding_then_round_robins():
+    pool = EndpointPool(["https://a", "https://b", "https://c"])
+
+    first, second, third = pool.acquire(), pool.acquire(), pool.acquire()
+    assert [first.url, second.url, third.url] == ["https://a", "https://b", "https://c"]
+    pool.release(second, duration_seconds=0.01, status=202)
+    assert pool.acquire() is second  # the only endpoint with nothing in flight
+    for endpoint in (first, second, third):
+        pool.release(endpoint, duration_seconds=0.01, status=202)
+    assert [pool.acquire().url for _ in range(3)] == ["https://a", "https://c", "https://b"]
+
+
+def test_failing_endpoint_is_ejected_and_readmitted_on_probation():
+    clock = FakeClock()
+    pool = EndpointPool(["https://a", "https://b"], eject_after=2, eject_seconds=10, clock=clock)
+    a, b = pool.endpoints
+
+    for status in (503, None):
+        assert (pool.acquire(), pool.acquire()) == (a, b)
+        pool.release(b, duration_seconds=0.1, status=202)
+        ejected = pool.release(a, duration_seconds=0.1, status=status)
+    assert ejected and a.ejections == 1
+    for _ in range(3):
+        assert pool.acquire() is b
+        pool.release(b, duration_seconds=0.1, status=202)
+
+    clock.now = 10.0
+    assert pool.acquire() is a
+    assert pool.release(a, duration_seconds=0.1, status=502)  # one failure on probation
+    assert a.ejected_until == 30.0  # the ejection time doubled
+
+    # With every endpoint out, the one due back first still takes traffic.
+    for _ in range(2):
+        pool.release(pool.acquire(), duration_seconds=0.1, status=500)
+    assert b.ejected_until == 20.0
+    assert pool.acquire() is b
+    assert pool.to_dict()["https://a"]["ejected"] is True
+    pool.release(b, duration_seconds=0.1, status=202)
+
+    a.ejections = 30
+    clock.now = 100.0
+    assert pool.acquire() is a
+    pool.release(a, duration_seconds=0.1, status=500)
+    assert a.ejected_until == 100.0 + MAX_EJECT_SECONDS
+
+
+def test_single_endpoint_is_never_ejected():
+    pool = EndpointPool(["https://only"], eject_after=1)
+    endpoint = pool.acquire()
+
+    assert not pool.release(endpoint, duration_seconds=0.1, status=None)
+    assert endpoint.ejected_until == 0.0
+
+
+def test_settings_accept_several_api_urls():
+    options = dict(org="demo-org", api_token=None, batch_size=10, source=None, job_store=None)
+    settings = CliSettings.from_options(
+        api_url=["https://a.local/", "https://b.local"], dataset_format="json", **options
+    )
+
+    assert settings.base_url == "https://a.local"
+    assert settings.base_urls == ("https://a.local", "https://b.local")
+    with pytest.raises(ValueError, match="must not repeat"):
+        CliSettings.from_options(
+            api_url=["https://a.local/", "https://a.local"], dataset_format="json", **options
+        )
+
+
+def test_ingest_routes_around_a_failing_replica(cli_settings, job_store, tmp_path: Path):
+    dataset_path = tmp_path / "nodes.json"
+    nodes = [{"id": f"node-{i}", "type": "workspace", "properties": {}} for i in range(20)]
+    dataset_path.write_text(json.dumps({"nodes": nodes}), encoding="utf-8")
+    hits: dict[str, int] = {}
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        hits[request.url.host] = hits.get(request.url.host, 0) + 1
+        if request.url.host == "down.local":
+            return httpx.Response(503)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        items = json.loads(request.content)["items"]
+        return httpx.Response(202, json={"accepted": len(items)})
+
+    settings = replace(
+        cli_settings,
+        api_url="https://up.local",
+        api_urls=("https://up.local", "https://down.local", "https://spare.local"),
+        batch_size=1,
+        concurrency=2,
+        eject_after=2,
+    )
+    runner = IngestionRunner(
+        settings=settings,
+        job_store=job_store,
+        http_client=httpx.Client(transport=httpx.MockTransport(lambda _: httpx.Response(500))),
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    job = runner.run(dataset_path)
+
+    assert job.status == "succeeded"
+    assert hits["down.local"] == 2
+    assert hits["up.local"] + hits["spare.local"] == 20
+    assert job.metrics["retries"] == 2
+    assert peak == 2
+    endpoints = job.metrics["endpoints"]
+    assert endpoints["https://down.local"]["ejections"] == 1
+    assert endpoints["https://down.local"]["itemsAccepted"] == 0
+    assert endpoints["https://up.local"]["itemsAccepted"] >= 5
+    assert endpoints["https://spare.local"]["itemsAccepted"] >= 5
+    accepted = sum(endpoint["itemsAccepted"] for endpoint in endpoints.values())
+    assert accepted == job.metrics["nodesAccepted"] == 20
+    assert endpoints["https://up.local"]["latencyMs"]["max"] > 0
+
+
+def test_items_are_credited_to_the_endpoint_whatever_httpx_normalises(
+    cli_settings, job_store, tmp_path: Path
+):
+    dataset_path = tmp_path / "nodes.json"
+    nodes = [{"id": f"node-{i}", "type": "workspace", "properties": {}} for i in range(4)]
+    dataset_path.write_text(json.dumps({"nodes": nodes}), encoding="utf-8")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert str(request.url).startswith("https://api.local/")
+        return httpx.Response(202, json={"accepted": len(json.loads(request.content)["items"])})
+
+    transport = httpx.MockTransport(handler)
+    settings = replace(
+        cli_settings, api_url="https://API.local:443", api_urls=("https://API.local:443",)
+    )
+    runner = IngestionRunner(
+        settings=settings,
+        job_store=job_store,
+        http_client=httpx.Client(transport=transport),
+        async_http_client=httpx.AsyncClient(transport=transport),
+    )
+
+    job = runner.run(dataset_path)
+
+    assert job.status == "succeeded"
+    assert job.metrics["endpoints"]["https://API.local:443"]["itemsAccepted"] == 4
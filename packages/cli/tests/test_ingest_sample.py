@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
 import json
+import os
+import threading
+import zlib
+from dataclasses import replace
 from pathlib import Path
 
 import httpx
@@ -8,7 +14,12 @@ import pytest
 
 from metadata_cli.config import CliSettings
 from metadata_cli.errors import DatasetValidationError, IngestionError
-from metadata_cli.services.ingest import IngestionRunner
+from metadata_cli.services.ingest import (
+    DatasetLoader,
+    IngestionRunner,
+    expand_dataset_paths,
+    fingerprint_dataset,
+)
 
 
 def _make_client(handler) -> httpx.Client:
@@ -153,3 +164,702 @@ def test_csv_ingest_parses_nodes_and_edges(sample_csv, cli_settings, job_store):
     metrics = job_store.list_jobs()[0].metrics
     assert metrics["nodesAccepted"] == 2
     assert metrics["edgesAccepted"] == 1
+
+
+def _streaming_settings(cli_settings: CliSettings, dataset_format: str) -> CliSettings:
+    return CliSettings.from_options(
+        org=cli_settings.org_id,
+        api_url=cli_settings.api_url,
+        api_token=cli_settings.api_token,
+        batch_size=cli_settings.batch_size,
+        source=cli_settings.source,
+        job_store=cli_settings.job_store_path,
+        dataset_format=dataset_format,
+        stream=True,
+    )
+
+
+def test_stream_ndjson_ships_batches_from_iterator(cli_settings, job_store, tmp_path: Path):
+    lines = [
+        json.dumps({"nodes": [{"id": f"node-{i}", "type": "workspace", "properties": {}}]})
+        for i in range(5)
+    ]
+    lines.append(
+        json.dumps(
+            {"edges": [{"id": "edge-1", "sourceId": "node-0", "targetId": "node-4", "type": "link", "properties": {}}]}
+        )
+    )
+    dataset_path = tmp_path / "stream.ndjson"
+    dataset_path.write_text("\n".join(lines), encoding="utf-8")
+    captured: list[tuple[str, list[str]]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content.decode("utf-8"))
+        captured.append((request.url.path, [item["id"] for item in payload["items"]]))
+        return httpx.Response(202, json={"accepted": len(payload["items"])})
+
+    runner = IngestionRunner(
+        settings=_streaming_settings(cli_settings, "ndjson"),
+        job_store=job_store,
+        http_client=_make_client(handler),
+    )
+
+    records = runner.loader.stream(dataset_path, "nodes")
+    assert not isinstance(records, list)
+    assert next(records).id == "node-0"
+
+    job = runner.run(dataset_path)
+
+    assert job.status == "succeeded"
+    assert captured == [
+        ("/orgs/demo-org/nodes", ["node-0", "node-1"]),
+        ("/orgs/demo-org/nodes", ["node-2", "node-3"]),
+        ("/orgs/demo-org/nodes", ["node-4"]),
+        ("/orgs/demo-org/edges", ["edge-1"]),
+    ]
+    assert job.metrics["batches"] == 4
+
+
+def test_stream_csv_matches_eager_loader(sample_csv):
+    loader = DatasetLoader("csv")
+    eager = loader.load(sample_csv)
+
+    streamed_nodes = list(loader.stream(sample_csv, "nodes"))
+    streamed_edges = list(loader.stream(sample_csv, "edges"))
+
+    assert [node.id for node in streamed_nodes] == [node.id for node in eager.nodes]
+    assert [(edge.sourceId, edge.targetId) for edge in streamed_edges] == [
+        (edge.sourceId, edge.targetId) for edge in eager.edges
+    ]
+
+
+def test_stream_invalid_record_marks_job_failed(cli_settings, job_store, tmp_path: Path):
+    lines = [
+        json.dumps({"nodes": [{"id": "node-1", "type": "workspace", "properties": {}}]}),
+        json.dumps({"nodes": [{"id": "node-2", "type": "workspace"}]}),
+    ]
+    dataset_path = tmp_path / "broken.ndjson"
+    dataset_path.write_text("\n".join(lines), encoding="utf-8")
+
+    runner = IngestionRunner(
+        settings=_streaming_settings(cli_settings, "ndjson"),
+        job_store=job_store,
+        http_client=_make_client(lambda _: httpx.Response(202, json={"accepted": 1})),
+    )
+
+    with pytest.raises(DatasetValidationError, match="line 2"):
+        runner.run(dataset_path)
+
+    assert job_store.list_jobs()[0].status == "failed"
+
+
+def _concurrent_settings(cli_settings: CliSettings, concurrency: int) -> CliSettings:
+    return CliSettings.from_options(
+        org=cli_settings.org_id,
+        api_url=cli_settings.api_url,
+        api_token=cli_settings.api_token,
+        batch_size=1,
+        source=cli_settings.source,
+        job_store=cli_settings.job_store_path,
+        dataset_format="json",
+        concurrency=concurrency,
+    )
+
+
+def _write_chain_dataset(tmp_path: Path, nodes: int) -> Path:
+    payload = {
+        "nodes": [{"id": f"node-{i}", "type": "workspace", "properties": {}} for i in range(nodes)],
+        "edges": [
+            {
+                "id": f"edge-{i}",
+                "sourceId": f"node-{i}",
+                "targetId": f"node-{i + 1}",
+                "type": "link",
+                "properties": {},
+            }
+            for i in range(nodes - 1)
+        ],
+    }
+    dataset_path = tmp_path / "chain.json"
+    dataset_path.write_text(json.dumps(payload), encoding="utf-8")
+    return dataset_path
+
+
+def test_concurrent_ingest_keeps_batches_in_flight(cli_settings, job_store, tmp_path: Path):
+    dataset_path = _write_chain_dataset(tmp_path, nodes=8)
+    paths: list[str] = []
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        paths.append(request.url.path)
+        return httpx.Response(202, json={"accepted": 1})
+
+    runner = IngestionRunner(
+        settings=_concurrent_settings(cli_settings, concurrency=4),
+        job_store=job_store,
+        http_client=_make_client(lambda _: httpx.Response(500)),
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    job = runner.run(dataset_path)
+
+    assert job.status == "succeeded"
+    assert peak == 4
+    assert paths.index("/orgs/demo-org/edges") == 8
+    assert set(paths[8:]) == {"/orgs/demo-org/edges"}
+    assert job.metrics["nodesAccepted"] == 8
+    assert job.metrics["edgesAccepted"] == 7
+    assert job.metrics["batches"] == 15
+
+
+def test_concurrent_ingest_failure_marks_job_failed(cli_settings, job_store, tmp_path: Path):
+    dataset_path = _write_chain_dataset(tmp_path, nodes=6)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/edges"):
+            return httpx.Response(503)
+        return httpx.Response(202, json={"accepted": 1})
+
+    runner = IngestionRunner(
+        settings=_concurrent_settings(cli_settings, concurrency=3),
+        job_store=job_store,
+        http_client=_make_client(lambda _: httpx.Response(500)),
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    with pytest.raises(IngestionError, match="edges request failed with status 503"):
+        runner.run(dataset_path)
+
+    stored_job = job_store.list_jobs()[0]
+    assert stored_job.status == "failed"
+    assert stored_job.metrics["nodesAccepted"] == 6
+
+
+def test_resume_skips_acknowledged_batches(cli_settings, job_store, tmp_path: Path):
+    dataset_path = _write_chain_dataset(tmp_path, nodes=6)
+    calls: list[tuple[str, list[str]]] = []
+    fail_edges = True
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content.decode("utf-8"))
+        ids = [item["id"] for item in payload["items"]]
+        if fail_edges and "edge-2" in ids:
+            return httpx.Response(502)
+        calls.append((request.url.path, ids))
+        return httpx.Response(202, json={"accepted": len(ids)})
+
+    runner = IngestionRunner(
+        settings=cli_settings, job_store=job_store, http_client=_make_client(handler)
+    )
+    with pytest.raises(IngestionError):
+        runner.run(dataset_path)
+    failed_job = job_store.list_jobs()[0]
+    assert failed_job.status == "failed"
+
+    calls.clear()
+    fail_edges = False
+    job = runner.run(dataset_path, resume_job_id=failed_job.job_id)
+
+    assert job.job_id == failed_job.job_id
+    assert job.status == "succeeded"
+    assert calls == [
+        ("/orgs/demo-org/edges", ["edge-2", "edge-3"]),
+        ("/orgs/demo-org/edges", ["edge-4"]),
+    ]
+    assert job.metrics["nodesAccepted"] == 6
+    assert job.metrics["edgesAccepted"] == 5
+    assert job.metrics["resumedFrom"] == {"nodes": 6, "edges": 2}
+
+
+def test_streamed_resume_skips_acknowledged_records_unvalidated(
+    cli_settings, job_store, tmp_path: Path
+):
+    chain = json.loads(_write_chain_dataset(tmp_path, nodes=6).read_text(encoding="utf-8"))
+    dataset_path = tmp_path / "chain.ndjson"
+    dataset_path.write_text(
+        "".join(
+            json.dumps({resource: [record]}) + "\n"
+            for resource in ("nodes", "edges")
+            for record in chain[resource]
+        ),
+        encoding="utf-8",
+    )
+    fail_edges = True
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = [item["id"] for item in json.loads(request.content)["items"]]
+        if fail_edges and "edge-2" in ids:
+            return httpx.Response(502)
+        return httpx.Response(202, json={"accepted": len(ids)})
+
+    settings = replace(cli_settings, dataset_format="ndjson", stream=True)
+    runner = IngestionRunner(
+        settings=settings, job_store=job_store, http_client=_make_client(handler)
+    )
+    with pytest.raises(IngestionError):
+        runner.run(dataset_path)
+    failed_job = job_store.list_jobs()[0]
+
+    validated: list[str] = []
+    validate = runner.loader.validator.validate
+
+    def counting_validate(path, resource, location, item):
+        validated.append(item["id"])
+        return validate(path, resource, location, item)
+
+    runner.loader.validator.validate = counting_validate
+    fail_edges = False
+    job = runner.run(dataset_path, resume_job_id=failed_job.job_id)
+
+    assert job.status == "succeeded"
+    assert job.metrics["resumedFrom"] == {"nodes": 6, "edges": 2}
+    assert job.metrics["edgesAccepted"] == 5
+    assert validated == ["edge-2", "edge-3", "edge-4"]
+
+
+def test_resume_refuses_changed_dataset(cli_settings, job_store, tmp_path: Path):
+    dataset_path = _write_chain_dataset(tmp_path, nodes=3)
+    runner = IngestionRunner(
+        settings=cli_settings,
+        job_store=job_store,
+        http_client=_make_client(lambda _: httpx.Response(500)),
+    )
+    with pytest.raises(IngestionError):
+        runner.run(dataset_path)
+    failed_job = job_store.list_jobs()[0]
+
+    _write_chain_dataset(tmp_path, nodes=4)
+
+    with pytest.raises(IngestionError, match="Dataset changed"):
+        runner.run(dataset_path, resume_job_id=failed_job.job_id)
+    assert job_store.get_job(failed_job.job_id).status == "failed"
+
+
+def test_only_failed_jobs_hash_the_dataset(cli_settings, job_store, tmp_path: Path):
+    dataset_path = _write_chain_dataset(tmp_path, nodes=3)
+    failing = True
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500 if failing else 202, json={"accepted": 1})
+
+    runner = IngestionRunner(
+        settings=cli_settings, job_store=job_store, http_client=_make_client(handler)
+    )
+    with pytest.raises(IngestionError):
+        runner.run(dataset_path)
+    failed_job = job_store.list_jobs()[0]
+    assert job_store.get_dataset(failed_job.job_id)["fingerprint"] == fingerprint_dataset(
+        dataset_path, content=True
+    )
+
+    failing = False
+    succeeded = runner.run(dataset_path)
+    assert job_store.get_dataset(succeeded.job_id)["fingerprint"] == fingerprint_dataset(
+        dataset_path
+    )
+
+    # Same size and mtime, different content: only the hash can tell.
+    stat = dataset_path.stat()
+    dataset_path.write_text(dataset_path.read_text().replace("node-1", "node-9"))
+    os.utime(dataset_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    with pytest.raises(IngestionError, match="Dataset changed"):
+        runner.run(dataset_path, resume_job_id=failed_job.job_id)
+
+
+def test_delta_sends_only_changed_records(cli_settings, job_store, tmp_path: Path):
+    nodes = [
+        {"id": f"node-{index}", "type": "workspace", "properties": {"rev": 1}} for index in range(3)
+    ]
+    edges = [
+        {"id": "edge-1", "sourceId": "node-0", "targetId": "node-1", "type": "link", "properties": {}}
+    ]
+    dataset_path = tmp_path / "snapshot.json"
+    dataset_path.write_text(json.dumps({"nodes": nodes, "edges": edges}), encoding="utf-8")
+    deletions_path = tmp_path / "deletions.ndjson"
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = [item["id"] for item in json.loads(request.content)["items"]]
+        sent.extend(ids)
+        return httpx.Response(202, json={"accepted": len(ids)})
+
+    settings = replace(cli_settings, delta=True, delta_deletions=deletions_path)
+    runner = IngestionRunner(
+        settings=settings, job_store=job_store, http_client=_make_client(handler)
+    )
+    runner.run(dataset_path)
+    assert sent == ["node-0", "node-1", "node-2", "edge-1"]
+    assert (tmp_path / "delta-cache.sqlite").exists()
+
+    sent.clear()
+    nodes[1]["properties"]["rev"] = 2
+    dataset_path.write_text(json.dumps({"nodes": nodes[:2], "edges": edges}), encoding="utf-8")
+    job = runner.run(dataset_path)
+
+    assert sent == ["node-1"]
+    assert job.metrics["nodesAccepted"] == 1
+    assert job.metrics["edgesAccepted"] == 0
+    assert job.metrics["delta"] == {
+        "changed": {"nodes": 1, "edges": 0},
+        "unchanged": {"nodes": 1, "edges": 1},
+        "deleted": {"edges": 0, "nodes": 1},
+    }
+    assert [json.loads(line) for line in deletions_path.read_text().splitlines()] == [
+        {"resource": "nodes", "id": "node-2"}
+    ]
+
+    sent.clear()
+    job = runner.run(dataset_path)
+    assert job.status == "succeeded"
+    assert sent == []
+    assert deletions_path.read_text() == ""
+
+
+def test_delta_does_not_delete_quarantined_or_skipped_records(
+    cli_settings, job_store, tmp_path: Path
+):
+    nodes = [
+        {"id": f"n{index}", "type": "workspace", "properties": {"rev": 1}} for index in range(3)
+    ]
+    dataset_path = tmp_path / "snapshot.json"
+    dataset_path.write_text(json.dumps({"nodes": nodes}), encoding="utf-8")
+    deletions_path = tmp_path / "deletions.ndjson"
+    rejected: set[str] = set()
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = [item["id"] for item in json.loads(request.content)["items"]]
+        if rejected.intersection(ids):
+            return httpx.Response(422, json={"error": "invalid record"})
+        sent.extend(ids)
+        return httpx.Response(202, json={"accepted": len(ids)})
+
+    settings = replace(
+        cli_settings,
+        delta=True,
+        delta_deletions=deletions_path,
+        dead_letter_path=tmp_path / "dead-letter.ndjson",
+        skip_invalid=True,
+    )
+    runner = IngestionRunner(
+        settings=settings, job_store=job_store, http_client=_make_client(handler)
+    )
+    runner.run(dataset_path)
+
+    rejected.add("n1")
+    nodes[1]["properties"]["rev"] = 2
+    nodes[2]["properties"] = "not-an-object"
+    dataset_path.write_text(json.dumps({"nodes": nodes}), encoding="utf-8")
+    job = runner.run(dataset_path)
+
+    assert job.status == "succeeded"
+    assert job.metrics["quarantined"] == {"nodes": 1}
+    assert job.metrics["delta"]["deleted"] == {"edges": 0, "nodes": 0}
+    assert deletions_path.read_text() == ""
+
+    # The quarantined edit kept its old hash, so it is sent again once the API takes it.
+    rejected.clear()
+    sent.clear()
+    runner.run(dataset_path)
+    assert sent == ["n1"]
+
+
+def test_transient_failures_are_retried(cli_settings, job_store, sample_dataset, monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr("metadata_cli.services.ingest.time.sleep", sleeps.append)
+    attempts = {"nodes": 0, "edges": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        resource = request.url.path.rsplit("/", 1)[-1]
+        attempts[resource] += 1
+        if resource == "nodes" and attempts["nodes"] == 1:
+            return httpx.Response(503, headers={"Retry-After": "2"})
+        if resource == "edges" and attempts["edges"] == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(202, json={"accepted": 1})
+
+    runner = IngestionRunner(
+        settings=cli_settings, job_store=job_store, http_client=_make_client(handler)
+    )
+    job = runner.run(sample_dataset)
+
+    assert job.status == "succeeded"
+    assert attempts == {"nodes": 2, "edges": 2}
+    assert sleeps == [2.0, 0.0]
+    assert job.metrics["retries"] == 2
+    assert job.metrics["batches"] == 2
+
+
+def test_exhausted_retries_fail_the_job(cli_settings, job_store, sample_dataset):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(503)
+
+    settings = replace(cli_settings, max_retries=2)
+    runner = IngestionRunner(
+        settings=settings, job_store=job_store, http_client=_make_client(handler)
+    )
+    with pytest.raises(IngestionError, match="status 503"):
+        runner.run(sample_dataset)
+
+    assert len(calls) == 3
+    assert job_store.list_jobs()[0].metrics["retries"] == 2
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_poison_records_are_bisected_to_dead_letter(
+    concurrency, cli_settings, job_store, tmp_path: Path
+):
+    dataset_path = _write_chain_dataset(tmp_path, nodes=8)
+    dead_letter = tmp_path / "dead-letter.ndjson"
+    accepted: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = [item["id"] for item in json.loads(request.content)["items"]]
+        if "node-5" in ids or "edge-2" in ids:
+            return httpx.Response(422, json={"error": "invalid record"})
+        accepted.extend(ids)
+        return httpx.Response(202, json={"accepted": len(ids)})
+
+    settings = replace(
+        cli_settings, batch_size=8, concurrency=concurrency, dead_letter_path=dead_letter
+    )
+    runner = IngestionRunner(
+        settings=settings,
+        job_store=job_store,
+        http_client=_make_client(handler),
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    job = runner.run(dataset_path)
+
+    assert job.status == "succeeded"
+    assert sorted(accepted) == sorted(
+        [f"node-{index}" for index in range(8) if index != 5]
+        + [f"edge-{index}" for index in range(7) if index != 2]
+    )
+    assert job.metrics["nodesAccepted"] == 7
+    assert job.metrics["edgesAccepted"] == 6
+    assert job.metrics["quarantined"] == {"nodes": 1, "edges": 1}
+    entries = [json.loads(line) for line in dead_letter.read_text().splitlines()]
+    assert [(entry["resource"], entry["record"]["id"], entry["status"]) for entry in entries] == [
+        ("nodes", "node-5", 422),
+        ("edges", "edge-2", 422),
+    ]
+
+
+def _write_shards(directory: Path, shards: int, nodes_per_shard: int) -> list[Path]:
+    directory.mkdir()
+    paths = []
+    for shard in range(shards):
+        lines = []
+        for index in range(nodes_per_shard):
+            node = shard * nodes_per_shard + index
+            record = {"id": f"node-{node}", "type": "t", "properties": {}}
+            lines.append(json.dumps({"nodes": [record]}))
+            # Each shard's edges point into the next shard's nodes.
+            target = (node + nodes_per_shard) % (shards * nodes_per_shard)
+            edge = {"id": f"edge-{node}", "sourceId": f"node-{node}", "targetId": f"node-{target}"}
+            lines.append(json.dumps({"edges": [{**edge, "type": "link", "properties": {}}]}))
+        path = directory / f"shard-{shard}.ndjson"
+        path.write_text("\n".join(lines), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_expand_dataset_paths_handles_dirs_globs_and_files(tmp_path: Path):
+    paths = _write_shards(tmp_path / "export", shards=3, nodes_per_shard=1)
+    (tmp_path / "export" / "notes.txt").write_text("skip me", encoding="utf-8")
+
+    assert expand_dataset_paths([str(tmp_path / "export")], "ndjson") == paths
+    pattern = str(tmp_path / "export" / "shard-[12].ndjson")
+    assert expand_dataset_paths([pattern, str(paths[1])], "ndjson") == paths[1:]
+    with pytest.raises(ValueError, match="does not exist"):
+        expand_dataset_paths([str(tmp_path / "missing.ndjson")], "ndjson")
+    with pytest.raises(ValueError, match="No csv dataset files"):
+        expand_dataset_paths([str(tmp_path / "export")], "csv")
+
+
+def test_run_many_ships_all_node_shards_before_edges(cli_settings, job_store, tmp_path: Path):
+    paths = _write_shards(tmp_path / "export", shards=4, nodes_per_shard=3)
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        ids = [item["id"] for item in json.loads(request.content)["items"]]
+        calls.append(request.url.path.rsplit("/", 1)[-1])
+        await asyncio.sleep(0.001)
+        return httpx.Response(202, json={"accepted": len(ids)})
+
+    settings = replace(cli_settings, dataset_format="ndjson", stream=True, file_workers=2)
+    runner = IngestionRunner(
+        settings=settings,
+        job_store=job_store,
+        http_client=_make_client(lambda request: httpx.Response(500)),
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    job = runner.run_many(paths)
+
+    assert job.status == "succeeded"
+    assert calls == ["nodes"] * 8 + ["edges"] * 8
+    assert job.metrics["files"] == 4
+    assert job.metrics["nodesAccepted"] == 12
+    assert job.metrics["edgesAccepted"] == 12
+    subjobs = job_store.list_subjobs(job.job_id)
+    assert [sub.status for sub in subjobs] == ["succeeded"] * 4
+    assert [sub.metrics["nodesAccepted"] for sub in subjobs] == [3, 3, 3, 3]
+    assert {sub.metrics["parentJobId"] for sub in subjobs} == {job.job_id}
+    assert job_store.get_dataset(subjobs[2].job_id)["dataset_path"] == str(paths[2].resolve())
+
+
+def test_run_many_loads_each_file_once_off_the_event_loop(cli_settings, job_store, tmp_path):
+    paths = _write_shards(tmp_path / "export", shards=3, nodes_per_shard=2)
+    settings = replace(cli_settings, dataset_format="ndjson", file_workers=2)
+    runner = IngestionRunner(
+        settings=settings,
+        job_store=job_store,
+        http_client=_make_client(lambda request: httpx.Response(500)),
+        async_http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(202, json={}))
+        ),
+    )
+    loads: list[tuple[Path, bool]] = []
+    load_compact = runner.loader.load_compact
+
+    def recording_load(path: Path):
+        loads.append((path, threading.current_thread() is threading.main_thread()))
+        return load_compact(path)
+
+    runner.loader.load_compact = recording_load
+    job = runner.run_many(paths)
+
+    assert job.status == "succeeded"
+    assert job.metrics["edgesAccepted"] == 6
+    assert sorted(loads) == [(path, False) for path in paths]
+
+
+def test_run_many_isolates_a_failing_file(cli_settings, job_store, tmp_path: Path):
+    paths = _write_shards(tmp_path / "export", shards=3, nodes_per_shard=2)
+    paths[1].write_text("{not json", encoding="utf-8")
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path.rsplit("/", 1)[-1])
+        return httpx.Response(202, json={"accepted": 1})
+
+    settings = replace(cli_settings, dataset_format="ndjson", stream=True)
+    runner = IngestionRunner(
+        settings=settings,
+        job_store=job_store,
+        http_client=_make_client(handler),
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    with pytest.raises(IngestionError, match="1 of 3 files failed: shard-1.ndjson"):
+        runner.run_many(paths)
+
+    aggregate = next(job for job in job_store.list_jobs() if "files" in job.metrics)
+    assert aggregate.status == "failed"
+    assert aggregate.metrics["failedFiles"] == [str(paths[1])]
+    subjobs = job_store.list_subjobs(aggregate.job_id)
+    assert [sub.status for sub in subjobs] == ["succeeded", "failed", "succeeded"]
+    assert "invalid JSON" in subjobs[1].metrics["error"]
+    assert calls.count("edges") == 2
+
+
+def test_adaptive_batching_splits_oversized_batches(cli_settings, job_store, tmp_path: Path):
+    dataset_path = _write_chain_dataset(tmp_path, nodes=8)
+    sizes: list[tuple[str, int]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        items = json.loads(request.content.decode("utf-8"))["items"]
+        if len(items) > 4:
+            return httpx.Response(413)
+        sizes.append((request.url.path.rsplit("/", 1)[-1], len(items)))
+        return httpx.Response(202, json={"accepted": len(items)})
+
+    settings = CliSettings.from_options(
+        org=cli_settings.org_id,
+        api_url=cli_settings.api_url,
+        api_token=cli_settings.api_token,
+        batch_size=8,
+        source=cli_settings.source,
+        job_store=cli_settings.job_store_path,
+        dataset_format="json",
+        adaptive_batching=True,
+        min_batch_size=2,
+        max_batch_size=8,
+    )
+    runner = IngestionRunner(
+        settings=settings, job_store=job_store, http_client=_make_client(handler)
+    )
+
+    job = runner.run(dataset_path)
+
+    assert job.status == "succeeded"
+    assert sizes[:2] == [("nodes", 4), ("nodes", 4)]
+    assert sum(size for resource, size in sizes if resource == "nodes") == 8
+    assert sum(size for resource, size in sizes if resource == "edges") == 7
+    assert job.metrics["batchesSplit"] == 2
+    assert job.metrics["adaptiveBatching"]["nodes"]["finalBatchSize"] == 5
+    assert job.metrics["adaptiveBatching"]["edges"]["decreases"] == 1
+
+
+@pytest.mark.parametrize("algorithm", ["gzip", "deflate"])
+def test_compressed_batches_record_byte_metrics(algorithm, cli_settings, job_store, tmp_path: Path):
+    dataset_path = _write_chain_dataset(tmp_path, nodes=4)
+    decoded: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["content-encoding"] == algorithm
+        decompress = gzip.decompress if algorithm == "gzip" else zlib.decompress
+        decoded.append(json.loads(decompress(request.content)))
+        return httpx.Response(202, json={"accepted": len(decoded[-1]["items"])})
+
+    settings = CliSettings.from_options(
+        org=cli_settings.org_id,
+        api_url=cli_settings.api_url,
+        api_token=cli_settings.api_token,
+        batch_size=cli_settings.batch_size,
+        source=cli_settings.source,
+        job_store=cli_settings.job_store_path,
+        dataset_format="json",
+        compression=algorithm,
+    )
+    runner = IngestionRunner(
+        settings=settings, job_store=job_store, http_client=_make_client(handler)
+    )
+
+    job = runner.run(dataset_path)
+
+    assert job.status == "succeeded"
+    assert decoded[0]["items"][0]["id"] == "node-0"
+    compression = job.metrics["compression"]
+    assert compression["algorithm"] == algorithm
+    assert compression["batches"] == job.metrics["batches"] == 4
+    assert 0 < compression["compressedBytes"] < compression["rawBytes"]
+    assert compression["ratio"] == round(
+        compression["compressedBytes"] / compression["rawBytes"], 4
+    )
+    assert compression["minRatio"] <= compression["ratio"] <= compression["maxRatio"] < 1
+
+
+def test_unknown_compression_is_rejected(cli_settings):
+    with pytest.raises(ValueError, match="compression"):
+        CliSettings.from_options(
+            org=cli_settings.org_id,
+            api_url=cli_settings.api_url,
+            api_token=None,
+            batch_size=10,
+            source=None,
+            job_store=None,
+            dataset_format="json",
+            compression="br",
+        )
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from metadata_cli.db.migrations import MigrationJobStore
+from metadata_cli.main import app
+
+DAY = datetime(2024, 5, 1, 9, tzinfo=timezone.utc)
+
+
+def _add_job(
+    store: MigrationJobStore,
+    job_id: str,
+    *,
+    source: str,
+    started_at: datetime,
+    status: str = "succeeded",
+    items: int = 0,
+    seconds: float = 1.0,
+) -> None:
+    store.start_job(job_id=job_id, source=source)
+    store._conn.execute(
+        "UPDATE migration_jobs SET started_at = ? WHERE job_id = ?",
+        (started_at.isoformat(), job_id),
+    )
+    metrics = {"nodesAccepted": items, "edgesAccepted": 0, "batches": 1, "durationSeconds": seconds}
+    store.complete_job(job_id, status=status, metrics=metrics)
+
+
+def _history(path: Path) -> None:
+    store = MigrationJobStore(path)
+    for index, rate in enumerate((300, 100, 400, 200)):
+        _add_job(store, f"d1-{index}", source="cli", started_at=DAY, items=rate * 2, seconds=2.0)
+    _add_job(store, "d1-failed", source="cli", started_at=DAY, status="failed", items=50)
+    next_day = DAY + timedelta(days=1)
+    _add_job(store, "d2-0", source="cli", started_at=next_day, items=750, seconds=1.5)
+    _add_job(store, "nightly", source="nightly", started_at=DAY, items=10, seconds=1.0)
+    # Sub-jobs are already counted by their aggregate job.
+    _add_job(store, "shard", source="cli", started_at=DAY, items=10_000, seconds=1.0)
+    store.record_subjob("d1-0", "shard", position=0)
+    store.close()
+
+
+def test_jobs_stats_aggregates_per_source_and_window(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite"
+    _history(path)
+
+    result = CliRunner().invoke(app, ["jobs", "stats", "--job-store", str(path), "--json"])
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.output)
+    assert payload["window"] == "day"
+    first, second, nightly = payload["groups"]
+    assert (first["source"], first["window"]) == ("cli", "2024-05-01")
+    assert (first["jobs"], first["succeeded"], first["failed"]) == (5, 4, 1)
+    assert first["items"] == 2_050
+    assert first["itemsPerSecond"] == 250.0
+    assert first["throughputChange"] is None
+    assert first["itemsPerSecondPercentiles"] == {"p50": 200.0, "p95": 400.0, "p99": 400.0}
+    assert second["window"] == "2024-05-02"
+    assert second["itemsPerSecond"] == 500.0
+    assert second["throughputChange"] == 1.0
+    assert nightly["source"] == "nightly"
+
+
+def test_jobs_stats_filters_by_source(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite"
+    _history(path)
+
+    result = CliRunner().invoke(
+        app,
+        ["jobs", "stats", "--job-store", str(path), "--source", "nightly", "--window", "month",
+         "--json"],
+    )
+
+    assert result.exit_code == 0, result.output
+    (group,) = json.loads(result.output)["groups"]
+    assert (group["source"], group["window"], group["jobs"]) == ("nightly", "2024-05", 1)
+
+
+def test_jobs_list_paginates_and_show_prints_metrics(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.sqlite"
+    _history(path)
+    runner = CliRunner()
+
+    listed = runner.invoke(
+        app,
+        ["jobs", "list", "--job-store", str(path), "--source", "cli", "--limit", "2", "--json"],
+    )
+    assert listed.exit_code == 0, listed.output
+    payload = json.loads(listed.output)
+    assert payload["total"] == 7
+    assert [job["jobId"] for job in payload["jobs"]] == ["d2-0", "shard"]
+
+    table = runner.invoke(app, ["jobs", "list", "--job-store", str(path)])
+    assert table.exit_code == 0, table.output
+    assert "Showing 1-8 of 8 jobs" in table.output
+
+    shown = runner.invoke(app, ["jobs", "show", "d1-0", "--job-store", str(path), "--json"])
+    assert shown.exit_code == 0, shown.output
+    job = json.loads(shown.output)
+    assert job["metrics"]["nodesAccepted"] == 600
+    assert [subjob["jobId"] for subjob in job["subJobs"]] == ["shard"]
+
+    missing = runner.invoke(app, ["jobs", "show", "nope", "--job-store", str(path)])
+    assert missing.exit_code == 1
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import atexit
+import json
+import time
 from io import StringIO
+from pathlib import Path
 
 from rich.console import Console
 
-from metadata_cli.utils.logging import ProgressLogger
+from metadata_cli.utils.logging import BufferedJsonWriter, JsonLogger, ProgressLogger
 
 
 def test_log_batch_respects_budgets():
@@ -42,3 +46,90 @@ def test_log_batch_warns_on_budget_breach():
 
     output = buffer.getvalue()
     assert "batch.performance_budget_exceeded" in output
+
+
+def _batch(logger: ProgressLogger, *, status: int = 202, duration_seconds: float = 0.1) -> None:
+    logger.log_batch(
+        endpoint="nodes",
+        batch_size=10,
+        status=status,
+        duration_seconds=duration_seconds,
+        rss_mb=100,
+        latency_budget_seconds=5,
+        rss_budget_mb=256,
+    )
+
+
+def test_log_batch_sampling_keeps_failures_and_budget_breaches():
+    buffer = StringIO()
+    logger = ProgressLogger(
+        console=Console(file=buffer, force_terminal=False, color_system=None, width=200),
+        sample_rate=0.25,
+    )
+
+    for _ in range(8):
+        _batch(logger)
+    _batch(logger, status=503)
+    _batch(logger, duration_seconds=6)
+
+    output = buffer.getvalue()
+    assert output.count("batch.sent") == 3
+    assert "status=503" in output
+    assert "batch.performance_budget_exceeded" in output
+
+
+def test_json_logger_writes_ndjson_events():
+    buffer = StringIO()
+    logger = JsonLogger(buffer, sample_rate=0.5)
+
+    for _ in range(4):
+        _batch(logger)
+    logger.throughput(100, 2.0)
+    logger.info("ingest.complete", job_id="job-1", nodes=2)
+    with logger.time_block("load.create_indexes"):
+        pass
+    logger.close()
+
+    events = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert [event["event"] for event in events] == [
+        "batch.sent",
+        "batch.sent",
+        "throughput",
+        "ingest.complete",
+        "load.create_indexes",
+    ]
+    assert events[0]["level"] == "info"
+    assert events[0]["duration_seconds"] == 0.1
+    assert events[0]["sample_rate"] == 0.5
+    assert events[2]["items_per_second"] == 50.0
+    assert events[3]["job_id"] == "job-1"
+    assert isinstance(events[4]["duration_seconds"], float)
+
+
+def test_json_logger_releases_its_exit_hook_and_builds_no_console(monkeypatch):
+    hooks: list = []
+    monkeypatch.setattr(atexit, "register", hooks.append)
+    monkeypatch.setattr(atexit, "unregister", hooks.remove)
+
+    loggers = [JsonLogger(StringIO()) for _ in range(3)]
+    for logger in loggers:
+        logger.info("ingest.start")
+    assert len(hooks) == 3
+    for logger in loggers:
+        logger.close()
+
+    assert hooks == []
+    assert all(logger._console is None for logger in loggers)
+
+
+def test_buffered_writer_flushes_in_background():
+    buffer = StringIO()
+    writer = BufferedJsonWriter(buffer, flush_interval=0.01)
+
+    writer.write({"event": "a", "path": Path("x")})
+    deadline = time.monotonic() + 2
+    while not buffer.getvalue() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert json.loads(buffer.getvalue()) == {"event": "a", "path": "x"}
+    writer.close()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import urllib.request
+from dataclasses import replace
+
+import httpx
+
+from metadata_cli.services.ingest import IngestionRunner
+from metadata_cli.utils.metrics import IngestMetrics, MetricsServer
+
+
+def test_render_uses_cumulative_ms_buckets():
+    metrics = IngestMetrics("demo-org")
+    for duration_ms in (10, 30, 30, 700):
+        metrics.observe_batch("nodes", duration_ms=duration_ms, items=2, status=202, rss_mb=42.5)
+    metrics.observe_batch("edges", duration_ms=80, items=1, status=503, rss_mb=43.0)
+    metrics.count_retry("edges")
+
+    text = metrics.render()
+
+    labels = 'endpoint="nodes",org="demo-org"'
+    assert f'metadata_cli_batch_duration_ms_bucket{{{labels},le="25"}} 1' in text
+    assert f'metadata_cli_batch_duration_ms_bucket{{{labels},le="50"}} 3' in text
+    assert f'metadata_cli_batch_duration_ms_bucket{{{labels},le="500"}} 3' in text
+    assert f'metadata_cli_batch_duration_ms_bucket{{{labels},le="+Inf"}} 4' in text
+    assert f"metadata_cli_batch_duration_ms_sum{{{labels}}} 770" in text
+    assert f"metadata_cli_items_total{{{labels}}} 8" in text
+    assert 'metadata_cli_failures_total{endpoint="edges",org="demo-org"} 1' in text
+    assert 'metadata_cli_retries_total{endpoint="edges",org="demo-org"} 1' in text
+    assert 'metadata_cli_rss_mb{org="demo-org"} 43.0' in text
+    assert "# TYPE metadata_cli_batch_duration_ms histogram" in text
+
+
+def test_server_exposes_metrics_endpoint():
+    metrics = IngestMetrics("demo-org")
+    metrics.observe_request_bytes("nodes", 2048)
+    server = MetricsServer(metrics, port=0, host="127.0.0.1").start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics") as response:
+            body = response.read().decode("utf-8")
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    finally:
+        server.close()
+
+    assert 'metadata_cli_request_bytes_bucket{endpoint="nodes",org="demo-org",le="16384"} 1' in body
+
+
+def test_runner_writes_textfile_at_job_end(sample_dataset, cli_settings, job_store, tmp_path):
+    textfile = tmp_path / "textfile" / "metadata_cli.prom"
+    client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(202, json={"accepted": 1}))
+    )
+    runner = IngestionRunner(
+        settings=replace(cli_settings, metrics_textfile=textfile),
+        job_store=job_store,
+        http_client=client,
+    )
+
+    runner.run(sample_dataset)
+
+    text = textfile.read_text(encoding="utf-8")
+    assert 'metadata_cli_items_total{endpoint="nodes",org="demo-org"} 2' in text
+    assert 'metadata_cli_batches_total{endpoint="edges",org="demo-org"} 1' in text
+    assert not list(textfile.parent.glob(".*.tmp"))
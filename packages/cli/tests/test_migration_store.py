@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from datetime import timezone
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from metadata_cli.db.migrations import MigrationJobStore
+from metadata_cli.db.migrations import SCHEMA_VERSION, MigrationJobStore
 
 
 def test_queue_and_start_job_update_status(tmp_path):
@@ -48,3 +50,108 @@ def test_complete_job_rejects_unknown_status(tmp_path):
         store.complete_job("job-3", status="unknown", metrics={})
 
     store.close()
+
+
+def test_acknowledged_offset_only_counts_contiguous_batches(tmp_path):
+    store = MigrationJobStore(tmp_path / "jobs.sqlite")
+    store.start_job(job_id="job-4", source="cli")
+
+    store.record_checkpoint("job-4", resource="nodes", batch_index=0, start_offset=0, item_count=2)
+    store.record_checkpoint("job-4", resource="nodes", batch_index=2, start_offset=4, item_count=2)
+    assert store.acknowledged_offset("job-4", "nodes") == 2
+    assert store.next_batch_index("job-4", "nodes") == 3
+
+    store.record_checkpoint("job-4", resource="nodes", batch_index=1, start_offset=2, item_count=2)
+    assert store.acknowledged_offset("job-4", "nodes") == 6
+    assert store.acknowledged_offset("job-4", "edges") == 0
+    assert store.next_batch_index("job-4", "edges") == 0
+
+    store.close()
+
+
+def test_legacy_store_is_migrated_in_place(tmp_path):
+    path = tmp_path / "jobs.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """
+        CREATE TABLE migration_jobs (
+            job_id TEXT PRIMARY KEY, source TEXT NOT NULL, status TEXT NOT NULL,
+            started_at TEXT NOT NULL, completed_at TEXT, metrics TEXT, image_digest TEXT,
+            logs_url TEXT
+        )
+        """
+    )
+    conn.execute(
+        "INSERT INTO migration_jobs (job_id, source, status, started_at, metrics)"
+        " VALUES ('old', 'cli', 'succeeded', '2024-01-01T00:00:00+00:00', '{}')"
+    )
+    conn.commit()
+    conn.close()
+
+    store = MigrationJobStore(path)
+
+    assert store.schema_version == SCHEMA_VERSION
+    assert [job.job_id for job in store.list_jobs()] == ["old"]
+    indexes = {
+        row[0] for row in store._conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    }
+    assert {"idx_migration_jobs_status_started", "idx_migration_jobs_source_started"} <= indexes
+    tables = {
+        row[0] for row in store._conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    }
+    assert {"ingest_datasets", "ingest_checkpoints", "job_profiles", "ingest_subjobs"} <= tables
+    assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    store.close()
+
+    reopened = MigrationJobStore(path)
+    assert reopened.schema_version == SCHEMA_VERSION
+    reopened.close()
+
+
+def test_list_jobs_filters_and_paginates(tmp_path):
+    store = MigrationJobStore(tmp_path / "jobs.sqlite")
+    base = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    for index in range(6):
+        job_id = f"job-{index}"
+        store.start_job(job_id=job_id, source="nightly" if index % 2 else "cli")
+        store._conn.execute(
+            "UPDATE migration_jobs SET started_at = ? WHERE job_id = ?",
+            ((base + timedelta(hours=index)).isoformat(), job_id),
+        )
+        store.complete_job(job_id, status="failed" if index == 5 else "succeeded", metrics={})
+
+    assert [job.job_id for job in store.list_jobs(limit=2)] == ["job-5", "job-4"]
+    assert [job.job_id for job in store.list_jobs(limit=2, offset=2)] == ["job-3", "job-2"]
+    assert [job.job_id for job in store.list_jobs(source="nightly")] == ["job-5", "job-3", "job-1"]
+    assert [job.job_id for job in store.list_jobs(status="failed")] == ["job-5"]
+    window = {"since": base + timedelta(hours=1), "until": base + timedelta(hours=3)}
+    assert [job.job_id for job in store.list_jobs(**window)] == ["job-2", "job-1"]
+    assert store.count_jobs(source="nightly", status="succeeded") == 2
+    with pytest.raises(ValueError):
+        store.list_jobs(status="bogus")
+    store.close()
+
+
+def test_concurrent_writers_share_one_store(tmp_path):
+    path = tmp_path / "jobs.sqlite"
+
+    def write_jobs(worker: int) -> None:
+        store = MigrationJobStore(path)
+        for index in range(25):
+            job_id = f"w{worker}-{index}"
+            store.start_job(job_id=job_id, source=f"worker-{worker}")
+            store.record_checkpoint(
+                job_id, resource="nodes", batch_index=0, start_offset=0, item_count=1
+            )
+            store.complete_job(job_id, status="succeeded", metrics={"nodesAccepted": 1})
+        store.close()
+
+    threads = [threading.Thread(target=write_jobs, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    store = MigrationJobStore(path)
+    assert store.count_jobs(status="succeeded") == 200
+    store.close()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from metadata_cli.config import parse_record_range
+from metadata_cli.services import ingest
+from metadata_cli.services.ingest import DatasetLoader
+from metadata_cli.services.ndjson_index import NdjsonIndex
+
+
+@pytest.fixture()
+def node_lines(tmp_path: Path) -> Path:
+    lines = [
+        json.dumps({"nodes": [{"id": f"node-{i}", "type": "workspace", "properties": {}}]})
+        for i in range(10)
+    ]
+    lines.insert(3, "   ")
+    lines.insert(7, "")
+    dataset_path = tmp_path / "nodes.ndjson"
+    dataset_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return dataset_path
+
+
+def test_index_skips_blank_lines_and_reads_records(node_lines: Path):
+    with NdjsonIndex(node_lines) as index:
+        assert len(index) == 10
+        assert index.offsets.itemsize == 8
+        assert json.loads(index.line(4))["nodes"][0]["id"] == "node-4"
+        assert [record for record, _ in index.iter_range(8)] == [8, 9]
+        assert index.sample(4) == [0, 2, 5, 7]
+
+
+def test_empty_file_builds_empty_index(tmp_path: Path):
+    empty = tmp_path / "empty.ndjson"
+    empty.write_bytes(b"")
+
+    with NdjsonIndex(empty) as index:
+        assert len(index) == 0
+
+
+def test_loader_honours_range_and_sample(node_lines: Path):
+    ranged = DatasetLoader("ndjson", record_range=(2, 5)).load(node_lines)
+    sampled = list(DatasetLoader("ndjson", sample=2).stream(node_lines, "nodes"))
+
+    assert [node.id for node in ranged.nodes] == ["node-2", "node-3", "node-4"]
+    assert [node.id for node in sampled] == ["node-0", "node-5"]
+
+
+def test_loader_builds_the_range_index_once(monkeypatch, node_lines: Path):
+    built: list[Path] = []
+
+    class CountingIndex(NdjsonIndex):
+        def _build(self) -> None:
+            built.append(self.path)
+            super()._build()
+
+    monkeypatch.setattr(ingest, "NdjsonIndex", CountingIndex)
+    loader = DatasetLoader("ndjson", record_range=(2, 5))
+    # Pre-flight, then nodes, then edges: three passes over one index.
+    for resource in ("nodes", "nodes", "edges"):
+        list(loader.stream(node_lines, resource))
+    loader.close()
+
+    assert built == [node_lines]
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"), [("10:20", (10, 20)), (":5", (0, 5)), ("7:", (7, None))]
+)
+def test_parse_record_range(raw, expected):
+    assert parse_record_range(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["5", "5:5", "a:b", "-1:3"])
+def test_parse_record_range_rejects_invalid(raw):
+    with pytest.raises(ValueError):
+        parse_record_range(raw)
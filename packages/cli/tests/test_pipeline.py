@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from dataclasses import replace
+from pathlib import Path
+
+import httpx
+
+from metadata_cli.models import EdgeModel
+from metadata_cli.services.ingest import IngestionRunner
+from metadata_cli.services.pipeline import NodeDependencies
+
+
+def _edge(source: str, target: str) -> EdgeModel:
+    return EdgeModel(
+        id=f"{source}->{target}", sourceId=source, targetId=target, type="link", properties={}
+    )
+
+
+def test_edge_batch_waits_for_every_endpoint_batch():
+    dependencies = NodeDependencies()
+    first = dependencies.add_batch(["a", "b"])
+    held = dependencies.hold([_edge("a", "c"), _edge("b", "elsewhere")], 0, 0)
+
+    dependencies.acknowledge(first)
+    assert dependencies.blocked(held)  # "c" may still be in a later node batch
+    second = dependencies.add_batch(["c", "a"])
+    assert held.unseen == {"c", "elsewhere"}
+    assert dependencies.blocked(held)
+    assert held.waits_on == {second}
+    dependencies.exhausted = True
+    assert dependencies.blocked(held)  # "elsewhere" exists server-side, "c" is in flight
+    dependencies.acknowledge(second)
+    assert not dependencies.blocked(held)
+    assert dependencies.settled
+
+
+def test_pipelined_ingest_overlaps_batches_without_dangling_edges(
+    cli_settings, job_store, tmp_path: Path
+):
+    count = 40
+    payload = {
+        "nodes": [{"id": f"node-{i}", "type": "workspace", "properties": {}} for i in range(count)],
+        "edges": [
+            {
+                "id": f"edge-{i}",
+                "sourceId": f"node-{i}",
+                "targetId": f"node-{i + 1}" if i + 1 < count else "node-from-last-run",
+                "type": "link",
+                "properties": {},
+            }
+            for i in range(count)
+        ],
+    }
+    dataset_path = tmp_path / "chain.json"
+    dataset_path.write_text(json.dumps(payload), encoding="utf-8")
+    stored: set[str] = {"node-from-last-run"}
+    order: list[str] = []
+    dangling: list[str] = []
+    in_flight = {"nodes": 0, "edges": 0}
+    peak = {"nodes": 0, "edges": 0}
+    delays = random.Random(7)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        resource = request.url.path.rsplit("/", 1)[-1]
+        items = json.loads(request.content)["items"]
+        order.append(resource)
+        if resource == "edges":
+            dangling.extend(
+                item["id"]
+                for item in items
+                if item["sourceId"] not in stored or item["targetId"] not in stored
+            )
+        in_flight[resource] += 1
+        peak[resource] = max(peak[resource], in_flight[resource])
+        await asyncio.sleep(delays.uniform(0.001, 0.01))
+        in_flight[resource] -= 1
+        if resource == "nodes":
+            stored.update(item["id"] for item in items)
+        return httpx.Response(202, json={"accepted": len(items)})
+
+    settings = replace(cli_settings, batch_size=4, concurrency=2, pipeline=True)
+    runner = IngestionRunner(
+        settings=settings,
+        job_store=job_store,
+        http_client=httpx.Client(transport=httpx.MockTransport(lambda _: httpx.Response(500))),
+        async_http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    job = runner.run(dataset_path)
+
+    assert job.status == "succeeded"
+    assert dangling == []
+    assert order.index("edges") < len(order) - order[::-1].index("nodes") - 1
+    assert peak == {"nodes": 2, "edges": 2}
+    assert (job.metrics["nodesAccepted"], job.metrics["edgesAccepted"]) == (count, count)
+    assert job.metrics["pipeline"]["overlappedEdgeBatches"] > 0
+    assert job.metrics["pipeline"]["heldEdgeBatchesPeak"] <= 8
+    for resource in ("nodes", "edges"):
+        assert job_store.acknowledged_offset(job.job_id, resource) == count
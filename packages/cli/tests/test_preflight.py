@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+from array import array
+from pathlib import Path
+
+import httpx
+import pytest
+
+from metadata_cli.config import CliSettings
+from metadata_cli.errors import DatasetValidationError
+from metadata_cli.models import EdgeModel, NodeModel
+from metadata_cli.services.ingest import DatasetLoader, IngestionRunner
+from metadata_cli.services.preflight import IdIndex, _sorted_array, run_preflight
+
+
+def _node(node_id: str) -> NodeModel:
+    return NodeModel(id=node_id, type="workspace", properties={})
+
+
+def _edge(edge_id: str, source: str, target: str) -> EdgeModel:
+    return EdgeModel(id=edge_id, sourceId=source, targetId=target, type="link", properties={})
+
+
+@pytest.fixture()
+def broken_ndjson(tmp_path: Path) -> Path:
+    records = [
+        {"nodes": [{"id": "node-1", "type": "workspace", "properties": {}}]},
+        {"nodes": [{"id": "node-2", "type": "workspace", "properties": {}}]},
+        {"nodes": [{"id": "node-1", "type": "workspace", "properties": {}}]},
+        {"edges": [{"id": "edge-1", "sourceId": "node-1", "targetId": "node-2", "type": "link", "properties": {}}]},
+        {"edges": [{"id": "edge-2", "sourceId": "node-1", "targetId": "ghost", "type": "link", "properties": {}}]},
+    ]
+    dataset_path = tmp_path / "broken.ndjson"
+    dataset_path.write_text("\n".join(json.dumps(record) for record in records), encoding="utf-8")
+    return dataset_path
+
+
+def test_id_index_is_compact_and_reports_duplicates():
+    index = IdIndex()
+    for value in ["a", "b", "a", "c", "a"]:
+        index.add(value)
+
+    duplicates = index.freeze()
+
+    assert list(duplicates.values()) == [3]
+    assert "b" in index and "z" not in index
+    assert index.nbytes == 5 * 8
+
+
+def test_sorted_array_merges_chunked_runs():
+    values = array("Q", [9, 3, 7, 1, 8, 2, 6, 4, 5, 0])
+
+    assert list(_sorted_array(values, chunk=3)) == list(range(10))
+
+
+def test_run_preflight_reports_counts_and_samples():
+    nodes = [_node("node-1"), _node("node-2"), _node("node-2")]
+    edges = [_edge("edge-1", "node-1", "node-2"), _edge("edge-1", "node-9", "node-8")]
+
+    report = run_preflight(lambda: nodes, lambda: edges)
+
+    assert not report.ok
+    assert report.duplicate_nodes == 1
+    assert report.duplicate_node_samples == ["node-2"]
+    assert report.duplicate_edges == 1
+    assert report.dangling_edges == 1
+    assert report.dangling_edge_samples == [{"id": "edge-1", "missing": ["node-9", "node-8"]}]
+
+
+def test_run_preflight_streams_ndjson_in_passes(broken_ndjson: Path):
+    loader = DatasetLoader("ndjson")
+
+    report = run_preflight(
+        lambda: loader.stream(broken_ndjson, "nodes"),
+        lambda: loader.stream(broken_ndjson, "edges"),
+    )
+
+    assert report.to_dict()["samples"] == {
+        "duplicateNodeIds": ["node-1"],
+        "duplicateEdgeIds": [],
+        "danglingEdges": [{"id": "edge-2", "missing": ["ghost"]}],
+    }
+
+
+def _preflight_settings(cli_settings: CliSettings, mode: str) -> CliSettings:
+    return CliSettings.from_options(
+        org=cli_settings.org_id,
+        api_url=cli_settings.api_url,
+        api_token=None,
+        batch_size=cli_settings.batch_size,
+        source=cli_settings.source,
+        job_store=None,
+        dataset_format="ndjson",
+        stream=True,
+        preflight=mode,
+    )
+
+
+def test_strict_preflight_aborts_before_job_start(broken_ndjson, cli_settings, job_store):
+    runner = IngestionRunner(
+        settings=_preflight_settings(cli_settings, "strict"),
+        job_store=job_store,
+        http_client=httpx.Client(transport=httpx.MockTransport(lambda _: httpx.Response(500))),
+    )
+
+    with pytest.raises(DatasetValidationError, match="1 dangling edges"):
+        runner.run(broken_ndjson)
+
+    assert job_store.list_jobs() == []
+
+
+def test_warn_preflight_records_report_in_metrics(broken_ndjson, cli_settings, job_store):
+    runner = IngestionRunner(
+        settings=_preflight_settings(cli_settings, "warn"),
+        job_store=job_store,
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(lambda _: httpx.Response(202, json={"accepted": 1}))
+        ),
+    )
+
+    job = runner.run(broken_ndjson)
+
+    assert job.metrics["preflight"]["duplicateNodeIds"] == 1
+    assert job.metrics["preflight"]["danglingEdges"] == 1
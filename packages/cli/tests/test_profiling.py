@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import httpx
+
+from metadata_cli.services.ingest import IngestionRunner
+from metadata_cli.utils.logging import get_peak_rss_mb, get_rss_mb
+from metadata_cli.utils.profiling import DISABLED, StageProfiler
+
+
+def test_profiler_times_stages_wrappers_and_iterators():
+    profiler = StageProfiler()
+    profiler.start()
+
+    with profiler.stage("read"):
+        pass
+    loads = profiler.wrap("parse", json.loads)
+    assert [loads(line) for line in profiler.iterate("read", ["1", "2", "3"])] == [1, 2, 3]
+
+    report = profiler.report()
+    assert list(report["stages"]) == ["read", "parse"]
+    assert report["stages"]["read"]["calls"] == 4
+    assert report["stages"]["parse"]["calls"] == 3
+    assert report["stages"]["parse"]["maxRssMb"] > 0
+    assert report["tracemalloc"] is None
+
+
+def test_disabled_profiler_returns_originals():
+    items = ["a"]
+    assert DISABLED.wrap("parse", json.loads) is json.loads
+    assert DISABLED.iterate("read", items) is items
+    with DISABLED.stage("http"):
+        pass
+    assert DISABLED.stages == {}
+
+
+def test_current_rss_does_not_exceed_peak():
+    assert 0 < get_rss_mb() <= get_peak_rss_mb() + 1
+
+
+def test_profile_report_is_stored_with_job(cli_settings, job_store, tmp_path: Path):
+    lines = [
+        json.dumps({"nodes": [{"id": f"node-{i}", "type": "workspace", "properties": {}}]})
+        for i in range(3)
+    ]
+    dataset_path = tmp_path / "dataset.ndjson"
+    dataset_path.write_text("\n".join(lines), encoding="utf-8")
+    settings = replace(
+        cli_settings, dataset_format="ndjson", stream=True, profile=True, profile_tracemalloc=3
+    )
+    client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(202, json={"accepted": 1}))
+    )
+    runner = IngestionRunner(settings=settings, job_store=job_store, http_client=client)
+
+    job = runner.run(dataset_path)
+
+    report = job_store.get_profile(job.job_id)
+    assert list(report["stages"]) == ["read", "parse", "validate", "decorate", "serialize", "http"]
+    assert report["stages"]["validate"]["calls"] == 3
+    assert report["stages"]["http"]["calls"] == 2
+    assert report["tracemalloc"]["peakBytes"] > 0
+    assert set(report["tracemalloc"]["top"]) == {"loaded", "shipped"}
+    assert len(report["tracemalloc"]["top"]["shipped"]) <= 3
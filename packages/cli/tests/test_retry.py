@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+from metadata_cli.services.retry import RetryPolicy, is_retryable, parse_retry_after
+
+
+def test_backoff_is_jittered_below_capped_exponential_ceiling():
+    policy = RetryPolicy(max_retries=10, base_delay=0.5, max_delay=4.0, rng=random.Random(7))
+
+    for attempt, ceiling in enumerate([0.5, 1.0, 2.0, 4.0, 4.0, 4.0]):
+        delays = [policy.backoff(attempt) for _ in range(50)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+        assert max(delays) > ceiling / 2
+
+
+def test_retry_after_overrides_backoff_up_to_max_delay():
+    policy = RetryPolicy(base_delay=0.5, max_delay=10.0)
+
+    assert policy.backoff(0, "3") == 3.0
+    assert policy.backoff(0, "120") == 10.0
+    now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    assert parse_retry_after("Mon, 01 Jan 2024 12:00:05 GMT", now=now) == 5.0
+    assert parse_retry_after("not a date") is None
+
+
+@pytest.mark.parametrize(
+    ("status", "retryable"),
+    [(429, True), (500, True), (503, True), (501, False), (400, False), (422, False)],
+)
+def test_retryable_statuses(status, retryable):
+    assert is_retryable(status) is retryable
+
+
+def test_invalid_policy_is_rejected():
+    with pytest.raises(ValueError):
+        RetryPolicy(base_delay=5.0, max_delay=1.0)
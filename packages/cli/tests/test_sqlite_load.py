@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from metadata_cli.config import CliSettings
+from metadata_cli.db.migrations import MigrationJobStore
+from metadata_cli.errors import DatasetValidationError
+from metadata_cli.services.sqlite_load import SqliteBulkLoader
+
+API_MIGRATION = Path(__file__).resolve().parents[2] / "api" / "migrations" / "001_init.sql"
+
+
+def _loader(settings: CliSettings, db: Path, job_store: MigrationJobStore, **overrides):
+    return SqliteBulkLoader(replace(settings, sqlite_db=db, **overrides), job_store=job_store)
+
+
+def _schema(db: Path) -> dict[str, object]:
+    conn = sqlite3.connect(db)
+    try:
+        return {
+            table: (
+                conn.execute(f"PRAGMA table_info({table})").fetchall(),
+                conn.execute(f"PRAGMA foreign_key_list({table})").fetchall(),
+                sorted(
+                    (name, conn.execute(f"PRAGMA index_info({name})").fetchall())
+                    for _, name, *_ in conn.execute(f"PRAGMA index_list({table})")
+                ),
+            )
+            for table in ("graph_nodes", "graph_edges", "migration_jobs")
+        }
+    finally:
+        conn.close()
+
+
+def test_load_creates_api_schema_and_stamps_rows(
+    tmp_path: Path, sample_dataset: Path, cli_settings: CliSettings, job_store: MigrationJobStore
+) -> None:
+    db = tmp_path / "api.sqlite"
+    reference = tmp_path / "reference.sqlite"
+    with sqlite3.connect(reference) as conn:
+        conn.executescript(API_MIGRATION.read_text(encoding="utf-8"))
+
+    job = _loader(cli_settings, db, job_store).run(sample_dataset)
+
+    assert job.status == "succeeded"
+    assert job.metrics["nodesAccepted"] == 2
+    assert job.metrics["edgesAccepted"] == 1
+    assert job.metrics["deferredIndexes"] is True
+    assert _schema(db) == _schema(reference)
+
+    conn = sqlite3.connect(db)
+    nodes = conn.execute(
+        "SELECT id, org_id, properties, created_by, updated_by, job_id FROM graph_nodes ORDER BY id"
+    ).fetchall()
+    assert nodes[0] == (
+        "node-1", "demo-org", '{"name":"alpha"}', "unit-tests", "unit-tests", job.job_id
+    )
+    assert conn.execute("SELECT job_id FROM graph_edges").fetchall() == [(job.job_id,)]
+    status, metrics = conn.execute(
+        "SELECT status, metrics FROM migration_jobs WHERE job_id = ?", (job.job_id,)
+    ).fetchone()
+    assert status == "succeeded"
+    assert json.loads(metrics)["nodesAccepted"] == 2
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    conn.close()
+
+
+def test_load_upserts_into_existing_database_and_skips_dangling_edges(
+    tmp_path: Path, cli_settings: CliSettings, job_store: MigrationJobStore
+) -> None:
+    db = tmp_path / "api.sqlite"
+    with sqlite3.connect(db) as conn:
+        conn.executescript(API_MIGRATION.read_text(encoding="utf-8"))
+        conn.execute(
+            "INSERT INTO graph_nodes (id, org_id, type, properties, created_by, updated_by)"
+            " VALUES ('node-1', 'demo-org', 'workspace', '{}', 'api', 'api')"
+        )
+        # Already stored; the dataset's e-2 points at a missing node, so the API keeps this row.
+        conn.execute(
+            "INSERT INTO graph_edges"
+            " (id, org_id, source_id, target_id, type, properties, created_by, updated_by)"
+            " VALUES ('e-2', 'demo-org', 'node-1', 'node-1', 'self', '{}', 'api', 'api')"
+        )
+    dataset = tmp_path / "dataset.ndjson"
+    records = [
+        {"nodes": [{"id": "node-1", "type": "project", "properties": {"name": "é"}}]},
+        {"nodes": [{"id": "node-2", "type": "workspace", "properties": {}}]},
+        {"edges": [{"id": "e-1", "sourceId": "node-1", "targetId": "node-2", "type": "link",
+                    "properties": {}}]},
+        {"edges": [{"id": "e-2", "sourceId": "node-1", "targetId": "missing", "type": "link",
+                    "properties": {}}]},
+    ]
+    dataset.write_text("\n".join(json.dumps(record) for record in records), encoding="utf-8")
+    settings = replace(cli_settings, dataset_format="ndjson")
+
+    job = _loader(settings, db, job_store, batch_size=1, transaction_size=2).run(dataset)
+
+    assert job.metrics["deferredIndexes"] is False
+    assert job.metrics["nodesAccepted"] == 2
+    assert job.metrics["edgesAccepted"] == 1
+    assert job.metrics["edgesRejected"] == 1
+    assert job.metrics["batches"] == 3
+    assert job.metrics["transactions"] == 2
+    conn = sqlite3.connect(db)
+    assert conn.execute(
+        "SELECT type, properties, created_by, updated_by FROM graph_nodes WHERE id = 'node-1'"
+    ).fetchone() == ("project", '{"name":"é"}', "api", "unit-tests")
+    edges = conn.execute("SELECT id, target_id, type, job_id FROM graph_edges ORDER BY id")
+    assert edges.fetchall() == [
+        ("e-1", "node-2", "link", job.job_id),
+        ("e-2", "node-1", "self", None),
+    ]
+    conn.close()
+
+
+def test_failed_load_marks_job_failed_and_keeps_indexes(
+    tmp_path: Path, cli_settings: CliSettings, job_store: MigrationJobStore
+) -> None:
+    db = tmp_path / "api.sqlite"
+    dataset = tmp_path / "dataset.ndjson"
+    dataset.write_text(
+        json.dumps({"nodes": [{"id": "node-1", "type": "workspace", "properties": {}}]})
+        + "\n"
+        + json.dumps({"nodes": [{"id": "node-2", "properties": {}}]}),
+        encoding="utf-8",
+    )
+    settings = replace(cli_settings, dataset_format="ndjson")
+
+    with pytest.raises(DatasetValidationError):
+        _loader(settings, db, job_store).run(dataset)
+
+    (job,) = job_store.list_jobs()
+    assert job.status == "failed"
+    conn = sqlite3.connect(db)
+    assert conn.execute("SELECT status FROM migration_jobs").fetchone() == ("failed",)
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert "idx_graph_edges_org_source" in indexes
+    conn.close()
+
+
+def test_unreadable_dataset_marks_job_failed(
+    tmp_path: Path, cli_settings: CliSettings, job_store: MigrationJobStore
+) -> None:
+    dataset = tmp_path / "export.ndjson"
+    dataset.mkdir()
+    settings = replace(cli_settings, dataset_format="ndjson")
+
+    with pytest.raises(IsADirectoryError):
+        _loader(settings, tmp_path / "api.sqlite", job_store).run(dataset)
+
+    (job,) = job_store.list_jobs()
+    assert job.status == "failed"
+
+
+def test_sqlite_target_does_not_need_api_url(tmp_path: Path) -> None:
+    settings = CliSettings.from_options(
+        org="demo-org",
+        api_url="",
+        api_token=None,
+        batch_size=10,
+        source=None,
+        job_store=None,
+        dataset_format="json",
+        sqlite_db=tmp_path / "api.sqlite",
+    )
+    assert settings.sqlite_db == tmp_path / "api.sqlite"
+    with pytest.raises(ValueError):
+        CliSettings.from_options(
+            org="demo-org",
+            api_url="",
+            api_token=None,
+            batch_size=10,
+            source=None,
+            job_store=None,
+            dataset_format="json",
+        )
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from metadata_cli import config
+from metadata_cli.benchmarks.stub_api import StubApi
+from metadata_cli.config import CliSettings, TransportSettings
+from metadata_cli.main import app
+from metadata_cli.services.ingest import IngestionRunner
+from metadata_cli.services.transport import build_client, build_limits
+
+OPTIONS = dict(org="demo-org", api_token=None, batch_size=10, source=None, job_store=None)
+
+
+def test_settings_check_transport_profiles(monkeypatch, tmp_path: Path):
+    settings = CliSettings.from_options(
+        api_url="http://api.local",
+        dataset_format="json",
+        transport=TransportSettings.from_options(
+            connect_timeout=2.5, pool_timeout=0.5, max_connections=4, max_keepalive=1
+        ),
+        **OPTIONS,
+    )
+    client = build_client(settings, settings.base_url)
+    assert (client.timeout.connect, client.timeout.read, client.timeout.pool) == (2.5, 60.0, 0.5)
+    client.close()
+
+    with pytest.raises(ValueError, match="go together"):
+        TransportSettings.from_options(transport="uds")
+    with pytest.raises(ValueError, match="single API"):
+        CliSettings.from_options(
+            api_url=["http://a.local", "http://b.local"],
+            dataset_format="json",
+            transport=TransportSettings.from_options(transport="UDS", uds=tmp_path / "api.sock"),
+            **OPTIONS,
+        )
+    monkeypatch.setattr(config, "find_spec", lambda name: None)
+    with pytest.raises(ValueError, match="h2 package"):
+        TransportSettings.from_options(transport="http2")
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_ingest_over_unix_socket(concurrency, cli_settings, job_store, sample_dataset, tmp_path):
+    socket_path = tmp_path / "api.sock"
+    settings = replace(
+        cli_settings,
+        api_url="http://localhost",
+        concurrency=concurrency,
+        transport=TransportSettings(protocol="uds", uds_path=socket_path),
+    )
+
+    with StubApi(uds=socket_path) as stub:
+        runner = IngestionRunner(settings=settings, job_store=job_store)
+        try:
+            job = runner.run(sample_dataset)
+        finally:
+            runner.http_client.close()
+
+    assert job.status == "succeeded"
+    assert stub.stats.items == {"nodes": 2, "edges": 1}
+    assert not socket_path.exists()
+
+
+def test_pool_limits_default_to_the_runner_and_yield_to_options(cli_settings):
+    assert build_limits(cli_settings.transport, 6) == httpx.Limits(
+        max_connections=6, max_keepalive_connections=6, keepalive_expiry=5.0
+    )
+    tuned = TransportSettings(max_connections=2, max_keepalive=0, keepalive_expiry=1.0)
+    assert build_limits(tuned, 6) == httpx.Limits(
+        max_connections=2, max_keepalive_connections=0, keepalive_expiry=1.0
+    )
+
+
+def test_ingest_command_gathers_transport_options(tmp_path: Path):
+    args = ["ingest", "--org", "demo-org", "--api-url", "http://api.local", "--transport", "uds"]
+    result = CliRunner().invoke(app, [*args, str(tmp_path / "nodes.json")])
+
+    assert result.exit_code == 2
+    assert "--transport uds and --uds PATH go together" in result.output
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import httpx
+import pytest
+
+from metadata_cli.errors import DatasetValidationError
+from metadata_cli.services.ingest import DatasetLoader, IngestionRunner
+from metadata_cli.services.validation import (
+    RecordValidator,
+    ValidationReport,
+    ndjson_chunks,
+    read_owned_lines,
+)
+
+
+def _node(index: int, **overrides) -> dict:
+    return {"id": f"node-{index}", "type": "workspace", "properties": {}, **overrides}
+
+
+@pytest.fixture()
+def broken_ndjson(tmp_path: Path) -> Path:
+    """Valid nodes with three bad lines: a missing field, a wrong type, and broken JSON."""
+    lines = [json.dumps({"nodes": [_node(index)]}) for index in range(12)]
+    lines[3] = json.dumps({"nodes": [_node(3), {"id": "node-bad", "type": "workspace"}]})
+    lines[6] = json.dumps({"nodes": [_node(6, properties=[1, 2])]})
+    lines[9] = '{"nodes": [{"id": "node-9",'
+    lines.insert(5, "")
+    path = tmp_path / "broken.ndjson"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _entries(path: Path) -> list[tuple[str, str, str]]:
+    """Report entries in file order (each pass reports in its own order)."""
+    lines = path.read_text(encoding="utf-8").splitlines()
+    entries = [
+        (entry["location"], entry["field"], entry["type"]) for entry in map(json.loads, lines)
+    ]
+    return sorted(entries, key=lambda entry: int(entry[0].split(",")[0].split()[1]))
+
+
+EXPECTED = [
+    ("line 4, nodes[1]", "properties", "missing"),
+    ("line 8, nodes[0]", "properties", "dict_type"),
+    ("line 11", "", "json_invalid"),
+]
+
+
+def test_stream_reports_every_invalid_record_and_stops_shipping(
+    broken_ndjson: Path, cli_settings, job_store, tmp_path: Path
+) -> None:
+    report_path = tmp_path / "errors.ndjson"
+    settings = replace(
+        cli_settings, dataset_format="ndjson", stream=True, error_report_path=report_path
+    )
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.extend(item["id"] for item in json.loads(request.content)["items"])
+        return httpx.Response(202, json={"accepted": 1})
+
+    runner = IngestionRunner(
+        settings=settings,
+        job_store=job_store,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    with pytest.raises(DatasetValidationError, match="3 invalid records") as raised:
+        runner.run(broken_ndjson)
+
+    assert "line 4, nodes[1] properties: Field required" in str(raised.value)
+    assert _entries(report_path) == EXPECTED
+    # Nothing after the first invalid record is sent.
+    assert sent == ["node-0", "node-1", "node-2", "node-3"]
+    (job,) = job_store.list_jobs()
+    assert job.status == "failed"
+    assert job.metrics["validation"]["invalidRecords"] == 3
+
+
+def test_skip_invalid_ships_valid_records(
+    broken_ndjson: Path, cli_settings, job_store, tmp_path: Path
+) -> None:
+    settings = replace(
+        cli_settings,
+        dataset_format="ndjson",
+        skip_invalid=True,
+        error_report_path=tmp_path / "errors.ndjson",
+        batch_size=100,
+    )
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.extend(item["id"] for item in json.loads(request.content)["items"])
+        return httpx.Response(202, json={"accepted": 1})
+
+    runner = IngestionRunner(
+        settings=settings,
+        job_store=job_store,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    job = runner.run(broken_ndjson)
+
+    assert job.status == "succeeded"
+    assert sent == [f"node-{index}" for index in range(12) if index not in (6, 9)]
+    validation = job.metrics["validation"]
+    assert (validation["invalidRecords"], validation["errors"]) == (3, 3)
+    assert validation["report"] == str(tmp_path / "errors.ndjson")
+    assert _entries(tmp_path / "errors.ndjson") == EXPECTED
+
+
+def test_max_errors_caps_the_report(broken_ndjson: Path, tmp_path: Path) -> None:
+    report = ValidationReport(tmp_path / "errors.ndjson", max_errors=2)
+    loader = DatasetLoader("ndjson", validator=RecordValidator(report))
+
+    with pytest.raises(DatasetValidationError, match="2 invalid records"):
+        list(loader.stream(broken_ndjson, "nodes"))
+
+    # The file stops being read once it has failed and the report is full.
+    assert _entries(tmp_path / "errors.ndjson") == EXPECTED[:2]
+    assert report.to_dict()["truncated"] is False
+
+
+def test_parallel_validation_feeds_records_without_validating_twice(
+    broken_ndjson: Path, cli_settings, job_store, tmp_path: Path, monkeypatch
+) -> None:
+    chunks = ndjson_chunks(broken_ndjson, chunk_bytes=100)
+    assert len(chunks) > 2
+    # Ranges cut lines anywhere; each worker still gets whole lines, and every line once.
+    owned = b"".join(read_owned_lines(str(broken_ndjson), chunk) for chunk in chunks)
+    assert owned == broken_ndjson.read_bytes()
+
+    report = ValidationReport(tmp_path / "parallel.ndjson")
+    validator = RecordValidator(report, skip_invalid=True, ndjson_chunk_bytes=100)
+    monkeypatch.setattr(validator, "validate", lambda *args: pytest.fail("validated again"))
+    loader = DatasetLoader("ndjson", parse_workers=2, validator=validator)
+    dataset = loader.load(broken_ndjson)
+    assert [node.id for node in dataset.nodes] == [
+        f"node-{index}" for index in range(12) if index not in (6, 9)
+    ]
+    report.write()
+    assert _entries(tmp_path / "parallel.ndjson") == EXPECTED
+    assert report.invalid_records == 3
+
+    settings = replace(cli_settings, dataset_format="ndjson", stream=True, parse_workers=2)
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.extend(item["id"] for item in json.loads(request.content)["items"])
+        return httpx.Response(202, json={"accepted": 2})
+
+    runner = IngestionRunner(
+        settings=settings,
+        job_store=job_store,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    with pytest.raises(DatasetValidationError, match="3 invalid records"):
+        runner.run(broken_ndjson)
+    # Same as the serial stream: records stop at the first invalid one.
+    assert sent == ["node-0", "node-1", "node-2", "node-3"]
+    assert job_store.list_jobs()[0].status == "failed"
+    assert _entries(job_store.path.parent / "validation-errors.ndjson") == EXPECTED
+
+
+def test_csv_and_json_errors_point_at_rows_and_indexes(tmp_path: Path) -> None:
+    csv_path = tmp_path / "dataset.csv"
+    csv_path.write_text(
+        "id,type,properties,sourceId,targetId\n"
+        "node-1,workspace,{},,\n"
+        'node-2,workspace,"[1, 2]",,\n'
+        "edge-1,link,{},node-1,node-2\n",
+        encoding="utf-8",
+    )
+    json_path = tmp_path / "dataset.json"
+    json_path.write_text(
+        json.dumps({"nodes": [_node(1), {"id": 2, "properties": {}}], "edges": "oops"}),
+        encoding="utf-8",
+    )
+    report = ValidationReport()
+    validator = RecordValidator(report, skip_invalid=True)
+
+    from_csv = DatasetLoader("csv", validator=validator).load(csv_path)
+    from_json = DatasetLoader("json", validator=validator).load(json_path)
+
+    assert [node.id for node in from_csv.nodes] == ["node-1"]
+    assert [edge.id for edge in from_csv.edges] == ["edge-1"]
+    assert [node.id for node in from_json.nodes] == ["node-1"]
+    assert [(entry["location"], entry["field"]) for entry in report.entries] == [
+        ("row 3", "properties"),
+        ("nodes[1]", "id"),
+        ("nodes[1]", "type"),
+        ("edges", "edges"),
+    ]
+    assert report.files == {str(csv_path): 1, str(json_path): 2}